@@ -8,14 +8,19 @@ workflows (readiness checks, safe tasks.json updates, and git hygiene).
 from __future__ import annotations
 
 import argparse
+import atexit
 import hashlib
 import importlib.util
 import json
 import os
 import re
+import signal
 import subprocess
 import sys
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 UTC = timezone.utc
@@ -91,6 +96,41 @@ class BackendSyncTasks(Protocol):
     ) -> None: ...
 
 
+class TaskIndexQueries(Protocol):
+    def revision(self) -> str: ...
+
+    def list_tasks(self) -> TaskList: ...
+
+    def warnings(self) -> list[str]: ...
+
+    def query_tasks(
+        self,
+        *,
+        ids: Iterable[str] | None = None,
+        statuses: Iterable[str] | None = None,
+        owners: Iterable[str] | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> TaskList: ...
+
+    def search_tasks(
+        self,
+        query: str,
+        *,
+        statuses: Iterable[str] | None = None,
+        owners: Iterable[str] | None = None,
+        tags: Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> TaskList: ...
+
+    def dependency_state(self, task_ids: Iterable[str]) -> DependencyState: ...
+
+    def dependency_graph(self) -> tuple[dict[str, list[str]], set[str]]: ...
+
+
+class BackendTaskIndex(Protocol):
+    def task_index(self) -> TaskIndexQueries | None: ...
+
+
 # Duck-typing helpers to gate backend features without hard dependencies.
 def supports_task_list_write(backend: object) -> TypeGuard[BackendTaskListWrite]:
     return callable(getattr(backend, "list_tasks", None)) and callable(getattr(backend, "write_task", None))
@@ -136,6 +176,10 @@ def supports_sync_tasks(backend: object) -> TypeGuard[BackendSyncTasks]:
     return callable(getattr(backend, "sync", None))
 
 
+def supports_task_index(backend: object) -> TypeGuard[BackendTaskIndex]:
+    return callable(getattr(backend, "task_index", None))
+
+
 SCRIPT_DIR = Path(__file__).resolve().parent
 ROOT = SCRIPT_DIR.parent
 SWARM_DIR = ROOT / ".codex-swarm"
@@ -151,7 +195,10 @@ ALLOWED_STATUSES: set[str] = {"TODO", "DOING", "BLOCKED", "DONE"}
 TASKS_SCHEMA_VERSION = 1
 TASKS_META_KEY = "meta"
 TASKS_META_MANAGED_BY = "agentctl"
+LINT_CACHE_VERSION = 2
 DEFAULT_VERIFY_REQUIRED_TAGS: set[str] = {"code", "backend", "frontend"}
+DEFAULT_VERIFY_JOBS = 1
+VERIFY_TIMEOUT_EXIT_CODE = 124
 DEFAULT_TASK_DOC_SECTIONS: tuple[str, ...] = (
     "Summary",
     "Context",
@@ -239,14 +286,207 @@ def run(
     check: bool = True,
     env: dict[str, str] | None = None,
 ) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        cmd,
-        cwd=str(cwd),
-        text=True,
-        capture_output=True,
-        check=check,
-        env=env,
-    )
+    started = time.perf_counter()
+    try:
+        return subprocess.run(
+            cmd,
+            cwd=str(cwd),
+            text=True,
+            capture_output=True,
+            check=check,
+            env=env,
+        )
+    finally:
+        GIT.record(cmd, time.perf_counter() - started)
+
+
+def _git_subcommand(cmd: list[str]) -> list[str]:
+    """Arguments after `git` and its global options (-C/-c and friends)."""
+    args = cmd[1:]
+    idx = 0
+    while idx < len(args) and args[idx].startswith("-"):
+        idx += 2 if args[idx] in ("-C", "-c") else 1
+    return args[idx:]
+
+
+def _git_is_read_only(cmd: list[str]) -> bool:
+    if not cmd or Path(cmd[0]).name != "git":
+        return False
+    sub = _git_subcommand(cmd)
+    if not sub:
+        return True
+    name, rest = sub[0], sub[1:]
+    if name == "config":
+        return any(flag in rest for flag in ("--get", "--get-all", "--list", "-l"))
+    if name == "worktree":
+        return rest[:1] == ["list"]
+    return name in GIT_READ_ONLY_COMMANDS
+
+
+# Subcommands that never move refs, the index, config or worktrees.
+GIT_READ_ONLY_COMMANDS = frozenset(
+    {
+        "cat-file",
+        "check-ignore",
+        "diff",
+        "for-each-ref",
+        "log",
+        "ls-files",
+        "merge-base",
+        "rev-list",
+        "rev-parse",
+        "show",
+        "show-ref",
+        "status",
+    }
+)
+_PSEUDO_REF_RE = re.compile(r"[A-Z_]+")
+_HEX_REV_RE = re.compile(r"[0-9a-f]{4,40}")
+_PLAIN_REV_RE = re.compile(r"[\w./-]+")
+
+
+class GitCache:
+    """Per-invocation memo of read-only git queries, plus timings for every git process.
+
+    Answers are keyed by (cwd, argv) and dropped as soon as agentctl runs anything that may
+    move refs, the index, config or worktrees. Refs and config are each loaded with one
+    process (`for-each-ref`, `config --list`) and file reads share one `cat-file --batch`.
+    Working-tree queries (`git status`, `git diff` without a range) are timed but never
+    memoized because agentctl edits files between them.
+    """
+
+    def __init__(self) -> None:
+        self.results: dict[tuple[str, tuple[str, ...]], subprocess.CompletedProcess[str]] = {}
+        self.blobs: dict[tuple[str, str], str | None] = {}
+        self.readers: dict[str, subprocess.Popen[bytes]] = {}
+        # label -> [processes spawned, answers reused, seconds]
+        self.timings: dict[str, list[float]] = {}
+
+    def _stat(self, label: str) -> list[float]:
+        return self.timings.setdefault(label, [0, 0, 0.0])
+
+    def record(self, cmd: list[str], seconds: float) -> None:
+        if cmd and Path(cmd[0]).name == "git":
+            stat = self._stat((_git_subcommand(cmd) or ["git"])[0])
+            stat[0] += 1
+            stat[2] += seconds
+        if not _git_is_read_only(cmd):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        self.results.clear()
+        self.blobs.clear()
+        self.close()
+
+    def close(self) -> None:
+        for reader in self.readers.values():
+            if reader.stdin:
+                reader.stdin.close()
+            reader.wait()
+            if reader.stdout:
+                reader.stdout.close()
+        self.readers.clear()
+
+    def query(self, cmd: list[str], *, cwd: Path) -> subprocess.CompletedProcess[str]:
+        key = (str(cwd), tuple(cmd))
+        cached = self.results.get(key)
+        if cached is not None:
+            self._stat((_git_subcommand(cmd) or ["git"])[0])[1] += 1
+            return cached
+        result = run(cmd, cwd=cwd, check=False)
+        self.results[key] = result
+        return result
+
+    def refs(self, *, cwd: Path) -> dict[str, str]:
+        """All refs (refname -> object id) from a single for-each-ref."""
+        result = self.query(["git", "for-each-ref", "--format=%(objectname) %(refname)"], cwd=cwd)
+        if result.returncode != 0:
+            die(result.stderr.strip() or "Failed to list git refs")
+        refs: dict[str, str] = {}
+        for line in (result.stdout or "").splitlines():
+            object_id, _, refname = line.partition(" ")
+            if refname:
+                refs[refname] = object_id
+        return refs
+
+    def resolve(self, rev: str, *, cwd: Path) -> str | None:
+        """Object id for a plain ref name, using git's lookup order; None when rev-parse is needed."""
+        if not _PLAIN_REV_RE.fullmatch(rev) or _PSEUDO_REF_RE.fullmatch(rev) or _HEX_REV_RE.fullmatch(rev):
+            return None
+        refs = self.refs(cwd=cwd)
+        for candidate in (
+            rev,
+            f"refs/{rev}",
+            f"refs/tags/{rev}",
+            f"refs/heads/{rev}",
+            f"refs/remotes/{rev}",
+            f"refs/remotes/{rev}/HEAD",
+        ):
+            if candidate in refs:
+                return refs[candidate]
+        return None
+
+    def config(self, *, cwd: Path) -> dict[str, str]:
+        result = self.query(["git", "config", "--list", "-z"], cwd=cwd)
+        values: dict[str, str] = {}
+        if result.returncode != 0:
+            return values
+        for entry in (result.stdout or "").split("\0"):
+            key, _, value = entry.partition("\n")
+            if key:
+                values[key] = value
+        return values
+
+    def read_blob(self, spec: str, *, cwd: Path) -> str | None:
+        """Contents of `<rev>:<path>` through a shared `git cat-file --batch` process."""
+        key = (str(cwd), spec)
+        if key in self.blobs:
+            self._stat("cat-file")[1] += 1
+            return self.blobs[key]
+        started = time.perf_counter()
+        reader = self.readers.get(str(cwd))
+        stat = self._stat("cat-file")
+        if reader is None:
+            reader = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=str(cwd),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self.readers[str(cwd)] = reader
+            stat[0] += 1
+        else:
+            stat[1] += 1
+        assert reader.stdin is not None and reader.stdout is not None
+        reader.stdin.write(spec.encode("utf-8") + b"\n")
+        reader.stdin.flush()
+        header = reader.stdout.readline().decode("utf-8", errors="replace").rstrip("\n")
+        text: str | None = None
+        parts = header.split(" ")
+        if len(parts) == 3 and parts[2].isdigit():
+            data = reader.stdout.read(int(parts[2]))
+            reader.stdout.read(1)
+            if parts[1] == "blob":
+                text = data.decode("utf-8", errors="replace")
+        elif not header:
+            self.readers.pop(str(cwd), None)
+        stat[2] += time.perf_counter() - started
+        self.blobs[key] = text
+        return text
+
+    def report(self) -> list[str]:
+        spawned = sum(int(stat[0]) for stat in self.timings.values())
+        reused = sum(int(stat[1]) for stat in self.timings.values())
+        seconds = sum(stat[2] for stat in self.timings.values())
+        lines = [f"git: {spawned} processes, {reused} reused answers, {seconds:.3f}s"]
+        for label, (count, hits, elapsed) in sorted(self.timings.items(), key=lambda item: -item[1][2]):
+            lines.append(f"  {label:<14} {int(count):>4} spawned {int(hits):>5} reused {elapsed:8.3f}s")
+        return lines
+
+
+GIT = GitCache()
+atexit.register(GIT.close)
 
 
 def merge_env(overrides: dict[str, str] | None) -> dict[str, str] | None:
@@ -281,10 +521,9 @@ def die(message: str, code: int = 1) -> NoReturn:
 
 
 def git_toplevel(*, cwd: Path = ROOT) -> Path:
-    try:
-        result = run(["git", "rev-parse", "--show-toplevel"], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to resolve git toplevel")
+    result = GIT.query(["git", "rev-parse", "--show-toplevel"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or "Failed to resolve git toplevel")
     raw = (result.stdout or "").strip()
     if not raw:
         die("Failed to resolve git toplevel")
@@ -292,10 +531,9 @@ def git_toplevel(*, cwd: Path = ROOT) -> Path:
 
 
 def git_current_branch(*, cwd: Path = ROOT) -> str:
-    try:
-        result = run(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to resolve git branch")
+    result = GIT.query(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or "Failed to resolve git branch")
     return (result.stdout or "").strip()
 
 
@@ -303,13 +541,11 @@ def git_config_get(key: str, *, cwd: Path = ROOT) -> str:
     raw = str(key or "").strip()
     if not raw:
         return ""
-    try:
-        proc = run(["git", "config", "--get", raw], cwd=cwd, check=False)
-    except subprocess.CalledProcessError:
-        return ""
-    if proc.returncode != 0:
-        return ""
-    return (proc.stdout or "").strip()
+    # `git config --list` lowercases section and variable names but keeps subsections.
+    section, _, rest = raw.partition(".")
+    subsection, _, name = rest.rpartition(".")
+    lookup = ".".join(part for part in (section.lower(), subsection, name.lower()) if part)
+    return GIT.config(cwd=cwd).get(lookup, "").strip()
 
 
 def git_config_set(key: str, value: str, *, cwd: Path = ROOT) -> None:
@@ -326,10 +562,9 @@ def git_config_set(key: str, value: str, *, cwd: Path = ROOT) -> None:
 
 
 def git_common_dir(*, cwd: Path = ROOT) -> Path:
-    try:
-        result = run(["git", "rev-parse", "--git-common-dir"], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to resolve git common dir")
+    result = GIT.query(["git", "rev-parse", "--git-common-dir"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or "Failed to resolve git common dir")
     raw = (result.stdout or "").strip()
     if not raw:
         die("Failed to resolve git common dir")
@@ -756,8 +991,14 @@ def hook_is_managed(path: Path) -> bool:
 
 
 def load_task_index() -> tuple[TaskList, TaskIndex, list[str], str]:
-    tasks, _ = load_task_store()
-    key = tasks_cache_key(tasks)
+    index = task_index_queries()
+    if index is not None:
+        # task_index_queries() already refreshed the index; list_tasks() here would refresh it again.
+        tasks = ensure_task_list(index.list_tasks(), label="backend tasks")
+        key = index.revision()
+    else:
+        tasks, _ = load_task_store()
+        key = tasks_cache_key(tasks)
     global _TASK_INDEX_CACHE
     if _TASK_INDEX_CACHE and _TASK_INDEX_CACHE[0] == key:
         tasks_by_id, warnings = _TASK_INDEX_CACHE[1], _TASK_INDEX_CACHE[2]
@@ -937,6 +1178,7 @@ WORKFLOW_DIR = _resolve_repo_relative_path(_path_setting("workflow_dir"), label=
 WORKTREES_DIRNAME = _optional_path_setting("worktrees_dir", default=DEFAULT_WORKTREES_DIRNAME)
 WORKTREES_DIR = _resolve_repo_relative_path(WORKTREES_DIRNAME, label="paths.worktrees_dir")
 TASKS_PATH_REL = str(TASKS_PATH.relative_to(ROOT))
+LINT_CACHE_PATH = TASKS_PATH.with_name(".tasks-lint-cache.json")
 load_env_file(ROOT / ".env")
 BACKEND_CONFIG = load_backend_config()
 BACKEND_CLASS = load_backend_class(BACKEND_CONFIG) if BACKEND_CONFIG else None
@@ -1017,6 +1259,39 @@ def verify_required_tags() -> set[str]:
     return set(tags)
 
 
+def verify_jobs() -> int:
+    verify_cfg = _config_dict(tasks_config().get("verify"), label="tasks.verify")
+    raw = verify_cfg.get("jobs")
+    if raw is None:
+        return DEFAULT_VERIFY_JOBS
+    if not isinstance(raw, int) or isinstance(raw, bool) or raw < 1:
+        die(f"{SWARM_CONFIG_PATH} tasks.verify.jobs must be a positive integer (got: {raw!r})", code=2)
+    return raw
+
+
+def verify_timeout_seconds() -> float | None:
+    verify_cfg = _config_dict(tasks_config().get("verify"), label="tasks.verify")
+    raw = verify_cfg.get("timeout_seconds")
+    if raw is None:
+        return None
+    if not isinstance(raw, (int, float)) or isinstance(raw, bool) or raw <= 0:
+        die(f"{SWARM_CONFIG_PATH} tasks.verify.timeout_seconds must be a positive number (got: {raw!r})", code=2)
+    return float(raw)
+
+
+def resolve_verify_limits(args: argparse.Namespace) -> tuple[int, float | None]:
+    jobs = getattr(args, "jobs", None)
+    timeout = getattr(args, "timeout", None)
+    if jobs is not None and jobs < 1:
+        die("--jobs must be >= 1", code=2)
+    if timeout is not None and timeout <= 0:
+        die("--timeout must be > 0 seconds", code=2)
+    return (
+        jobs if jobs is not None else verify_jobs(),
+        timeout if timeout is not None else verify_timeout_seconds(),
+    )
+
+
 def task_doc_sections() -> tuple[str, ...]:
     doc_cfg = _config_dict(tasks_config().get("doc"), label="tasks.doc")
     raw = doc_cfg.get("sections")
@@ -1259,6 +1534,19 @@ def load_tasks() -> TaskList:
     return ensure_task_list(tasks, label="tasks.json tasks")
 
 
+def task_index_queries() -> TaskIndexQueries | None:
+    # The SQLite task index is optional; None means callers filter the full task list.
+    backend = backend_instance()
+    if backend is None or not supports_task_index(backend):
+        return None
+    return backend.task_index()
+
+
+def task_index_warnings(index: TaskIndexQueries) -> list[str]:
+    # Same warnings as the full-list path: missing ids, depends_on problems, then cycles.
+    return index.warnings() + cycle_warnings(index.dependency_graph()[0])
+
+
 def load_task_store() -> tuple[TaskList, Callable[[TaskList], None]]:
     # Backends are optional; fall back to local tasks.json when absent.
     backend = backend_instance()
@@ -1366,28 +1654,45 @@ def format_task_line(task: TaskRecord, dep_state: DependencyState | None = None)
     return line
 
 
-def cmd_task_list(args: argparse.Namespace) -> None:
-    tasks, tasks_by_id, warnings, key = load_task_index()
+def load_filtered_tasks(
+    *,
+    statuses: list[str] | None,
+    owners: list[str] | None,
+    tags: list[str] | None,
+    quiet: bool,
+) -> tuple[TaskList, DependencyState]:
+    # Tasks sorted by id that match any of each given filter, plus dependency state for them.
+    index = task_index_queries()
+    if index is not None:
+        if not quiet:
+            for warning in task_index_warnings(index):
+                print(f"⚠️ {warning}")
+        tasks = index.query_tasks(statuses=statuses, owners=owners, tags=tags)
+        return tasks, index.dependency_state(str(task.get("id") or "") for task in tasks)
+
+    _, tasks_by_id, warnings, key = load_task_index()
     dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
     warnings = warnings + dep_warnings
-    if warnings and not args.quiet:
+    if warnings and not quiet:
         for warning in warnings:
             print(f"⚠️ {warning}")
     tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
-    if args.status:
-        want = {s.strip().upper() for s in args.status}
+    if statuses:
+        want = {s.strip().upper() for s in statuses}
         tasks_sorted = [t for t in tasks_sorted if str(t.get("status") or "TODO").strip().upper() in want]
-    if args.owner:
-        want_owner = {o.strip().upper() for o in args.owner}
+    if owners:
+        want_owner = {o.strip().upper() for o in owners}
         tasks_sorted = [t for t in tasks_sorted if str(t.get("owner") or "").strip().upper() in want_owner]
-    if args.tag:
-        want_tag = {t.strip() for t in args.tag}
-        filtered: TaskList = []
-        for task in tasks_sorted:
-            tags = coerce_str_list(task.get("tags"))
-            if any(tag in want_tag for tag in tags):
-                filtered.append(task)
-        tasks_sorted = filtered
+    if tags:
+        want_tag = {t.strip() for t in tags}
+        tasks_sorted = [t for t in tasks_sorted if any(tag in want_tag for tag in coerce_str_list(t.get("tags")))]
+    return tasks_sorted, dep_state
+
+
+def cmd_task_list(args: argparse.Namespace) -> None:
+    tasks_sorted, dep_state = load_filtered_tasks(
+        statuses=args.status, owners=args.owner, tags=args.tag, quiet=args.quiet
+    )
     for task in tasks_sorted:
         print(format_task_line(task, dep_state=dep_state))
     if not args.quiet:
@@ -1401,28 +1706,9 @@ def cmd_task_list(args: argparse.Namespace) -> None:
 
 
 def cmd_task_next(args: argparse.Namespace) -> None:
-    tasks, tasks_by_id, warnings, key = load_task_index()
-    dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
-    warnings = warnings + dep_warnings
-    if warnings and not args.quiet:
-        for warning in warnings:
-            print(f"⚠️ {warning}")
-
-    tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
-    statuses = {s.strip().upper() for s in (args.status or ["TODO"])}
-    tasks_sorted = [t for t in tasks_sorted if str(t.get("status") or "TODO").strip().upper() in statuses]
-
-    if args.owner:
-        want_owner = {o.strip().upper() for o in args.owner}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("owner") or "").strip().upper() in want_owner]
-    if args.tag:
-        want_tag = {t.strip() for t in args.tag}
-        filtered: TaskList = []
-        for task in tasks_sorted:
-            tags = coerce_str_list(task.get("tags"))
-            if any(tag in want_tag for tag in tags):
-                filtered.append(task)
-        tasks_sorted = filtered
+    tasks_sorted, dep_state = load_filtered_tasks(
+        statuses=args.status or ["TODO"], owners=args.owner, tags=args.tag, quiet=args.quiet
+    )
 
     ready_tasks: TaskList = []
     for task in tasks_sorted:
@@ -1442,6 +1728,35 @@ def cmd_task_next(args: argparse.Namespace) -> None:
         print(f"Ready: {len(ready_tasks)} / {len(tasks_sorted)}")
 
 
+def cmd_task_graph(args: argparse.Namespace) -> None:
+    edges, done = load_dependency_graph()
+    warnings = cycle_warnings(edges)
+    if warnings and not args.quiet:
+        for warning in warnings:
+            print(f"⚠️ {warning}")
+
+    if args.critical_path:
+        path = critical_path(edges, done)
+        tasks_by_id, dep_state = load_tasks_with_dependencies(path)
+        for position, task_id in enumerate(path, start=1):
+            print(f"{position}. {format_task_line(tasks_by_id[task_id], dep_state=dep_state)}")
+        if not args.quiet:
+            print(f"Critical path: {len(path)} open task(s)")
+        return
+
+    dependents: dict[str, list[str]] = {}
+    for task_id, deps in edges.items():
+        for dep in deps:
+            dependents.setdefault(dep, []).append(task_id)
+    shown = sorted(task_id for task_id in edges if args.all or task_id not in done)
+    tasks_by_id, dep_state = load_tasks_with_dependencies(shown)
+    for task_id in shown:
+        print(format_task_line(tasks_by_id[task_id], dep_state=dep_state))
+        blocked = sorted(dep for dep in dependents.get(task_id, []) if args.all or dep not in done)
+        if blocked:
+            print(f"  blocks: {', '.join(blocked)}")
+
+
 def _task_text_blob(task: TaskRecord) -> str:
     parts: list[str] = []
     for key in ("id", "title", "description", "status", "priority", "owner"):
@@ -1476,28 +1791,22 @@ def cmd_task_search(args: argparse.Namespace) -> None:
     if not query:
         die("Query must be non-empty", code=2)
 
-    _, tasks_by_id, warnings, key = load_task_index()
-    dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
-    warnings = warnings + dep_warnings
-    if warnings and not args.quiet:
-        for warning in warnings:
-            print(f"⚠️ {warning}")
+    index = task_index_queries()
+    if index is not None and not args.regex:
+        if not args.quiet:
+            for warning in task_index_warnings(index):
+                print(f"⚠️ {warning}")
+        matches = index.search_tasks(
+            query, statuses=args.status, owners=args.owner, tags=args.tag, limit=args.limit
+        )
+        dep_state = index.dependency_state(str(task.get("id") or "") for task in matches)
+        for task in matches:
+            print(format_task_line(task, dep_state=dep_state))
+        return
 
-    tasks_sorted = sorted(tasks_by_id.values(), key=lambda t: str(t.get("id") or ""))
-    if args.status:
-        want = {s.strip().upper() for s in args.status}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("status") or "TODO").strip().upper() in want]
-    if args.owner:
-        want_owner = {o.strip().upper() for o in args.owner}
-        tasks_sorted = [t for t in tasks_sorted if str(t.get("owner") or "").strip().upper() in want_owner]
-    if args.tag:
-        want_tag = {t.strip() for t in args.tag}
-        filtered: TaskList = []
-        for task in tasks_sorted:
-            tags = coerce_str_list(task.get("tags"))
-            if any(tag in want_tag for tag in tags):
-                filtered.append(task)
-        tasks_sorted = filtered
+    tasks_sorted, dep_state = load_filtered_tasks(
+        statuses=args.status, owners=args.owner, tags=args.tag, quiet=args.quiet
+    )
 
     if args.regex:
         try:
@@ -1799,11 +2108,14 @@ def cmd_sync(args: argparse.Namespace) -> None:
         die(f"Configured backend is {backend_id!r}, not {args.backend!r}", code=2)
     if not supports_sync_tasks(backend):
         die("Configured backend does not support sync()", code=2)
+    # Only pass full= when requested so backends without delta sync keep working.
+    extra: dict[str, bool] = {"full": True} if getattr(args, "full", False) else {}
     backend.sync(
         direction=args.direction,
         conflict=args.conflict,
         quiet=args.quiet,
         confirm=bool(getattr(args, "yes", False)),
+        **extra,
     )
 
 
@@ -1843,33 +2155,87 @@ def normalize_depends_on(value: object) -> tuple[list[str], list[str]]:
 
 
 def detect_cycles(edges: dict[str, list[str]]) -> list[list[str]]:
+    # Iterative depth-first search so long dependency chains cannot hit the recursion limit.
     cycles: list[list[str]] = []
-    visiting: set[str] = set()
     visited: set[str] = set()
-    stack: list[str] = []
-
-    def visit(node: str) -> None:
-        if node in visited:
-            return
-        if node in visiting:
-            if node in stack:
-                start = stack.index(node)
-                cycles.append(stack[start:] + [node])
-            return
-        visiting.add(node)
-        stack.append(node)
-        for dep in edges.get(node, []):
-            if dep in edges:
-                visit(dep)
-        stack.pop()
-        visiting.remove(node)
-        visited.add(node)
-
-    for node in edges:
-        visit(node)
+    for root in edges:
+        if root in visited:
+            continue
+        stack = [root]
+        on_stack = {root}
+        pending = [iter(edges.get(root, []))]
+        while pending:
+            dep = next(pending[-1], None)
+            if dep is None:
+                node = stack.pop()
+                on_stack.discard(node)
+                visited.add(node)
+                pending.pop()
+                continue
+            if dep not in edges or dep in visited:
+                continue
+            if dep in on_stack:
+                cycles.append(stack[stack.index(dep) :] + [dep])
+                continue
+            stack.append(dep)
+            on_stack.add(dep)
+            pending.append(iter(edges.get(dep, [])))
     return cycles
 
 
+def cycle_warnings(edges: dict[str, list[str]]) -> list[str]:
+    return ["Dependency cycle detected: " + " -> ".join(cycle) for cycle in detect_cycles(edges)]
+
+
+def dependency_done(task: TaskRecord) -> bool:
+    # A dependency is satisfied once it is DONE with recorded commit metadata.
+    if task.get("status") != "DONE":
+        return False
+    commit = task.get("commit") or {}
+    return (
+        isinstance(commit, dict)
+        and bool(str(commit.get("hash") or "").strip())
+        and bool(str(commit.get("message") or "").strip())
+    )
+
+
+def critical_path(edges: dict[str, list[str]], done: set[str]) -> list[str]:
+    """Longest chain of unfinished tasks linked by depends_on, first task to start first.
+
+    Tasks on dependency cycles are left out since they can never become ready.
+    """
+    open_edges = {
+        task_id: [dep for dep in deps if dep in edges and dep not in done]
+        for task_id, deps in edges.items()
+        if task_id not in done
+    }
+    dependents: dict[str, list[str]] = {task_id: [] for task_id in open_edges}
+    waiting = {task_id: len(deps) for task_id, deps in open_edges.items()}
+    for task_id, deps in open_edges.items():
+        for dep in deps:
+            dependents[dep].append(task_id)
+    length: dict[str, int] = {}
+    previous: dict[str, str] = {}
+    queue = sorted(task_id for task_id, count in waiting.items() if count == 0)
+    for task_id in queue:
+        # Ties go to the first declared dependency, then to the lowest task id.
+        best = max(open_edges[task_id], key=length.__getitem__, default=None)
+        length[task_id] = 1 + (length[best] if best else 0)
+        if best:
+            previous[task_id] = best
+        for dependent in dependents[task_id]:
+            waiting[dependent] -= 1
+            if waiting[dependent] == 0:
+                queue.append(dependent)
+    if not length:
+        return []
+    end = max(sorted(length), key=length.__getitem__)
+    path = [end]
+    while path[-1] in previous:
+        path.append(previous[path[-1]])
+    return path[::-1]
+
+
 def compute_dependency_state(tasks_by_id: TaskIndex) -> tuple[DependencyState, list[str]]:
     warnings: list[str] = []
     state: DependencyState = {}
@@ -1887,16 +2253,7 @@ def compute_dependency_state(tasks_by_id: TaskIndex) -> tuple[DependencyState, l
             dep_task = tasks_by_id.get(dep_id)
             if not dep_task:
                 missing.append(dep_id)
-                continue
-            if dep_task.get("status") != "DONE":
-                incomplete.append(dep_id)
-                continue
-            commit = dep_task.get("commit") or {}
-            if (
-                not isinstance(commit, dict)
-                or not str(commit.get("hash") or "").strip()
-                or not str(commit.get("message") or "").strip()
-            ):
+            elif not dependency_done(dep_task):
                 incomplete.append(dep_id)
         state[task_id] = {
             "depends_on": depends_on,
@@ -1905,19 +2262,43 @@ def compute_dependency_state(tasks_by_id: TaskIndex) -> tuple[DependencyState, l
         }
         edges[task_id] = depends_on
 
-    cycles = detect_cycles(edges)
-    if cycles:
-        warnings.extend("Dependency cycle detected: " + " -> ".join(cycle) for cycle in cycles)
-
+    warnings.extend(cycle_warnings(edges))
     return state, warnings
 
 
-def readiness(task_id: str) -> tuple[bool, list[str]]:
+def load_task_dependencies(task_id: str) -> tuple[TaskRecord | None, DependencyState, list[str]]:
+    index = task_index_queries()
+    if index is not None:
+        found = index.query_tasks(ids=[task_id])
+        return (found[0] if found else None), index.dependency_state([task_id]), task_index_warnings(index)
     _, tasks_by_id, index_warnings, key = load_task_index()
     dep_state, dep_warnings = load_dependency_state_for(tasks_by_id, key=key)
-    warnings = index_warnings + dep_warnings
+    return tasks_by_id.get(task_id), dep_state, index_warnings + dep_warnings
 
-    task = tasks_by_id.get(task_id)
+
+def load_dependency_graph() -> tuple[dict[str, list[str]], set[str]]:
+    # depends_on edges for every task plus the ids that satisfy their dependents.
+    index = task_index_queries()
+    if index is not None:
+        return index.dependency_graph()
+    _, tasks_by_id, _, _ = load_task_index()
+    edges = {task_id: normalize_depends_on(task.get("depends_on"))[0] for task_id, task in tasks_by_id.items()}
+    done = {task_id for task_id, task in tasks_by_id.items() if dependency_done(task)}
+    return edges, done
+
+
+def load_tasks_with_dependencies(task_ids: list[str]) -> tuple[TaskIndex, DependencyState]:
+    index = task_index_queries()
+    if index is not None:
+        tasks = index.query_tasks(ids=task_ids)
+        return {str(task.get("id") or ""): task for task in tasks}, index.dependency_state(task_ids)
+    _, tasks_by_id, _, key = load_task_index()
+    dep_state, _ = load_dependency_state_for(tasks_by_id, key=key)
+    return {task_id: tasks_by_id[task_id] for task_id in task_ids if task_id in tasks_by_id}, dep_state
+
+
+def readiness(task_id: str) -> tuple[bool, list[str]]:
+    task, dep_state, warnings = load_task_dependencies(task_id)
     if not task:
         return False, [*warnings, f"Unknown task id: {task_id}"]
 
@@ -1934,10 +2315,9 @@ def readiness(task_id: str) -> tuple[bool, list[str]]:
 
 
 def get_commit_info(rev: str, *, cwd: Path = ROOT) -> dict[str, str]:
-    try:
-        result = run(["git", "show", "-s", "--pretty=format:%H\x1f%s", rev], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or f"Failed to resolve git revision: {rev}")
+    result = GIT.query(["git", "show", "-s", "--pretty=format:%H\x1f%s", rev], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or f"Failed to resolve git revision: {rev}")
     raw = (result.stdout or "").strip()
     if "\x1f" not in raw:
         die(f"Unexpected git output for rev {rev}")
@@ -2426,6 +2806,8 @@ def commit_from_comment(
         )
     except subprocess.CalledProcessError as exc:
         die(exc.stderr.strip() or "git commit failed")
+    finally:
+        GIT.invalidate()
 
     commit_info = get_commit_info("HEAD", cwd=cwd)
     if not quiet:
@@ -2646,7 +3028,69 @@ def command_path(args: argparse.Namespace) -> str:
     return " ".join(p for p in parts if p) or "<unknown>"
 
 
+def lint_cache_key() -> tuple[list[object], list[object]] | None:
+    # Lint results depend on tasks.json, the config, the agent registry and the rules in this file.
+    # Returns (tasks.json stat, stats of the other inputs); stat-only so it is cheap on every command.
+    paths = [SWARM_CONFIG_PATH, Path(__file__).resolve()]
+    if AGENTS_DIR.exists():
+        paths.extend(sorted(AGENTS_DIR.glob("*.json")))
+    try:
+        stat = TASKS_PATH.stat()
+        inputs: list[object] = [LINT_CACHE_VERSION]
+        for path in paths:
+            path_stat = path.stat()
+            inputs.append([str(path), path_stat.st_mtime_ns, path_stat.st_size])
+    except FileNotFoundError:
+        return None
+    return [str(TASKS_PATH), stat.st_mtime_ns, stat.st_size], inputs
+
+
+def tasks_json_sha256() -> str:
+    with TASKS_PATH.open("rb") as handle:
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def write_lint_cache(payload: JsonDict) -> None:
+    tmp_path = LINT_CACHE_PATH.with_name(f"{LINT_CACHE_PATH.name}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+        tmp_path.replace(LINT_CACHE_PATH)
+    except OSError:
+        pass
+
+
 def lint_tasks_json() -> dict[str, list[str]]:
+    # Reuse the last result while tasks.json and its lint inputs are unchanged. A matching
+    # (mtime_ns, size) is trusted outright; tasks.json is hashed only when its stat changed,
+    # so a touch or a rewrite with identical bytes still reuses the result.
+    key = lint_cache_key()
+    if key is None:
+        return lint_tasks_payload()
+    tasks_stat, inputs = key
+    try:
+        cached = json.loads(LINT_CACHE_PATH.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        cached = None
+    digest: str | None = None
+    if isinstance(cached, dict) and cached.get("inputs") == inputs and isinstance(cached.get("result"), dict):
+        result = cast(dict[str, list[str]], cached["result"])
+        if cached.get("tasks_stat") == tasks_stat:
+            return result
+        digest = tasks_json_sha256()
+        if cached.get("sha256") == digest:
+            write_lint_cache({**cached, "tasks_stat": tasks_stat})
+            return result
+    result = lint_tasks_payload()
+    write_lint_cache(
+        {"tasks_stat": tasks_stat, "inputs": inputs, "sha256": digest or tasks_json_sha256(), "result": result}
+    )
+    return result
+
+
+def lint_tasks_payload() -> dict[str, list[str]]:
     errors: list[str] = []
     warnings: list[str] = []
 
@@ -2775,9 +3219,7 @@ def cmd_ready(args: argparse.Namespace) -> None:
     ok, warnings = readiness(args.task_id)
     for warning in warnings:
         print(f"⚠️ {warning}")
-    _, tasks_by_id, _, key = load_task_index()
-    dep_state, _ = load_dependency_state_for(tasks_by_id, key=key)
-    task = tasks_by_id.get(args.task_id)
+    task, dep_state, _ = load_task_dependencies(args.task_id)
     if task:
         task_id = str(task.get("id") or "").strip()
         title = str(task.get("title") or "").strip()
@@ -2938,6 +3380,8 @@ def cmd_commit(args: argparse.Namespace) -> None:
         )
     except subprocess.CalledProcessError as exc:
         die(exc.stderr.strip() or "git commit failed")
+    finally:
+        GIT.invalidate()
     commit_info = get_commit_info("HEAD", cwd=cwd)
     if not args.quiet:
         print(f"✅ committed {commit_info['hash'][:12]} {commit_info['message']}")
@@ -3362,7 +3806,16 @@ def cmd_verify(args: argparse.Namespace) -> None:
                     print(f"ℹ️ {task_id}: verify skipped (unchanged sha {current_sha[:12]})")
                 return
 
-    run_verify_with_capture(task_id, cwd=cwd, quiet=bool(args.quiet), log_path=log_path, current_sha=current_sha)
+    jobs, timeout = resolve_verify_limits(args)
+    run_verify_with_capture(
+        task_id,
+        cwd=cwd,
+        quiet=bool(args.quiet),
+        log_path=log_path,
+        current_sha=current_sha,
+        jobs=jobs,
+        timeout=timeout,
+    )
 
     if pr_meta_path.exists():
         pr_meta_write = pr_load_meta(pr_meta_path)
@@ -3604,6 +4057,7 @@ def cmd_finish(args: argparse.Namespace) -> None:
             }
 
     current_sha = git_rev_parse("HEAD", cwd=ROOT)
+    jobs, timeout = resolve_verify_limits(args)
     for task_id in task_ids:
         commands = verify_commands.get(task_id) or []
         if commands and not args.skip_verify and not args.force:
@@ -3613,6 +4067,8 @@ def cmd_finish(args: argparse.Namespace) -> None:
                 quiet=bool(args.quiet),
                 log_path=None,
                 current_sha=current_sha,
+                jobs=jobs,
+                timeout=timeout,
             )
 
     for task_id in task_ids:
@@ -3682,67 +4138,60 @@ def cmd_finish(args: argparse.Namespace) -> None:
 
 
 def git_rev_parse(rev: str, *, cwd: Path = ROOT) -> str:
-    try:
-        result = run(["git", "rev-parse", rev], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or f"Failed to resolve git rev: {rev}")
+    resolved = GIT.resolve(rev, cwd=cwd)
+    if resolved:
+        return resolved
+    result = GIT.query(["git", "rev-parse", rev], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or f"Failed to resolve git rev: {rev}")
     return (result.stdout or "").strip()
 
 
 def git_branch_exists(branch: str, *, cwd: Path = ROOT) -> bool:
-    try:
-        run(["git", "show-ref", "--verify", "--quiet", f"refs/heads/{branch}"], cwd=cwd, check=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    return f"refs/heads/{branch}" in GIT.refs(cwd=cwd)
+
+
+def git_merged_branches(base: str, *, cwd: Path = ROOT) -> set[str]:
+    """Local branches already reachable from base (their `base...branch` diff is empty)."""
+    result = GIT.query(["git", "for-each-ref", f"--merged={base}", "--format=%(refname)", "refs/heads"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or f"Failed to list branches merged into {base}")
+    prefix = "refs/heads/"
+    return {line[len(prefix) :] for line in (result.stdout or "").splitlines() if line.startswith(prefix)}
 
 
 def git_diff_names(base: str, head: str, *, cwd: Path = ROOT) -> list[str]:
-    try:
-        result = run(["git", "diff", "--name-only", f"{base}...{head}"], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to compute git diff")
+    result = GIT.query(["git", "diff", "--name-only", f"{base}...{head}"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or "Failed to compute git diff")
     return [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
 
 
 def git_diff_stat(base: str, head: str, *, cwd: Path = ROOT) -> str:
-    try:
-        result = run(["git", "diff", "--stat", f"{base}...{head}"], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to compute git diffstat")
+    result = GIT.query(["git", "diff", "--stat", f"{base}...{head}"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or "Failed to compute git diffstat")
     return (result.stdout or "").rstrip() + "\n"
 
 
 def git_log_subjects(base: str, head: str, *, cwd: Path = ROOT, limit: int = 50) -> list[str]:
-    try:
-        result = run(
-            ["git", "log", f"--max-count={limit}", "--pretty=format:%s", f"{base}..{head}"],
-            cwd=cwd,
-            check=True,
-        )
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to read git log")
+    result = GIT.query(["git", "log", f"--max-count={limit}", "--pretty=format:%s", f"{base}..{head}"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or "Failed to read git log")
     return [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
 
 
 def git_show_text(rev: str, relpath: str, *, cwd: Path = ROOT) -> str | None:
     rel = str(relpath or "").strip().lstrip("/")
-    if not rel:
-        return None
-    try:
-        proc = run(["git", "show", f"{rev}:{rel}"], cwd=cwd, check=False)
-    except subprocess.CalledProcessError:
-        return None
-    if proc.returncode != 0:
+    if not rel or "\n" in rel or "\n" in rev:
         return None
-    return proc.stdout
+    return GIT.read_blob(f"{rev}:{rel}", cwd=cwd)
 
 
 def git_worktree_list_porcelain(*, cwd: Path = ROOT) -> str:
-    try:
-        result = run(["git", "worktree", "list", "--porcelain"], cwd=cwd, check=True)
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to list git worktrees")
+    result = GIT.query(["git", "worktree", "list", "--porcelain"], cwd=cwd)
+    if result.returncode != 0:
+        die(result.stderr.strip() or "Failed to list git worktrees")
     return result.stdout or ""
 
 
@@ -4015,6 +4464,7 @@ def _run_agentctl_in_checkout(args: list[str], *, cwd: Path, quiet: bool) -> Non
         capture_output=True,
         check=False,
     )
+    GIT.invalidate()
     if proc.returncode != 0:
         out = (proc.stdout or "").strip()
         err = (proc.stderr or "").strip()
@@ -4143,15 +4593,12 @@ def cmd_work_start(args: argparse.Namespace) -> None:
 
 
 def git_list_task_branches(*, cwd: Path = ROOT) -> list[str]:
-    try:
-        result = run(
-            ["git", "for-each-ref", "--format=%(refname:short)", f"refs/heads/{TASK_BRANCH_PREFIX}"],
-            cwd=cwd,
-            check=True,
-        )
-    except subprocess.CalledProcessError as exc:
-        die(exc.stderr.strip() or "Failed to list task branches")
-    return [line.strip() for line in (result.stdout or "").splitlines() if line.strip()]
+    prefix = f"refs/heads/{TASK_BRANCH_PREFIX}"
+    return [
+        refname[len("refs/heads/") :]
+        for refname in GIT.refs(cwd=cwd)
+        if refname == prefix or refname.startswith(prefix + "/")
+    ]
 
 
 def cmd_cleanup_merged(args: argparse.Namespace) -> None:
@@ -4168,6 +4615,7 @@ def cmd_cleanup_merged(args: argparse.Namespace) -> None:
     tasks_by_id, _ = index_tasks_by_id(tasks)
 
     candidates: list[dict[str, str]] = []
+    merged = git_merged_branches(base, cwd=ROOT)
     for branch in git_list_task_branches(cwd=ROOT):
         task_id = parse_task_id_from_task_branch(branch)
         if not task_id:
@@ -4175,7 +4623,7 @@ def cmd_cleanup_merged(args: argparse.Namespace) -> None:
         task = tasks_by_id.get(task_id) or {}
         if str(task.get("status") or "").strip().upper() != "DONE":
             continue
-        if git_diff_names(base, branch):
+        if branch not in merged and git_diff_names(base, branch):
             continue
         worktree_path = detect_worktree_path_for_branch(branch, cwd=ROOT)
         worktree_value = str(worktree_path) if worktree_path else ""
@@ -4878,6 +5326,88 @@ def append_verify_log(path: Path, *, header: str, content: str) -> None:
         handle.write("\n")
 
 
+def _stop_verify_process(proc: subprocess.Popen[str]) -> None:
+    if proc.poll() is not None:
+        return
+    try:
+        if os.name == "posix":
+            # The command runs under a shell in its own session; kill the whole group so
+            # grandchildren holding the output pipe open go away too.
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def run_verify_command(
+    command: str,
+    *,
+    cwd: Path,
+    timeout: float | None,
+    emit: Callable[[str], None],
+    running: set[subprocess.Popen[str]] | None = None,
+) -> tuple[int, list[str], float, bool]:
+    """Run one verify command, handing each output line to emit as soon as it is produced.
+
+    While it runs the process is kept in `running` so the caller can stop it on interrupt.
+    Returns (returncode, output lines, duration seconds, timed_out).
+    """
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        command,
+        cwd=str(cwd),
+        shell=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        start_new_session=os.name == "posix",
+    )
+    timed_out = threading.Event()
+
+    def expire() -> None:
+        timed_out.set()
+        _stop_verify_process(proc)
+
+    timer = threading.Timer(timeout, expire) if timeout else None
+    lines: list[str] = []
+    if running is not None:
+        running.add(proc)
+    try:
+        if timer:
+            timer.daemon = True
+            timer.start()
+        assert proc.stdout is not None
+        for raw_line in proc.stdout:
+            line = raw_line.rstrip("\r\n")
+            lines.append(line)
+            emit(line)
+        returncode = proc.wait()
+    except BaseException:
+        _stop_verify_process(proc)
+        raise
+    finally:
+        if timer:
+            timer.cancel()
+        if running is not None:
+            running.discard(proc)
+        if proc.stdout:
+            proc.stdout.close()
+    if timed_out.is_set():
+        returncode = VERIFY_TIMEOUT_EXIT_CODE
+    return returncode, lines, time.monotonic() - started, timed_out.is_set()
+
+
+def verify_status_line(returncode: int, duration: float, *, timed_out: bool, timeout: float | None) -> str:
+    timestamp = now_iso_utc()
+    if timed_out:
+        return f"[{timestamp}] ⏱️ timeout after {timeout:g}s exit={returncode} duration={duration:.2f}s"
+    mark = "✅" if returncode == 0 else "❌"
+    return f"[{timestamp}] {mark} exit={returncode} duration={duration:.2f}s"
+
+
 def run_verify_with_capture(
     task_id: str,
     *,
@@ -4885,7 +5415,16 @@ def run_verify_with_capture(
     quiet: bool,
     log_path: Path | None = None,
     current_sha: str | None = None,
+    jobs: int = 1,
+    timeout: float | None = None,
 ) -> list[tuple[str, str]]:
+    """Run the task's verify commands and return (header, content) log entries in declared order.
+
+    Up to `jobs` commands run at once. Output is appended to log_path line by line while
+    the commands run (prefixed with `#<n> |` when several run concurrently) and every
+    command ends with a status line carrying its exit code and duration. After the first
+    failure no further commands are started and the failing exit code is raised.
+    """
     commands = get_task_verify_commands_for(task_id)
     entries: list[tuple[str, str]] = []
     if not commands:
@@ -4898,23 +5437,75 @@ def run_verify_with_capture(
             print(f"ℹ️ {task_id}: no verify commands configured")
         return entries
 
-    for command in commands:
-        if not quiet:
-            print(f"$ {command}")
+    workers = max(1, min(jobs, len(commands)))
+    tagged = workers > 1
+    sha_prefix = f"sha={current_sha} " if current_sha else ""
+    lock = threading.Lock()
+    failed = threading.Event()
+    running: set[subprocess.Popen[str]] = set()
+    handle = None
+    if log_path:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = log_path.open("a", encoding="utf-8")
+
+    def write_log(*lines: str) -> None:
+        if handle is None:
+            return
+        with lock:
+            handle.write("".join(line + "\n" for line in lines))
+            handle.flush()
+
+    def run_one(number: int, command: str) -> tuple[str, str, int] | None:
+        if failed.is_set():
+            return None
+        tag = f"#{number} " if tagged else ""
         timestamp = now_iso_utc()
-        proc = subprocess.run(command, cwd=str(cwd), shell=True, text=True, capture_output=True, check=False)
-        output = ""
-        if proc.stdout:
-            output += proc.stdout
-        if proc.stderr:
-            output += ("\n" if output and not output.endswith("\n") else "") + proc.stderr
-        sha_prefix = f"sha={current_sha} " if current_sha else ""
         header = f"[{timestamp}] {sha_prefix}$ {command}".rstrip()
-        entries.append((header, output))
-        if log_path:
-            append_verify_log(log_path, header=header, content=output)
-        if proc.returncode != 0:
-            raise SystemExit(proc.returncode)
+        if not quiet:
+            with lock:
+                print(f"{tag}$ {command}", flush=True)
+        write_log(f"[{timestamp}] {sha_prefix}{tag}$ {command}".rstrip())
+        prefix = f"{tag}| " if tag else ""
+        returncode, lines, duration, timed_out = run_verify_command(
+            command, cwd=cwd, timeout=timeout, emit=lambda line: write_log(prefix + line), running=running
+        )
+        status = verify_status_line(returncode, duration, timed_out=timed_out, timeout=timeout)
+        write_log(prefix + status, "")
+        if returncode != 0:
+            failed.set()
+            if not quiet:
+                with lock:
+                    print(f"{status} $ {command}", flush=True)
+        return header, "\n".join([*lines, status]), returncode
+
+    try:
+        if workers == 1:
+            results = [run_one(number, command) for number, command in enumerate(commands, start=1)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(run_one, number, command) for number, command in enumerate(commands, start=1)]
+                try:
+                    results = [future.result() for future in futures]
+                except BaseException:
+                    failed.set()
+                    for proc in list(running):
+                        _stop_verify_process(proc)
+                    raise
+    finally:
+        GIT.invalidate()
+        if handle is not None:
+            handle.close()
+
+    exit_code = 0
+    for result in results:
+        if result is None:
+            continue
+        header, content, returncode = result
+        entries.append((header, content))
+        if returncode != 0 and not exit_code:
+            exit_code = returncode
+    if exit_code:
+        raise SystemExit(exit_code)
     if current_sha:
         timestamp = now_iso_utc()
         header = f"[{timestamp}] ✅ verified_sha={current_sha}"
@@ -4969,6 +5560,7 @@ def cmd_integrate(args: argparse.Namespace) -> None:
     base_sha_before_merge = git_rev_parse(base)
 
     verify_commands = get_task_verify_commands_for(task_id)
+    verify_jobs_limit, verify_timeout = resolve_verify_limits(args)
     branch_head_sha = git_rev_parse(branch)
     already_verified_sha: str | None = None
     if verify_commands and not args.run_verify:
@@ -5028,6 +5620,8 @@ def cmd_integrate(args: argparse.Namespace) -> None:
                     quiet=bool(args.quiet),
                     log_path=None,
                     current_sha=branch_head_sha,
+                    jobs=verify_jobs_limit,
+                    timeout=verify_timeout,
                 )
             proc = run(["git", "merge", "--squash", branch], check=False)
             if proc.returncode != 0:
@@ -5062,6 +5656,8 @@ def cmd_integrate(args: argparse.Namespace) -> None:
                     quiet=bool(args.quiet),
                     log_path=None,
                     current_sha=branch_head_sha,
+                    jobs=verify_jobs_limit,
+                    timeout=verify_timeout,
                 )
             proc = run(
                 ["git", "merge", "--no-ff", branch, "-m", f"🔀 {task_id} merge {branch}"],
@@ -5099,6 +5695,8 @@ def cmd_integrate(args: argparse.Namespace) -> None:
                     quiet=bool(args.quiet),
                     log_path=None,
                     current_sha=branch_head_sha,
+                    jobs=verify_jobs_limit,
+                    timeout=verify_timeout,
                 )
             proc = run(["git", "merge", "--ff-only", branch], check=False)
             if proc.returncode != 0:
@@ -5173,21 +5771,20 @@ def cmd_integrate(args: argparse.Namespace) -> None:
             run(["git", "worktree", "remove", "--force", str(temp_path)], check=False)
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="agentctl", description="TokenSpot agent workflow helper")
-    sub = parser.add_subparsers(dest="cmd", required=True)
-
-    p_quickstart = sub.add_parser("quickstart", help="Print agentctl usage quick reference (.codex-swarm/agentctl.md)")
+def add_quickstart_arguments(p_quickstart: argparse.ArgumentParser) -> None:
     p_quickstart.set_defaults(func=cmd_quickstart)
 
-    p_role = sub.add_parser("role", help="Show role-specific command guidance from agentctl.md")
+
+def add_role_arguments(p_role: argparse.ArgumentParser) -> None:
     p_role.add_argument("role", help="Agent role id (e.g., CODER)")
     p_role.set_defaults(func=cmd_role)
 
-    p_agents = sub.add_parser("agents", help="List registered agents under .codex-swarm/agents/")
+
+def add_agents_arguments(p_agents: argparse.ArgumentParser) -> None:
     p_agents.set_defaults(func=cmd_agents)
 
-    p_config = sub.add_parser("config", help="Inspect or update .codex-swarm/config.json")
+
+def add_config_arguments(p_config: argparse.ArgumentParser) -> None:
     config_sub = p_config.add_subparsers(dest="config_cmd", required=True)
 
     p_config_show = config_sub.add_parser("show", help="Print config.json")
@@ -5199,11 +5796,13 @@ def build_parser() -> argparse.ArgumentParser:
     p_config_set.add_argument("--json", action="store_true", help="Parse value as JSON")
     p_config_set.set_defaults(func=cmd_config_set)
 
-    p_ready = sub.add_parser("ready", help="Check if a task is ready to start (dependencies DONE)")
+
+def add_ready_arguments(p_ready: argparse.ArgumentParser) -> None:
     p_ready.add_argument("task_id")
     p_ready.set_defaults(func=cmd_ready)
 
-    p_verify = sub.add_parser("verify", help="Run verify commands declared on a task (tasks.json)")
+
+def add_verify_arguments(p_verify: argparse.ArgumentParser) -> None:
     p_verify.add_argument("task_id")
     p_verify.add_argument(
         "--cwd",
@@ -5218,11 +5817,23 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Skip verify when the current SHA matches the last verified SHA (when available via PR meta/log).",
     )
+    p_verify.add_argument(
+        "--jobs",
+        type=int,
+        help="Run up to N verify commands concurrently (default: tasks.verify.jobs or 1)",
+    )
+    p_verify.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Kill a verify command that runs longer than this (default: tasks.verify.timeout_seconds)",
+    )
     p_verify.add_argument("--quiet", action="store_true", help="Minimal output")
     p_verify.add_argument("--require", action="store_true", help="Fail if no verify commands exist")
     p_verify.set_defaults(func=cmd_verify)
 
-    p_work = sub.add_parser("work", help="One-command helpers to start a task checkout")
+
+def add_work_arguments(p_work: argparse.ArgumentParser) -> None:
     work_sub = p_work.add_subparsers(dest="work_cmd", required=True)
 
     p_work_start = work_sub.add_parser("start", help="Create branch+worktree and initialize per-task artifacts")
@@ -5242,7 +5853,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_work_start.add_argument("--quiet", action="store_true", help="Minimal output")
     p_work_start.set_defaults(func=cmd_work_start)
 
-    p_cleanup = sub.add_parser("cleanup", help="Cleanup helpers (dry-run by default)")
+
+def add_cleanup_arguments(p_cleanup: argparse.ArgumentParser) -> None:
     cleanup_sub = p_cleanup.add_subparsers(dest="cleanup_cmd", required=True)
 
     p_cleanup_merged = cleanup_sub.add_parser("merged", help="Remove merged task branches and their worktrees")
@@ -5255,7 +5867,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_cleanup_merged.add_argument("--quiet", action="store_true", help="Minimal output")
     p_cleanup_merged.set_defaults(func=cmd_cleanup_merged)
 
-    p_branch = sub.add_parser("branch", help="Task branch + worktree helpers (single task per branch)")
+
+def add_branch_arguments(p_branch: argparse.ArgumentParser) -> None:
     branch_sub = p_branch.add_subparsers(dest="branch_cmd", required=True)
 
     p_branch_create = branch_sub.add_parser("create", help="Create task branch (optionally with a git worktree)")
@@ -5290,7 +5903,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_branch_remove.add_argument("--quiet", action="store_true", help="Minimal output")
     p_branch_remove.set_defaults(func=cmd_branch_remove)
 
-    p_pr = sub.add_parser("pr", help="Local PR artifact helpers (.codex-swarm/tasks/<task-id>/pr)")
+
+def add_pr_arguments(p_pr: argparse.ArgumentParser) -> None:
     pr_sub = p_pr.add_subparsers(dest="pr_cmd", required=True)
 
     p_pr_open = pr_sub.add_parser("open", help="Create PR artifact folder + templates")
@@ -5324,7 +5938,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_pr_note.add_argument("--quiet", action="store_true", help="Minimal output")
     p_pr_note.set_defaults(func=cmd_pr_note)
 
-    p_integrate = sub.add_parser("integrate", help="Merge a task branch into main (gated by PR artifact + verify)")
+
+def add_integrate_arguments(p_integrate: argparse.ArgumentParser) -> None:
     p_integrate.add_argument("task_id")
     p_integrate.add_argument("--branch", help="Task branch to integrate (default: from PR meta.json)")
     p_integrate.add_argument("--base", help="Base branch (default: pinned base branch or 'main').")
@@ -5344,10 +5959,22 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print plan + preflight checks without making changes",
     )
+    p_integrate.add_argument(
+        "--jobs",
+        type=int,
+        help="Run up to N verify commands concurrently (default: tasks.verify.jobs or 1)",
+    )
+    p_integrate.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Kill a verify command that runs longer than this (default: tasks.verify.timeout_seconds)",
+    )
     p_integrate.add_argument("--quiet", action="store_true", help="Minimal output")
     p_integrate.set_defaults(func=cmd_integrate)
 
-    p_hooks = sub.add_parser("hooks", help="Install or remove optional git hooks")
+
+def add_hooks_arguments(p_hooks: argparse.ArgumentParser) -> None:
     hooks_sub = p_hooks.add_subparsers(dest="hooks_cmd", required=True)
 
     p_hooks_install = hooks_sub.add_parser("install", help="Install optional git hooks (commit-msg, pre-commit)")
@@ -5363,7 +5990,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_hooks_run.add_argument("hook_args", nargs="*")
     p_hooks_run.set_defaults(func=cmd_hooks_run)
 
-    p_guard = sub.add_parser("guard", help="Guardrails for git staging/commit hygiene")
+
+def add_guard_arguments(p_guard: argparse.ArgumentParser) -> None:
     guard_sub = p_guard.add_subparsers(dest="guard_cmd", required=True)
 
     p_guard_clean = guard_sub.add_parser("clean", help="Fail if there are staged files")
@@ -5393,7 +6021,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_guard_commit.add_argument("--quiet", action="store_true", help="Minimal output")
     p_guard_commit.set_defaults(func=cmd_guard_commit)
 
-    p_commit = sub.add_parser("commit", help="Run guard commit checks, then `git commit`")
+
+def add_commit_arguments(p_commit: argparse.ArgumentParser) -> None:
     p_commit.add_argument("task_id", help="Active task id (must appear in --message)")
     p_commit.add_argument("--message", "-m", required=True, help="Commit message")
     p_commit.add_argument("--allow", action="append", help="Allowed path prefix (repeatable)")
@@ -5403,7 +6032,8 @@ def build_parser() -> argparse.ArgumentParser:
     p_commit.add_argument("--quiet", action="store_true", help="Minimal output")
     p_commit.set_defaults(func=cmd_commit)
 
-    p_start = sub.add_parser("start", help="Mark task DOING with a mandatory comment")
+
+def add_start_arguments(p_start: argparse.ArgumentParser) -> None:
     p_start.add_argument("task_id")
     p_start.add_argument("--author", required=True)
     p_start.add_argument("--body", required=True)
@@ -5446,7 +6076,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_start.set_defaults(func=cmd_start)
 
-    p_block = sub.add_parser("block", help="Mark task BLOCKED with a mandatory comment")
+
+def add_block_arguments(p_block: argparse.ArgumentParser) -> None:
     p_block.add_argument("task_id")
     p_block.add_argument("--author", required=True)
     p_block.add_argument("--body", required=True)
@@ -5489,7 +6120,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_block.set_defaults(func=cmd_block)
 
-    p_task = sub.add_parser("task", help="Operate on tasks.json")
+
+def add_task_arguments(p_task: argparse.ArgumentParser) -> None:
     task_sub = p_task.add_subparsers(dest="task_cmd", required=True)
 
     p_lint = task_sub.add_parser("lint", help="Validate tasks.json (schema, deps, checksum)")
@@ -5567,6 +6199,16 @@ def build_parser() -> argparse.ArgumentParser:
     p_next.add_argument("--quiet", action="store_true", help="Suppress warnings")
     p_next.set_defaults(func=cmd_task_next)
 
+    p_graph = task_sub.add_parser("graph", help="Show task dependencies and the tasks each one blocks")
+    p_graph.add_argument(
+        "--critical-path",
+        action="store_true",
+        help="Print the longest chain of unfinished dependent tasks, first task to start first",
+    )
+    p_graph.add_argument("--all", action="store_true", help="Include DONE tasks")
+    p_graph.add_argument("--quiet", action="store_true", help="Suppress warnings and summary")
+    p_graph.set_defaults(func=cmd_task_graph)
+
     p_show = task_sub.add_parser("show", help="Show a single task from tasks.json")
     p_show.add_argument("task_id")
     p_show.add_argument("--last-comments", type=int, default=5, help="How many latest comments to print")
@@ -5590,7 +6232,10 @@ def build_parser() -> argparse.ArgumentParser:
     p_doc_set.add_argument("--quiet", action="store_true", help="Minimal output")
     p_doc_set.set_defaults(func=cmd_task_doc_set)
 
-    p_search = task_sub.add_parser("search", help="Search tasks by text (title/description/tags/comments)")
+    p_search = task_sub.add_parser(
+        "search",
+        help="Search tasks by text (title/description/doc/tags/comments); ranked word-prefix match with the task index",
+    )
     p_search.add_argument("query")
     p_search.add_argument("--regex", action="store_true", help="Treat query as a case-insensitive regex")
     p_search.add_argument("--status", action="append", help="Filter by status (repeatable)")
@@ -5680,15 +6325,24 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_status.set_defaults(func=cmd_task_set_status)
 
-    p_finish = sub.add_parser(
-        "finish",
-        help="Mark task(s) DONE + attach commit metadata (typically after a code commit)",
-    )
+
+def add_finish_arguments(p_finish: argparse.ArgumentParser) -> None:
     p_finish.add_argument("task_id", nargs="+", help="One or more task IDs")
     p_finish.add_argument("--commit", default="HEAD", help="Git rev to attach as task commit metadata (default: HEAD)")
     p_finish.add_argument("--author", help="Optional comment author (requires --body)")
     p_finish.add_argument("--body", help="Optional comment body (requires --author)")
     p_finish.add_argument("--skip-verify", action="store_true", help="Do not run verify even if configured")
+    p_finish.add_argument(
+        "--jobs",
+        type=int,
+        help="Run up to N verify commands concurrently (default: tasks.verify.jobs or 1)",
+    )
+    p_finish.add_argument(
+        "--timeout",
+        type=float,
+        metavar="SECONDS",
+        help="Kill a verify command that runs longer than this (default: tasks.verify.timeout_seconds)",
+    )
     p_finish.add_argument("--quiet", action="store_true", help="Minimal output")
     p_finish.add_argument("--force", action="store_true", help="Bypass readiness and commit-subject checks")
     p_finish.add_argument(
@@ -5757,7 +6411,8 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_finish.set_defaults(require_task_id_in_commit=True, func=cmd_finish)
 
-    p_sync = sub.add_parser("sync", help="Sync tasks with a backend")
+
+def add_sync_arguments(p_sync: argparse.ArgumentParser) -> None:
     p_sync.add_argument("backend", nargs="?", help="Backend id (e.g., redmine)")
     p_sync.add_argument("--direction", default="push", choices=["push", "pull"], help="Sync direction")
     p_sync.add_argument(
@@ -5768,13 +6423,53 @@ def build_parser() -> argparse.ArgumentParser:
     )
     p_sync.add_argument("--yes", action="store_true", help="Confirm push writes (for backends that require it)")
     p_sync.add_argument("--quiet", action="store_true", help="Minimal output")
+    p_sync.add_argument(
+        "--full",
+        action="store_true",
+        help="Pull: re-list every remote task instead of only changes since the last sync",
+    )
     p_sync.set_defaults(func=cmd_sync)
 
+
+# Top-level commands in help order: (name, help, function that adds the command's arguments).
+COMMAND_PARSERS: list[tuple[str, str, Callable[[argparse.ArgumentParser], None]]] = [
+    ("quickstart", "Print agentctl usage quick reference (.codex-swarm/agentctl.md)", add_quickstart_arguments),
+    ("role", "Show role-specific command guidance from agentctl.md", add_role_arguments),
+    ("agents", "List registered agents under .codex-swarm/agents/", add_agents_arguments),
+    ("config", "Inspect or update .codex-swarm/config.json", add_config_arguments),
+    ("ready", "Check if a task is ready to start (dependencies DONE)", add_ready_arguments),
+    ("verify", "Run verify commands declared on a task (tasks.json)", add_verify_arguments),
+    ("work", "One-command helpers to start a task checkout", add_work_arguments),
+    ("cleanup", "Cleanup helpers (dry-run by default)", add_cleanup_arguments),
+    ("branch", "Task branch + worktree helpers (single task per branch)", add_branch_arguments),
+    ("pr", "Local PR artifact helpers (.codex-swarm/tasks/<task-id>/pr)", add_pr_arguments),
+    ("integrate", "Merge a task branch into main (gated by PR artifact + verify)", add_integrate_arguments),
+    ("hooks", "Install or remove optional git hooks", add_hooks_arguments),
+    ("guard", "Guardrails for git staging/commit hygiene", add_guard_arguments),
+    ("commit", "Run guard commit checks, then `git commit`", add_commit_arguments),
+    ("start", "Mark task DOING with a mandatory comment", add_start_arguments),
+    ("block", "Mark task BLOCKED with a mandatory comment", add_block_arguments),
+    ("task", "Operate on tasks.json", add_task_arguments),
+    ("finish", "Mark task(s) DONE + attach commit metadata (typically after a code commit)", add_finish_arguments),
+    ("sync", "Sync tasks with a backend", add_sync_arguments),
+]
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    # Only the invoked command's argument tree is built; other commands are listed by name for --help.
+    parser = argparse.ArgumentParser(prog="agentctl", description="TokenSpot agent workflow helper")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    names = {name for name, _, _ in COMMAND_PARSERS}
+    invoked = argv[0] if argv and argv[0] in names else None
+    for name, help_text, add_arguments in COMMAND_PARSERS:
+        command_parser = sub.add_parser(name, help=help_text)
+        if invoked is None or name == invoked:
+            add_arguments(command_parser)
     return parser
 
 
 def extract_global_flags(argv: list[str]) -> tuple[dict[str, bool], list[str]]:
-    flags = {"quiet": False, "verbose": False, "json": False, "lint": False}
+    flags = {"quiet": False, "verbose": False, "json": False, "lint": False, "git_timings": False}
     remaining: list[str] = []
     for arg in argv:
         if arg == "--quiet":
@@ -5789,6 +6484,9 @@ def extract_global_flags(argv: list[str]) -> tuple[dict[str, bool], list[str]]:
         if arg == "--lint":
             flags["lint"] = True
             continue
+        if arg == "--git-timings":
+            flags["git_timings"] = True
+            continue
         remaining.append(arg)
     if flags["verbose"]:
         flags["quiet"] = False
@@ -5827,7 +6525,7 @@ def main(argv: list[str] | None = None) -> None:
     maybe_pin_base_branch(cwd=ROOT)
     raw_argv = list(argv) if argv is not None else sys.argv[1:]
     flags, filtered = extract_global_flags(raw_argv)
-    parser = build_parser()
+    parser = build_parser(filtered)
     args = parser.parse_args(filtered)
     apply_global_flags(args, flags)
     maybe_lint_tasks_json()
@@ -5843,6 +6541,9 @@ def main(argv: list[str] | None = None) -> None:
         if code == 0 and not suppressed:
             print(f"✅ {command_path(args)} OK")
         raise
+    finally:
+        if flags["git_timings"]:
+            print("\n".join(GIT.report()), file=sys.stderr)
     if not suppressed:
         print(f"✅ {command_path(args)} OK")
 
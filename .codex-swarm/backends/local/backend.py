@@ -4,6 +4,7 @@ import hashlib
 import json
 import re
 import secrets
+import sqlite3
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -12,7 +13,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable
 
 FRONTMATTER_BOUNDARY = "---"
 DEFAULT_TASKS_DIR = Path(".codex-swarm/tasks")
@@ -22,6 +23,40 @@ DOC_SECTION_HEADER = "## Summary"
 AUTO_SUMMARY_HEADER = "## Changes Summary (auto)"
 DOC_VERSION = 2
 DOC_UPDATED_BY = "agentctl"
+INDEX_SCHEMA_VERSION = 3
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS tasks (
+    key INTEGER PRIMARY KEY,
+    dir TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    done INTEGER NOT NULL,
+    payload TEXT,
+    warnings TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_id ON tasks(id);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks(status, id);
+CREATE INDEX IF NOT EXISTS tasks_owner ON tasks(owner, id);
+CREATE TABLE IF NOT EXISTS task_tags (task_id TEXT NOT NULL, tag TEXT NOT NULL, PRIMARY KEY (task_id, tag));
+CREATE INDEX IF NOT EXISTS task_tags_tag ON task_tags(tag);
+CREATE TABLE IF NOT EXISTS task_deps (
+    task_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    depends_on TEXT NOT NULL,
+    PRIMARY KEY (task_id, position)
+);
+CREATE INDEX IF NOT EXISTS task_deps_target ON task_deps(depends_on);
+CREATE VIRTUAL TABLE IF NOT EXISTS task_text USING fts5(
+    title, description, doc, comments, tags, meta, prefix='2 3 4'
+);
+"""
+# bm25 weights for the task_text columns, in declaration order.
+SEARCH_WEIGHTS = (10.0, 4.0, 1.0, 1.0, 5.0, 2.0)
+SEARCH_TOKEN_RE = re.compile(r"\w+")
 
 
 @dataclass
@@ -255,6 +290,16 @@ def _apply_doc_metadata(frontmatter: dict[str, object], *, updated_by: str | Non
     frontmatter["doc_updated_by"] = updated_by or DOC_UPDATED_BY
 
 
+def _write_text_if_changed(path: Path, content: str, existing: str | None = None) -> bool:
+    """Write ``content`` unless the file already holds it; ``existing`` skips re-reading the file."""
+    if existing is None and path.exists():
+        existing = path.read_text(encoding="utf-8")
+    if existing == content:
+        return False
+    path.write_text(content, encoding="utf-8")
+    return True
+
+
 def validate_task_id(task_id: str, *, source: Path | None = None) -> None:
     if not TASK_ID_RE.match(task_id):
         hint = f" in {source}" if source else ""
@@ -312,6 +357,343 @@ def merge_task_doc(body: str, doc: str) -> str:
     return "\n".join(parts).rstrip() + "\n"
 
 
+def _index_strings(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    items: list[str] = []
+    for item in value:
+        text = item.strip() if isinstance(item, str) else ""
+        if text and text not in items:
+            items.append(text)
+    return items
+
+
+def _index_warnings(task_id: str, value: object) -> list[str]:
+    """depends_on problems for one task, worded as agentctl's full-list dependency check."""
+    errors: list[str] = []
+    if value is not None and not isinstance(value, list):
+        errors.append("depends_on must be a list of task IDs")
+    elif isinstance(value, list) and any(not isinstance(item, str) for item in value):
+        errors.append("depends_on entries must be strings")
+    warnings = [f"{task_id}: " + "; ".join(errors)] if errors else []
+    if task_id in _index_strings(value):
+        warnings.append(f"{task_id}: depends_on contains itself")
+    return warnings
+
+
+def _index_text(task: dict[str, object]) -> tuple[str, ...]:
+    """Searchable text per task_text column."""
+    comments: list[str] = []
+    raw_comments = task.get("comments")
+    for comment in raw_comments if isinstance(raw_comments, list) else []:
+        if isinstance(comment, dict):
+            comments.extend(str(comment.get(key) or "") for key in ("author", "body"))
+    meta = [str(task.get(key) or "") for key in ("id", "status", "priority", "owner")]
+    commit = task.get("commit")
+    if isinstance(commit, dict):
+        meta.extend(str(commit.get(key) or "") for key in ("hash", "message"))
+    return (
+        str(task.get("title") or ""),
+        str(task.get("description") or ""),
+        str(task.get("doc") or ""),
+        "\n".join(comments),
+        " ".join(_index_strings(task.get("tags"))),
+        " ".join(meta),
+    )
+
+
+def search_expression(query: str) -> str:
+    """FTS5 expression requiring every word of ``query`` as a token prefix."""
+    return " ".join(f'"{token}"*' for token in SEARCH_TOKEN_RE.findall(query))
+
+
+def _index_done(task: dict[str, object]) -> bool:
+    commit = task.get("commit")
+    return (
+        task.get("status") == "DONE"
+        and isinstance(commit, dict)
+        and bool(str(commit.get("hash") or "").strip())
+        and bool(str(commit.get("message") or "").strip())
+    )
+
+
+class TaskIndex:
+    """SQLite mirror of the task READMEs used for filtered queries.
+
+    Rows are keyed by task directory and re-parsed only when the README's
+    mtime or size changes, so the READMEs stay the source of truth. Status
+    and owner are stored upper-cased; tags and depends_on live in their own
+    indexed tables. ``done`` marks tasks that satisfy dependents (DONE with a
+    recorded commit). ``warnings`` holds the row's depends_on problems as a
+    JSON list. ``task_text`` is an FTS5 table over the searchable text whose
+    rowid is the task row's key.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+
+    def connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_SCHEMA_VERSION:
+                with conn:
+                    for table in ("meta", "tasks", "task_tags", "task_deps", "task_text"):
+                        conn.execute(f"DROP TABLE IF EXISTS {table}")
+                    conn.executescript(INDEX_SCHEMA)
+                    conn.execute(f"PRAGMA user_version = {INDEX_SCHEMA_VERSION}")
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def refresh(
+        self,
+        root: Path,
+        read_task: Callable[[Path], dict[str, object] | None],
+        names: Iterable[str] | None = None,
+    ) -> int:
+        """Re-index READMEs added, changed or removed since the last refresh; returns the change count.
+
+        ``names`` limits the check to those task directories.
+        """
+        conn = self.connect()
+        if names is None:
+            rows = conn.execute("SELECT dir, mtime_ns, size FROM tasks")
+            entries = sorted(root.iterdir()) if root.exists() else []
+        else:
+            wanted = sorted(set(names))
+            rows = conn.execute(
+                "SELECT dir, mtime_ns, size FROM tasks WHERE dir IN (SELECT value FROM json_each(?))",
+                (json.dumps(wanted),),
+            )
+            entries = [root / name for name in wanted]
+        known = {row[0]: (row[1], row[2]) for row in rows}
+        seen: set[str] = set()
+        changed: list[tuple[str, Path, int, int]] = []
+        for entry in entries:
+            readme = entry / "README.md"
+            try:
+                stat = readme.stat()
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            seen.add(entry.name)
+            if known.get(entry.name) != (stat.st_mtime_ns, stat.st_size):
+                changed.append((entry.name, readme, stat.st_mtime_ns, stat.st_size))
+        removed = [name for name in known if name not in seen]
+        if not changed and not removed:
+            return 0
+        with conn:
+            for name in removed:
+                self._delete_dir(conn, name)
+            for name, readme, mtime_ns, size in changed:
+                self._delete_dir(conn, name)
+                self._insert(conn, name, mtime_ns, size, read_task(readme))
+            duplicate = conn.execute(
+                "SELECT id FROM tasks WHERE id != '' GROUP BY id HAVING count(*) > 1 LIMIT 1"
+            ).fetchone()
+            if duplicate:
+                raise ValueError(f"Duplicate task id in local backend: {duplicate[0]}")
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('generation', '1') "
+                "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+            )
+        return len(changed) + len(removed)
+
+    def _delete_dir(self, conn: sqlite3.Connection, name: str) -> None:
+        row = conn.execute("SELECT key, id FROM tasks WHERE dir = ?", (name,)).fetchone()
+        if row is None:
+            return
+        key, task_id = row
+        if task_id:
+            conn.execute("DELETE FROM task_tags WHERE task_id = ?", (task_id,))
+            conn.execute("DELETE FROM task_deps WHERE task_id = ?", (task_id,))
+        conn.execute("DELETE FROM task_text WHERE rowid = ?", (key,))
+        conn.execute("DELETE FROM tasks WHERE key = ?", (key,))
+
+    def _insert(
+        self, conn: sqlite3.Connection, name: str, mtime_ns: int, size: int, task: dict[str, object] | None
+    ) -> None:
+        columns = "dir, mtime_ns, size, id, status, owner, done, payload, warnings"
+        if task is None:
+            conn.execute(
+                f"INSERT INTO tasks ({columns}) VALUES (?, ?, ?, '', '', '', 0, NULL, NULL)",
+                (name, mtime_ns, size),
+            )
+            return
+        task_id = str(task.get("id") or "").strip()
+        warnings = _index_warnings(task_id, task.get("depends_on")) if task_id else []
+        cursor = conn.execute(
+            f"INSERT INTO tasks ({columns}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                name,
+                mtime_ns,
+                size,
+                task_id,
+                str(task.get("status") or "TODO").strip().upper(),
+                str(task.get("owner") or "").strip().upper(),
+                int(_index_done(task)),
+                json.dumps(task, ensure_ascii=False),
+                json.dumps(warnings, ensure_ascii=False) if warnings else None,
+            ),
+        )
+        if not task_id:
+            return
+        conn.execute(
+            "INSERT INTO task_text (rowid, title, description, doc, comments, tags, meta) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (cursor.lastrowid, *_index_text(task)),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO task_tags VALUES (?, ?)",
+            [(task_id, tag) for tag in _index_strings(task.get("tags"))],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO task_deps VALUES (?, ?, ?)",
+            [(task_id, pos, dep) for pos, dep in enumerate(_index_strings(task.get("depends_on")))],
+        )
+
+    def revision(self) -> str:
+        row = self.connect().execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+        return f"{self.path}:{row[0] if row else 0}"
+
+    def get_task(self, name: str) -> dict[str, object] | None:
+        row = self.connect().execute("SELECT payload FROM tasks WHERE dir = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row and row[0] else None
+
+    def list_tasks(self) -> list[dict[str, object]]:
+        rows = self.connect().execute("SELECT payload FROM tasks WHERE payload IS NOT NULL ORDER BY dir")
+        return [json.loads(row[0]) for row in rows]
+
+    def warnings(self) -> list[str]:
+        """Problems agentctl reports for the full task list, except dependency cycles.
+
+        Tasks without an id are named by their position in ``list_tasks``.
+        """
+        missing: list[str] = []
+        problems: list[str] = []
+        rows = self.connect().execute("SELECT id, warnings FROM tasks WHERE payload IS NOT NULL ORDER BY dir")
+        for position, (task_id, warnings) in enumerate(rows):
+            if not task_id:
+                missing.append(f"tasks[{position}] is missing a non-empty id")
+            elif warnings:
+                problems.extend(json.loads(warnings))
+        return missing + problems
+
+    def query_tasks(
+        self,
+        *,
+        ids: Iterable[str] | None = None,
+        statuses: Iterable[str] | None = None,
+        owners: Iterable[str] | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> list[dict[str, object]]:
+        """Tasks matching every given filter, ordered by id.
+
+        Statuses and owners match case-insensitively and tags exactly; a task
+        passes a filter when it matches any of the filter's values.
+        """
+        clauses, params = self._filter_clauses(ids, statuses, owners, tags)
+        sql = f"SELECT t.payload FROM tasks t WHERE {' AND '.join(clauses)} ORDER BY t.id"
+        return [json.loads(row[0]) for row in self.connect().execute(sql, params)]
+
+    def search_tasks(
+        self,
+        query: str,
+        *,
+        statuses: Iterable[str] | None = None,
+        owners: Iterable[str] | None = None,
+        tags: Iterable[str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, object]]:
+        """Tasks containing every word of ``query`` as a prefix, best bm25 match first.
+
+        Titles and tags weigh most, then descriptions and id/status/owner/commit
+        text, then docs and comments. Filters behave as in ``query_tasks``.
+        """
+        expression = search_expression(query)
+        if not expression:
+            return []
+        clauses, params = self._filter_clauses(None, statuses, owners, tags)
+        weights = ", ".join(str(weight) for weight in SEARCH_WEIGHTS)
+        sql = (
+            "SELECT t.payload FROM task_text JOIN tasks t ON t.key = task_text.rowid "
+            f"WHERE task_text MATCH ? AND {' AND '.join(clauses)} "
+            f"ORDER BY bm25(task_text, {weights}), t.id LIMIT ?"
+        )
+        limit_value = limit if limit is not None and limit >= 0 else -1
+        rows = self.connect().execute(sql, [expression, *params, limit_value])
+        return [json.loads(row[0]) for row in rows]
+
+    def _filter_clauses(
+        self,
+        ids: Iterable[str] | None,
+        statuses: Iterable[str] | None,
+        owners: Iterable[str] | None,
+        tags: Iterable[str] | None,
+    ) -> tuple[list[str], list[str]]:
+        clauses = ["t.payload IS NOT NULL", "t.id != ''"]
+        params: list[str] = []
+        if ids is not None:
+            clauses.append("t.id IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps(list(ids)))
+        if statuses:
+            clauses.append("t.status IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps([value.strip().upper() for value in statuses]))
+        if owners:
+            clauses.append("t.owner IN (SELECT value FROM json_each(?))")
+            params.append(json.dumps([value.strip().upper() for value in owners]))
+        if tags:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM task_tags g WHERE g.task_id = t.id "
+                "AND g.tag IN (SELECT value FROM json_each(?)))"
+            )
+            params.append(json.dumps([value.strip() for value in tags]))
+        return clauses, params
+
+    def dependency_graph(self) -> tuple[dict[str, list[str]], set[str]]:
+        """depends_on edges for every task (in declared order) and the ids of done tasks."""
+        conn = self.connect()
+        edges: dict[str, list[str]] = {}
+        done: set[str] = set()
+        for task_id, is_done in conn.execute("SELECT id, done FROM tasks WHERE id != '' ORDER BY id"):
+            edges[task_id] = []
+            if is_done:
+                done.add(task_id)
+        for task_id, dep_id in conn.execute("SELECT task_id, depends_on FROM task_deps ORDER BY task_id, position"):
+            edges[task_id].append(dep_id)
+        return edges, done
+
+    def dependency_state(self, task_ids: Iterable[str]) -> dict[str, dict[str, list[str]]]:
+        """depends_on plus its missing and incomplete entries for each given task."""
+        ids = list(task_ids)
+        state: dict[str, dict[str, list[str]]] = {
+            task_id: {"depends_on": [], "missing": [], "incomplete": []} for task_id in ids
+        }
+        rows = self.connect().execute(
+            "SELECT d.task_id, d.depends_on, u.id IS NULL, coalesce(u.done, 0) FROM task_deps d "
+            "LEFT JOIN tasks u ON u.id = d.depends_on "
+            "WHERE d.task_id IN (SELECT value FROM json_each(?)) ORDER BY d.task_id, d.position",
+            (json.dumps(ids),),
+        )
+        for task_id, dep_id, missing, done in rows:
+            info = state[task_id]
+            info["depends_on"].append(dep_id)
+            if missing:
+                info["missing"].append(dep_id)
+            elif not done:
+                info["incomplete"].append(dep_id)
+        for info in state.values():
+            info["missing"].sort()
+            info["incomplete"].sort()
+        return state
+
+
 class LocalBackend:
     def __init__(self, settings: dict[str, object] | None = None) -> None:
         raw_dir = (settings or {}).get("dir") if isinstance(settings, dict) else None
@@ -319,6 +701,8 @@ class LocalBackend:
             self.root = Path(str(raw_dir)).resolve()
         else:
             self.root = DEFAULT_TASKS_DIR.resolve()
+        raw_index = (settings or {}).get("index_path") if isinstance(settings, dict) else None
+        self.index = TaskIndex(Path(str(raw_index)).resolve()) if raw_index else None
 
     def task_dir(self, task_id: str) -> Path:
         return self.root / task_id
@@ -337,7 +721,30 @@ class LocalBackend:
                 return task_id
         raise RuntimeError("Failed to generate a unique task id")
 
+    def _read_task(self, readme: Path) -> dict[str, object] | None:
+        parsed = parse_frontmatter(readme.read_text(encoding="utf-8"))
+        if not parsed.frontmatter:
+            return None
+        task = dict(parsed.frontmatter)
+        task_id = str(task.get("id") or "").strip()
+        if task_id:
+            validate_task_id(task_id, source=readme)
+        doc = extract_task_doc(parsed.body)
+        if doc:
+            task["doc"] = doc
+        return task
+
+    def task_index(self) -> TaskIndex | None:
+        """The SQLite index brought up to date with the READMEs, or None when not configured."""
+        if self.index is None:
+            return None
+        self.index.refresh(self.root, self._read_task)
+        return self.index
+
     def list_tasks(self) -> list[dict[str, object]]:
+        index = self.task_index()
+        if index is not None:
+            return index.list_tasks()
         if not self.root.exists():
             return []
         tasks: list[dict[str, object]] = []
@@ -348,22 +755,28 @@ class LocalBackend:
             readme = entry / "README.md"
             if not readme.exists():
                 continue
-            parsed = parse_frontmatter(readme.read_text(encoding="utf-8"))
-            if parsed.frontmatter:
-                task = dict(parsed.frontmatter)
-                task_id = str(task.get("id") or "").strip()
-                if task_id:
-                    validate_task_id(task_id, source=readme)
-                    if task_id in seen_ids:
-                        raise ValueError(f"Duplicate task id in local backend: {task_id}")
-                    seen_ids.add(task_id)
-                doc = extract_task_doc(parsed.body)
-                if doc:
-                    task["doc"] = doc
-                tasks.append(task)
+            task = self._read_task(readme)
+            if task is None:
+                continue
+            task_id = str(task.get("id") or "").strip()
+            if task_id:
+                if task_id in seen_ids:
+                    raise ValueError(f"Duplicate task id in local backend: {task_id}")
+                seen_ids.add(task_id)
+            tasks.append(task)
         return tasks
 
+    def _indexed_task(self, task_id: str) -> dict[str, object] | None:
+        # Parsed README from the index, re-parsed only if this README changed since it was indexed.
+        if self.index is None:
+            return None
+        self.index.refresh(self.root, self._read_task, [task_id])
+        return self.index.get_task(task_id)
+
     def get_task(self, task_id: str) -> dict[str, object] | None:
+        cached = self._indexed_task(task_id)
+        if cached is not None:
+            return cached
         readme = self.task_readme_path(task_id)
         if not readme.exists():
             return None
@@ -375,6 +788,9 @@ class LocalBackend:
         return task
 
     def get_task_doc(self, task_id: str) -> str:
+        cached = self._indexed_task(task_id)
+        if cached is not None:
+            return str(cached.get("doc") or "")
         readme = self.task_readme_path(task_id)
         if not readme.exists():
             raise FileNotFoundError(f"Missing task README: {readme}")
@@ -392,8 +808,10 @@ class LocalBackend:
         body = ""
         existing_frontmatter: dict[str, object] = {}
         existing_doc = ""
+        existing_text: str | None = None
         if readme.exists():
-            parsed = parse_frontmatter(readme.read_text(encoding="utf-8"))
+            existing_text = readme.read_text(encoding="utf-8")
+            parsed = parse_frontmatter(existing_text)
             existing_frontmatter = dict(parsed.frontmatter or {})
             body = parsed.body
             existing_doc = extract_task_doc(parsed.body)
@@ -414,13 +832,14 @@ class LocalBackend:
         content = frontmatter_text + "\n"
         if body:
             content += body.lstrip("\n") + "\n"
-        readme.write_text(content, encoding="utf-8")
+        _write_text_if_changed(readme, content, existing_text)
 
     def set_task_doc(self, task_id: str, doc: str) -> None:
         readme = self.task_readme_path(task_id)
         if not readme.exists():
             raise FileNotFoundError(f"Missing task README: {readme}")
-        parsed = parse_frontmatter(readme.read_text(encoding="utf-8"))
+        existing_text = readme.read_text(encoding="utf-8")
+        parsed = parse_frontmatter(existing_text)
         doc_text = str(doc or "")
         body = merge_task_doc(parsed.body, doc_text)
         frontmatter = dict(parsed.frontmatter)
@@ -432,7 +851,7 @@ class LocalBackend:
         content = frontmatter_text + "\n"
         if body:
             content += body.lstrip("\n") + "\n"
-        readme.write_text(content, encoding="utf-8")
+        _write_text_if_changed(readme, content, existing_text)
 
     def touch_task_doc_metadata(self, task_id: str, *, updated_by: str | None = None) -> None:
         readme = self.task_readme_path(task_id)
@@ -462,9 +881,10 @@ class LocalBackend:
             "checksum_algo": "sha256",
             "checksum": hashlib.sha256(canonical).hexdigest(),
         }
-        output_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        _write_text_if_changed(output_path, json.dumps(payload, indent=2, ensure_ascii=False) + "\n")
 
     def normalize_tasks(self) -> int:
+        # write_task leaves READMEs that already match their formatted output untouched.
         tasks = self.list_tasks()
         self.write_tasks(tasks)
         return len(tasks)
@@ -2,21 +2,24 @@ from __future__ import annotations
 
 import difflib
 import hashlib
+import http.client
 import importlib.util
 import json
 import os
+import queue
 import re
 import secrets
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 UTC = timezone.utc
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
-from urllib import error as urlerror
 from urllib import parse as urlparse
-from urllib import request as urlrequest
 
 if TYPE_CHECKING:
     from types import ModuleType
@@ -25,6 +28,11 @@ JsonDict = dict[str, object]
 TaskRecord = dict[str, object]
 TaskList = list[TaskRecord]
 
+SYNC_STATE_FILENAME = ".redmine-sync.json"
+SYNC_STATE_VERSION = 1
+# Methods safe to resend when a reused connection fails after the request went out.
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
 
 def _ensure_task_list(value: object, *, label: str) -> TaskList:
     if not isinstance(value, list):
@@ -71,6 +79,119 @@ class RedmineUnavailable(RuntimeError):
     pass
 
 
+def _parse_retry_after(value: str | None, *, limit: float = 60.0) -> float | None:
+    if not value:
+        return None
+    raw = value.strip()
+    try:
+        seconds = float(raw)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(raw) - datetime.now(UTC)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), limit)
+
+
+class _RateLimiter:
+    """Space requests out after 429 responses and relax again as requests succeed.
+
+    Each throttled burst doubles the gap between requests once (concurrent 429s
+    for the same burst do not compound); successes shrink it slowly so the pace
+    settles just under the server's limit.
+    """
+
+    def __init__(self, min_interval: float = 0.0, max_interval: float = 5.0) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.next_at = 0.0
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self.next_at)
+            self.next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
+    def throttled(self, retry_after: float | None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now < self.paused_until:
+                return
+            self.interval = min(self.max_interval, max(self.interval * 2, 0.005))
+            self.paused_until = now + (retry_after if retry_after is not None else self.interval)
+            self.next_at = max(self.next_at, self.paused_until)
+
+    def succeeded(self) -> None:
+        with self._lock:
+            if self.interval > self.min_interval:
+                relaxed = self.interval * 0.98
+                self.interval = relaxed if relaxed > max(self.min_interval, 0.001) else self.min_interval
+
+
+class RedmineHttpClient:
+    """Keep-alive HTTP connections to one Redmine server, shared across threads."""
+
+    def __init__(self, base_url: str, *, pool_size: int = 4, timeout: float = 10.0, min_interval: float = 0.0) -> None:
+        parts = urlparse.urlsplit(base_url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"Unsupported Redmine url: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = max(1, pool_size)
+        self.limiter = _RateLimiter(min_interval)
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def request(
+        self, method: str, path: str, body: bytes | None, headers: dict[str, str]
+    ) -> tuple[int, http.client.HTTPMessage, bytes]:
+        try:
+            conn, reused = self._idle.get_nowait(), True
+        except queue.Empty:
+            conn, reused = self._connect(), False
+        while True:
+            sent = False
+            try:
+                conn.request(method, f"{self.base_path}/{path}", body=body, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                data = resp.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                # The server may have handled a sent POST before dropping the connection; resending
+                # it would create a duplicate issue.
+                if not reused or (sent and method not in IDEMPOTENT_METHODS):
+                    raise
+                # The server may have dropped an idle keep-alive connection; retry once on a fresh one.
+                conn, reused = self._connect(), False
+                continue
+            break
+        if resp.will_close or self._idle.qsize() >= self.pool_size:
+            conn.close()
+        else:
+            self._idle.put(conn)
+        return resp.status, resp.headers, data
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
 def now_iso_utc() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat()
 
@@ -116,14 +237,20 @@ class RedmineBackend:
         self.custom_fields = (
             cast(dict[str, object], custom_fields_value) if isinstance(custom_fields_value, dict) else {}
         )
-        self.batch_size = _coerce_int(settings.get("batch_size"), 20)
-        self.batch_pause = _coerce_float(settings.get("batch_pause"), 0.5)
+        self.concurrency = max(1, _coerce_int(settings.get("concurrency"), 4))
+        min_interval = _coerce_float(settings.get("min_interval"), 0.0)
         self.owner_agent = env_owner or str(settings.get("owner_agent") or "").strip() or "REDMINE"
         cache_dir = settings.get("cache_dir")
         self._issue_cache: dict[str, JsonDict] = {}
+        # Task ids a batch write confirmed are not in Redmine yet, so their lookup can be skipped.
+        self._absent_task_ids: set[str] = set()
+        self._sync_lock = threading.RLock()
+        # Issue snapshot + updated_on watermark for delta sync; needs the local cache dir.
+        self._sync_state_path = Path(str(cache_dir)) / SYNC_STATE_FILENAME if cache_dir else None
 
         if not self.base_url or not self.api_key or not self.project_id:
             raise ValueError("Redmine backend requires url, api_key, and project_id")
+        self._http = RedmineHttpClient(self.base_url, pool_size=self.concurrency, min_interval=min_interval)
 
         local_module = _load_local_backend_module()
         local_backend_cls = getattr(local_module, "LocalBackend", None)
@@ -169,13 +296,15 @@ class RedmineBackend:
 
     def list_tasks(self) -> TaskList:
         try:
-            tasks = self._list_tasks_remote()
+            tasks, changed, issues = self._refresh_remote()
         except RedmineUnavailable:
             if not self.cache:
                 raise
             return _ensure_task_list(self.cache.list_tasks(), label="cached tasks")
         for task in tasks:
-            self._cache_task(task, dirty=False)
+            if str(task.get("id") or "") in changed:
+                self._cache_task(task, dirty=False)
+        self._save_sync_state(issues)
         return tasks
 
     def export_tasks_json(self, output_path: Path) -> None:
@@ -333,7 +462,8 @@ class RedmineBackend:
                 )
             task["dirty"] = False
             self._cache_task(task, dirty=False)
-            self._issue_cache = {}
+            self._issue_cache.pop(task_id, None)
+            self._absent_task_ids.discard(task_id)
         except RedmineUnavailable:
             if not self.cache:
                 raise
@@ -341,10 +471,25 @@ class RedmineBackend:
             self._cache_task(task, dirty=True)
 
     def write_tasks(self, tasks: list[dict[str, object]]) -> None:
-        for index, task in enumerate(tasks, start=1):
-            self.write_task(task)
-            if self.batch_pause and self.batch_size > 0 and index % self.batch_size == 0:
-                time.sleep(self.batch_pause)
+        if len(tasks) > 1:
+            self._prefetch_issues(tasks)
+        workers = min(self.concurrency, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                self.write_task(task)
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() re-raises the first failure after every write has been attempted.
+            list(pool.map(self.write_task, tasks))
+
+    def _prefetch_issues(self, tasks: list[dict[str, object]]) -> None:
+        """Load the issue index once so each write skips its own lookup request."""
+        try:
+            self._list_tasks_remote()
+        except RedmineUnavailable:
+            return
+        task_ids = {str(task.get("id") or "").strip() for task in tasks}
+        self._absent_task_ids.update(task_id for task_id in task_ids if task_id and task_id not in self._issue_cache)
 
     def sync(
         self,
@@ -353,12 +498,13 @@ class RedmineBackend:
         *,
         quiet: bool = False,
         confirm: bool = False,
+        full: bool = False,
     ) -> None:
         if direction == "push":
             self._sync_push(conflict, quiet=quiet, confirm=confirm)
             return
         if direction == "pull":
-            self._sync_pull(conflict=conflict, quiet=quiet)
+            self._sync_pull(conflict=conflict, quiet=quiet, full=full)
             return
         raise ValueError(f"Unsupported direction: {direction}")
 
@@ -376,20 +522,18 @@ class RedmineBackend:
                 task_id = task.get("id")
                 print(f"- pending push: {task_id}")
             raise RuntimeError("Refusing to push without --yes (preview above)")
-        for index, task in enumerate(dirty, start=1):
-            self.write_task(task)
-            if self.batch_pause and self.batch_size > 0 and index % self.batch_size == 0:
-                time.sleep(self.batch_pause)
+        self.write_tasks(dirty)
         if not quiet:
             print(f"✅ pushed {len(dirty)} dirty task(s)")
 
-    def _sync_pull(self, conflict: str, quiet: bool) -> None:
+    def _sync_pull(self, conflict: str, quiet: bool, full: bool = False) -> None:
         if not self.cache:
             raise RuntimeError("Redmine cache is disabled; sync pull is unavailable")
         remote: dict[str, TaskRecord] = {}
-        for task in self._list_tasks_remote():
+        tasks, changed, issues = self._refresh_remote(full=full)
+        for task in tasks:
             task_id = str(task.get("id") or "").strip()
-            if not task_id:
+            if not task_id or task_id not in changed:
                 continue
             remote[task_id] = task
         local_tasks: dict[str, TaskRecord] = {}
@@ -408,6 +552,9 @@ class RedmineBackend:
                 self._cache_task(local_task, dirty=False)
                 continue
             self._cache_task(remote_task, dirty=False)
+        # Only advance the watermark once every changed task is applied, so a conflict
+        # that aborts the pull leaves those issues to be fetched again on the next run.
+        self._save_sync_state(issues)
         if not quiet:
             print(f"✅ pulled {len(remote)} task(s)")
 
@@ -460,13 +607,74 @@ class RedmineBackend:
                 return
         fields.append({"id": field_id, "value": value})
 
-    def _list_tasks_remote(self) -> TaskList:
-        tasks: TaskList = []
+    def _list_tasks_remote(self, *, full: bool = False) -> TaskList:
+        tasks, _changed, _issues = self._refresh_remote(full=full)
+        return tasks
+
+    def _refresh_remote(self, *, full: bool = False) -> tuple[TaskList, set[str], dict[str, JsonDict]]:
+        """Return all remote tasks, the ids that changed since the last saved state, and the new state.
+
+        Only issues with updated_on at or after the stored watermark are fetched;
+        a full listing happens on the first run, when the snapshot is unusable,
+        or when full=True (deleted issues only disappear on a full listing).
+        Nothing is persisted here: callers pass the returned issues to
+        _save_sync_state once the changed tasks are applied to the cache.
+        """
+        with self._sync_lock:
+            state = None if full else self._load_sync_state()
+            issues: dict[str, JsonDict] = {}
+            params: dict[str, object] = {}
+            if state is not None:
+                issues = cast(dict[str, JsonDict], state["issues"])
+                watermark = str(state.get("updated_on") or "")
+                if watermark:
+                    params = {"updated_on": f">={watermark}", "sort": "updated_on"}
+            fetched = self._fetch_issues(params)
+            for issue in fetched:
+                issues[str(issue.get("id"))] = issue
+            ordered = sorted(issues.values(), key=lambda issue: _coerce_int(issue.get("id"), 0), reverse=True)
+            tasks = self._tasks_from_issues(ordered)
+            task_id_field_id = self._task_id_field_id()
+            changed = {str(self._custom_field_value(issue, task_id_field_id) or "") for issue in fetched}
+            return tasks, changed, issues
+
+    def _load_sync_state(self) -> JsonDict | None:
+        path = self._sync_state_path
+        if path is None or not path.exists():
+            return None
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(state, dict) or state.get("version") != SYNC_STATE_VERSION:
+            return None
+        if state.get("url") != self.base_url or state.get("project_id") != self.project_id:
+            return None
+        if not isinstance(state.get("issues"), dict):
+            return None
+        return cast(JsonDict, state)
+
+    def _save_sync_state(self, issues: dict[str, JsonDict]) -> None:
+        path = self._sync_state_path
+        if path is None:
+            return
+        stamps = [str(issue.get("updated_on") or "") for issue in issues.values()]
+        state: JsonDict = {
+            "version": SYNC_STATE_VERSION,
+            "url": self.base_url,
+            "project_id": self.project_id,
+            "updated_on": max(stamps, default=""),
+            "issues": issues,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _fetch_issues(self, filters: dict[str, object]) -> list[JsonDict]:
         all_issues: list[JsonDict] = []
         offset = 0
         limit = 100
-        task_id_field_id = self._task_id_field_id()
-        self._issue_cache = {}
         while True:
             payload = self._request_json(
                 "GET",
@@ -476,6 +684,7 @@ class RedmineBackend:
                     "limit": limit,
                     "offset": offset,
                     "status_id": "*",
+                    **filters,
                 },
             )
             page_issues = payload.get("issues")
@@ -488,6 +697,12 @@ class RedmineBackend:
             if total_int == 0 or offset + limit >= total_int:
                 break
             offset += limit
+        return all_issues
+
+    def _tasks_from_issues(self, all_issues: list[JsonDict]) -> TaskList:
+        tasks: TaskList = []
+        task_id_field_id = self._task_id_field_id()
+        issue_cache: dict[str, JsonDict] = {}
         existing_ids: set[str] = set()
         duplicates: set[str] = set()
         for issue in all_issues:
@@ -509,8 +724,10 @@ class RedmineBackend:
                 continue
             task = self._issue_to_task(issue, task_id_override=str(task_id))
             if task:
-                self._issue_cache[str(task.get("id"))] = issue
+                issue_cache[str(task.get("id"))] = issue
                 tasks.append(task)
+        # Swap in the new index whole so concurrent writers never see it half-built.
+        self._issue_cache = issue_cache
         return tasks
 
     def _issue_from_payload(self, payload: JsonDict) -> JsonDict | None:
@@ -524,6 +741,8 @@ class RedmineBackend:
         cached = self._issue_cache.get(task_id_str)
         if isinstance(cached, dict):
             return cached
+        if task_id_str in self._absent_task_ids:
+            return None
 
         task_field = self._task_id_field_id()
         payload = self._request_json(
@@ -772,37 +991,39 @@ class RedmineBackend:
         *,
         attempts: int = 3,
         backoff: float = 0.5,
+        throttle_attempts: int = 8,
     ) -> dict[str, object]:
-        url = f"{self.base_url}/{path.lstrip('/')}"
+        target = path.lstrip("/")
         if params:
-            url += "?" + urlparse.urlencode(params)
+            target += "?" + urlparse.urlencode(params)
         request_data = json.dumps(payload).encode("utf-8") if payload else None
-        req = urlrequest.Request(
-            url,
-            data=request_data,
-            method=method,
-            headers={
-                "Content-Type": "application/json",
-                "X-Redmine-API-Key": self.api_key,
-            },
-        )
+        headers = {"Content-Type": "application/json", "X-Redmine-API-Key": self.api_key}
         raw: bytes = b""
-        for attempt in range(1, max(1, attempts) + 1):
+        failures = 0
+        throttles = 0
+        while True:
+            self._http.limiter.wait()
             try:
-                with urlrequest.urlopen(req, timeout=10) as resp:
-                    raw = resp.read()
-                break
-            except urlerror.HTTPError as exc:
-                body = exc.read().decode("utf-8", errors="replace") if exc.fp else str(exc)
-                if (exc.code == 429 or 500 <= exc.code < 600) and attempt < attempts:
-                    time.sleep(backoff * attempt)
-                    continue
-                raise RuntimeError(f"Redmine API error: {exc.code} {body}") from exc
-            except urlerror.URLError as exc:
-                if attempt >= attempts:
+                status, response_headers, raw = self._http.request(method, target, request_data, headers)
+            except (http.client.HTTPException, OSError) as exc:
+                failures += 1
+                if failures >= max(1, attempts):
                     raise RedmineUnavailable("Redmine unavailable") from exc
-                time.sleep(backoff * attempt)
+                time.sleep(backoff * failures)
+                continue
+            if status == 429 and throttles < throttle_attempts:
+                throttles += 1
+                self._http.limiter.throttled(_parse_retry_after(response_headers.get("Retry-After")))
+                continue
+            if 500 <= status < 600 and failures + 1 < attempts:
+                failures += 1
+                time.sleep(backoff * failures)
                 continue
+            if status >= 400:
+                body = raw.decode("utf-8", errors="replace")
+                raise RuntimeError(f"Redmine API error: {status} {body}")
+            self._http.limiter.succeeded()
+            break
         if not raw:
             return {}
         try:
@@ -4,9 +4,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import importlib.util
 import json
+import logging
+import os
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any
 
@@ -15,7 +22,27 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
-app = FastAPI(title="SEO-SWARM API", version="1.0.0")
+try:
+    from watchfiles import awatch
+except ImportError:  # installed with uvicorn[standard]; poll the backend without it
+    awatch = None
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    watcher = asyncio.create_task(feed.watch())
+    try:
+        yield
+    finally:
+        watcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await watcher
+        feed.close()
+
+
+app = FastAPI(title="SEO-SWARM API", version="1.0.0", lifespan=lifespan)
 
 # CORS middleware for development
 app.add_middleware(
@@ -33,6 +60,13 @@ AGENTS_DIR = PROJECT_ROOT / ".codex-swarm" / "agents"
 CONFIG_PATH = PROJECT_ROOT / ".codex-swarm" / "config.json"
 TASKS_PATH = PROJECT_ROOT / ".codex-swarm" / "tasks.json"
 
+# Backend settings that agentctl resolves against the repo root (it always runs from there).
+BACKEND_PATH_SETTINGS = ("dir", "index_path", "cache_dir")
+# How often to reload tasks while dashboards are connected: local task files without
+# file watching, and remote backends (e.g. Redmine), where each reload is an HTTP sync.
+TASK_POLL_SECONDS = float(os.environ.get("SWARM_TASK_POLL_SECONDS", "2"))
+REMOTE_TASK_POLL_SECONDS = float(os.environ.get("SWARM_REMOTE_TASK_POLL_SECONDS", "60"))
+
 
 # Pydantic models
 class ClientOnboard(BaseModel):
@@ -68,25 +102,173 @@ class ConfigUpdate(BaseModel):
 class ConnectionManager:
     def __init__(self):
         self.active_connections: list[WebSocket] = []
+        # Set while at least one client is connected; the task poller waits on it.
+        self.viewers = asyncio.Event()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         self.active_connections.append(websocket)
+        self.viewers.set()
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+        if not self.active_connections:
+            self.viewers.clear()
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                pass
+        """Send to every client at once so one slow viewer does not hold up the rest."""
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_json(message) for connection in connections),
+            return_exceptions=True,
+        )
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 manager = ConnectionManager()
 
 
+def load_env_file(path: Path) -> None:
+    """Load KEY=VALUE lines into os.environ like agentctl does, keeping variables already set."""
+    if not path.exists():
+        return
+    for raw_line in path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export ") :].lstrip()
+        if "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        key = key.strip()
+        if not key or key in os.environ:
+            continue
+        value = value.strip()
+        if value and value[0] == value[-1] and value[0] in ('"', "'"):
+            value = value[1:-1]
+        os.environ[key] = value
+
+
+def load_task_backend() -> Any | None:
+    """Instantiate the tasks backend agentctl is configured with, in this process."""
+    # Backends such as Redmine read their credentials from the repo .env, as under agentctl.
+    load_env_file(PROJECT_ROOT / ".env")
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    backend_ref = (config.get("tasks_backend") or {}).get("config_path")
+    if not backend_ref:
+        return None
+    backend_path = PROJECT_ROOT / backend_ref
+    backend_config = json.loads(backend_path.read_text(encoding="utf-8"))
+    module_path = backend_path.parent / backend_config["module"]
+    spec = importlib.util.spec_from_file_location(f"codexswarm_backend_{backend_config['id']}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    settings = dict(backend_config.get("settings") or {})
+    for key in BACKEND_PATH_SETTINGS:
+        value = settings.get(key)
+        if isinstance(value, str) and value and not Path(value).is_absolute():
+            settings[key] = str(PROJECT_ROOT / value)
+    return getattr(module, backend_config["class"])(settings)
+
+
+def diff_tasks(old: dict[str, dict[str, Any]], new: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Added/updated tasks and removed ids between two snapshots; empty when nothing changed."""
+    added = [task for task_id, task in new.items() if task_id not in old]
+    updated = [task for task_id, task in new.items() if task_id in old and old[task_id] != task]
+    removed = [task_id for task_id in old if task_id not in new]
+    if not (added or updated or removed):
+        return {}
+    return {"added": added, "updated": updated, "removed": removed}
+
+
+class TaskFeed:
+    """Task snapshot shared by all requests and pushed to WebSocket clients as diffs.
+
+    Backend reads run on one worker thread (backends are not thread-safe) so the event
+    loop never blocks on them; requests are answered from the last snapshot.
+    """
+
+    def __init__(self) -> None:
+        self.backend: Any | None = None
+        self.tasks: dict[str, dict[str, Any]] = {}
+        self.revision = 0
+        self.loaded = False
+        self.loaded_at = 0.0
+        self._lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-feed")
+
+    def _load(self) -> list[dict[str, Any]]:
+        if self.backend is None:
+            self.backend = load_task_backend()
+        if self.backend is not None:
+            return list(self.backend.list_tasks())
+        if TASKS_PATH.exists():
+            return json.loads(TASKS_PATH.read_text(encoding="utf-8")).get("tasks", [])
+        return []
+
+    async def refresh(self) -> dict[str, Any]:
+        """Reload tasks and broadcast what changed since the previous snapshot."""
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            tasks = await loop.run_in_executor(self._executor, self._load)
+            current = {str(task["id"]): task for task in tasks if task.get("id")}
+            diff = diff_tasks(self.tasks, current)
+            self.tasks = current
+            self.loaded = True
+            self.loaded_at = time.monotonic()
+            if diff:
+                self.revision += 1
+        if diff:
+            await manager.broadcast({"type": "tasks_changed", "revision": self.revision, **diff})
+        return diff
+
+    def poll_interval(self) -> float:
+        if getattr(self.backend, "root", None) is None:
+            return REMOTE_TASK_POLL_SECONDS
+        return TASK_POLL_SECONDS
+
+    async def snapshot(self) -> list[dict[str, Any]]:
+        """Current tasks; reloaded on demand when no connected viewer keeps the poller running."""
+        stale = time.monotonic() - self.loaded_at > self.poll_interval()
+        if not self.loaded or (stale and not manager.active_connections):
+            await self.refresh()
+        return list(self.tasks.values())
+
+    async def snapshot_message(self) -> dict[str, Any]:
+        tasks = await self.snapshot()
+        return {"type": "tasks_snapshot", "revision": self.revision, "tasks": tasks}
+
+    async def _refresh_logged(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("Failed to reload tasks")
+
+    async def watch(self) -> None:
+        """Reload whenever a task README changes; otherwise poll, but only while viewers are connected."""
+        await self._refresh_logged()
+        root = getattr(self.backend, "root", None)
+        if awatch is not None and root is not None and Path(root).is_dir():
+            async for _changes in awatch(root, watch_filter=lambda _change, path: Path(path).name == "README.md"):
+                await self._refresh_logged()
+        while True:
+            await manager.viewers.wait()
+            await asyncio.sleep(self.poll_interval())
+            if manager.active_connections:
+                await self._refresh_logged()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+feed = TaskFeed()
+
+
 def run_agentctl(args: list[str]) -> dict[str, Any]:
     """Run agentctl.py and return parsed output."""
     cmd = [sys.executable, str(AGENTCTL_PATH)] + args
@@ -147,7 +329,7 @@ async def health_check():
 
 # Config endpoints
 @app.get("/api/config")
-async def get_config():
+def get_config():
     """Get current configuration."""
     try:
         if not CONFIG_PATH.exists():
@@ -165,7 +347,7 @@ async def update_config(update: ConfigUpdate):
     if update.is_json:
         args.append("--json")
     
-    result = run_agentctl(args)
+    result = await asyncio.to_thread(run_agentctl, args)
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["stderr"])
     
@@ -175,7 +357,7 @@ async def update_config(update: ConfigUpdate):
 
 # Agent endpoints
 @app.get("/api/agents")
-async def list_agents():
+def list_agents():
     """List all available agents."""
     try:
         if not AGENTS_DIR.exists():
@@ -199,7 +381,7 @@ async def list_agents():
 
 
 @app.get("/api/agents/{agent_name}")
-async def get_agent(agent_name: str):
+def get_agent(agent_name: str):
     """Get specific agent details."""
     try:
         agent_file = AGENTS_DIR / f"{agent_name}.json"
@@ -218,29 +400,22 @@ async def get_agent(agent_name: str):
 @app.get("/api/tasks")
 async def list_tasks():
     """List all tasks."""
-    result = run_agentctl(["task", "list", "--json"])
-    if not result["success"]:
-        raise HTTPException(status_code=500, detail=result["stderr"])
-    
     try:
-        # Parse JSON from stdout
-        tasks_data = json.loads(result["stdout"]) if result["stdout"].strip() else {"tasks": []}
-        return tasks_data
-    except json.JSONDecodeError:
-        # Fallback to reading tasks.json directly
-        if TASKS_PATH.exists():
-            return json.loads(TASKS_PATH.read_text())
-        return {"tasks": []}
+        tasks = await feed.snapshot()
+        return {"tasks": tasks, "revision": feed.revision}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/tasks/{task_id}")
 async def get_task(task_id: str):
     """Get specific task details."""
-    result = run_agentctl(["task", "show", task_id])
-    if not result["success"]:
+    await feed.snapshot()
+    task = feed.tasks.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
     
-    return {"task_id": task_id, "output": result["stdout"]}
+    return {"task_id": task_id, "task": task}
 
 
 @app.post("/api/tasks")
@@ -254,11 +429,12 @@ async def create_task(task: TaskCreate):
         "--owner", task.owner,
     ]
     
-    result = run_agentctl(args)
+    result = await asyncio.to_thread(run_agentctl, args)
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["stderr"])
     
     await manager.broadcast({"type": "task_created", "output": result["stdout"]})
+    await feed.refresh()
     return result
 
 
@@ -276,29 +452,31 @@ async def update_task(task_id: str, task: TaskUpdate):
     if task.owner:
         args.extend(["--owner", task.owner])
     
-    result = run_agentctl(args)
+    result = await asyncio.to_thread(run_agentctl, args)
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["stderr"])
     
     await manager.broadcast({"type": "task_updated", "task_id": task_id})
+    await feed.refresh()
     return result
 
 
 @app.post("/api/tasks/{task_id}/start")
 async def start_task(task_id: str):
     """Mark task as started."""
-    result = run_agentctl(["start", task_id, "--author", "USER", "--body", "Started via UI"])
+    result = await asyncio.to_thread(run_agentctl, ["start", task_id, "--author", "USER", "--body", "Started via UI"])
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["stderr"])
     
     await manager.broadcast({"type": "task_started", "task_id": task_id})
+    await feed.refresh()
     return result
 
 
 @app.post("/api/tasks/{task_id}/finish")
 async def finish_task(task_id: str, commit: str, author: str = "USER"):
     """Mark task as finished."""
-    result = run_agentctl([
+    result = await asyncio.to_thread(run_agentctl, [
         "finish", task_id,
         "--commit", commit,
         "--author", author,
@@ -308,6 +486,7 @@ async def finish_task(task_id: str, commit: str, author: str = "USER"):
         raise HTTPException(status_code=400, detail=result["stderr"])
     
     await manager.broadcast({"type": "task_finished", "task_id": task_id})
+    await feed.refresh()
     return result
 
 
@@ -325,7 +504,7 @@ async def onboard_client(client: ClientOnboard):
     if client.website:
         args.extend(["--site-url", client.website])
     
-    result = run_script(script_path, args)
+    result = await asyncio.to_thread(run_script, script_path, args)
     if not result["success"]:
         raise HTTPException(status_code=400, detail=result["stderr"])
     
@@ -334,7 +513,7 @@ async def onboard_client(client: ClientOnboard):
 
 
 @app.get("/api/clients")
-async def list_clients():
+def list_clients():
     """List all clients."""
     try:
         outputs_dir = PROJECT_ROOT / "data" / "outputs"
@@ -357,7 +536,7 @@ async def list_clients():
 
 
 @app.get("/api/clients/{slug}/outputs")
-async def get_client_outputs(slug: str):
+def get_client_outputs(slug: str):
     """Get all outputs for a client."""
     try:
         client_dir = PROJECT_ROOT / "data" / "outputs" / slug
@@ -396,12 +575,16 @@ async def get_client_outputs(slug: str):
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
+        # New viewers get the full task list once; afterwards they receive tasks_changed diffs.
+        await websocket.send_json(await feed.snapshot_message())
         while True:
-            # Keep connection alive and handle incoming messages
             data = await websocket.receive_text()
-            # Echo back for testing
-            await websocket.send_json({"type": "echo", "message": data})
+            if data == "resync":
+                await websocket.send_json(await feed.snapshot_message())
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Also on snapshot errors, so a dead socket does not keep the task poller running.
         manager.disconnect(websocket)
 
 
@@ -27,6 +27,11 @@ export interface Task {
   updated_at?: string
 }
 
+export interface TaskList {
+  tasks: Task[]
+  revision?: number
+}
+
 export interface Client {
   slug: string
   has_inputs: boolean
@@ -51,7 +56,7 @@ export const listAgents = () => api.get<{ agents: Agent[] }>('/agents')
 
 export const getAgent = (name: string) => api.get<{ agent: any }>(`/agents/${name}`)
 
-export const listTasks = () => api.get<{ tasks: Task[] }>('/tasks')
+export const listTasks = () => api.get<TaskList>('/tasks')
 
 export const getTask = (id: string) => api.get(`/tasks/${id}`)
 
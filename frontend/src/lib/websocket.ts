@@ -1,9 +1,34 @@
 import { useEffect, useRef } from 'react'
+import { useQueryClient } from '@tanstack/react-query'
 import { useAppStore } from './store'
+import { Task, TaskList } from './api'
 import toast from 'react-hot-toast'
 
+interface TaskDiff {
+  revision: number
+  added: Task[]
+  updated: Task[]
+  removed: string[]
+}
+
+function applyTaskDiff(current: TaskList, diff: TaskDiff): TaskList {
+  // A snapshot taken between a reload and its broadcast already holds that diff
+  if (current.revision !== undefined && diff.revision <= current.revision) {
+    return current
+  }
+  const removed = new Set(diff.removed)
+  const changed = new Map([...diff.added, ...diff.updated].map((task) => [task.id, task]))
+  const present = new Set(current.tasks.map((task) => task.id))
+  const next = current.tasks
+    .filter((task) => !removed.has(task.id))
+    .map((task) => changed.get(task.id) ?? task)
+  const appended = [...changed.values()].filter((task) => !present.has(task.id))
+  return { tasks: [...next, ...appended], revision: diff.revision }
+}
+
 export function useWebSocket() {
   const wsRef = useRef<WebSocket | null>(null)
+  const queryClient = useQueryClient()
   const { setWsConnected, addNotification } = useAppStore()
 
   useEffect(() => {
@@ -19,6 +44,19 @@ export function useWebSocket() {
     ws.onmessage = (event) => {
       try {
         const message = JSON.parse(event.data)
+
+        // Task snapshots and diffs keep the ['tasks'] query current without refetching
+        if (message.type === 'tasks_snapshot') {
+          queryClient.setQueryData<TaskList>(['tasks'], { tasks: message.tasks, revision: message.revision })
+          return
+        }
+        if (message.type === 'tasks_changed') {
+          queryClient.setQueryData<TaskList>(['tasks'], (current) =>
+            current ? applyTaskDiff(current, message) : current
+          )
+          return
+        }
+
         addNotification(message)
 
         // Show toast notifications for certain events
@@ -49,7 +87,7 @@ export function useWebSocket() {
     return () => {
       ws.close()
     }
-  }, [setWsConnected, addNotification])
+  }, [setWsConnected, addNotification, queryClient])
 
   return wsRef.current
 }
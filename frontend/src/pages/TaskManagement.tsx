@@ -24,7 +24,6 @@ export default function TaskManagement() {
   const { data: tasksData, isLoading } = useQuery({
     queryKey: ['tasks'],
     queryFn: () => listTasks().then(res => res.data),
-    refetchInterval: 10000, // Refetch every 10 seconds
   })
 
   const createMutation = useMutation({
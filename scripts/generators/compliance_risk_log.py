@@ -5,7 +5,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import re
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -16,17 +15,18 @@ VALIDATION_DIR = Path(__file__).resolve().parents[1] / "validation"
 if str(VALIDATION_DIR) not in sys.path:
     sys.path.append(str(VALIDATION_DIR))
 
+from compliance_matcher import CLAIM_RE, PLACEHOLDER_RE, SOURCE_RE, TODO_RE, LineScanner
 from draft_compliance_lint import iter_markdown_files, parse_nap
 
 
-PLACEHOLDER_RE = re.compile(r"\[[^\]]+\](?!\()")
-TODO_RE = re.compile(r"\b(TODO|TBD|PLACEHOLDER|FIXME|TK)\b", re.IGNORECASE)
-CLAIM_RE = re.compile(
-    r"\b(best|top[- ]?rated|#1|number one|award[- ]?winning|guaranteed|guarantee|"
-    r"certified|licensed|insured|bonded)\b",
-    re.IGNORECASE,
+LINE_SCANNER = LineScanner(
+    {
+        "placeholder": PLACEHOLDER_RE,
+        "todo": TODO_RE,
+        "claim": CLAIM_RE,
+        "missing_source": SOURCE_RE,
+    }
 )
-SOURCE_RE = re.compile(r"\b(source needed|citation needed|\[source\]|source:\s*\[)\b", re.IGNORECASE)
 
 
 @dataclass
@@ -44,15 +44,9 @@ def now_iso() -> str:
 def lint_file(path: Path, nap: dict[str, str] | None = None) -> list[Issue]:
     issues: list[Issue] = []
     content = path.read_text(encoding="utf-8")
-    for idx, line in enumerate(content.splitlines(), start=1):
-        if PLACEHOLDER_RE.search(line):
-            issues.append(Issue(file=str(path), line=idx, kind="placeholder", text=line.strip()))
-        if TODO_RE.search(line):
-            issues.append(Issue(file=str(path), line=idx, kind="todo", text=line.strip()))
-        if CLAIM_RE.search(line):
-            issues.append(Issue(file=str(path), line=idx, kind="claim", text=line.strip()))
-        if SOURCE_RE.search(line):
-            issues.append(Issue(file=str(path), line=idx, kind="missing_source", text=line.strip()))
+    for idx, line, kinds in LINE_SCANNER.scan(content):
+        for kind in kinds:
+            issues.append(Issue(file=str(path), line=idx, kind=kind, text=line.strip()))
     if nap:
         if nap.get("business_name") and nap["business_name"] not in content:
             issues.append(
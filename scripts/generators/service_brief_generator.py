@@ -2,7 +2,9 @@
 """Generate service briefs from cached site HTML snapshots.
 
 Reads data/outputs/<client>/reports/site-cache/index.json and extracts
-service page information without additional live requests.
+service page information without additional live requests. When
+reports/link-equity.json exists (scripts/ingest/site_link_graph.py), each brief
+also gets the page's internal PageRank and click depth.
 """
 
 from __future__ import annotations
@@ -335,7 +337,28 @@ def load_cache(index_path: Path) -> dict[str, Path]:
     return {url: Path(meta["path"]) for url, meta in data.items()}
 
 
-def render_brief(brief: ServiceBrief) -> str:
+def load_link_equity(path: Path) -> dict[str, dict]:
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {page["url"]: page for page in data.get("pages", []) if page.get("url")}
+
+
+def render_link_equity(equity: dict, total: int) -> list[str]:
+    lines: list[str] = []
+    lines.append("## Internal link equity")
+    lines.append(f"- PageRank score: {equity.get('score')} (1.0 = site average)")
+    lines.append(f"- Equity rank: {equity.get('rank')} of {total} cached pages")
+    depth = equity.get("depth")
+    lines.append(f"- Click depth from homepage: {'unreachable' if depth is None else depth}")
+    lines.append(f"- Inbound internal links: {equity.get('inbound')}")
+    if equity.get("needs_links"):
+        lines.append("- Priority: add internal links from higher-equity pages")
+    lines.append("")
+    return lines
+
+
+def render_brief(brief: ServiceBrief, equity: dict | None = None, equity_total: int = 0) -> str:
     lines: list[str] = []
     lines.append(f"# Service Brief: {brief.h1 or brief.title}")
     lines.append("")
@@ -401,6 +424,8 @@ def render_brief(brief: ServiceBrief) -> str:
     if not brief.internal_links:
         lines.append("- [No internal links detected]")
     lines.append("")
+    if equity:
+        lines.extend(render_link_equity(equity, equity_total))
     lines.append("## Schema types (detected)")
     for schema_type in brief.schema_types:
         lines.append(f"- {schema_type}")
@@ -429,6 +454,7 @@ def main() -> None:
         raise SystemExit(f"Cache index not found: {index_path}")
 
     cache = load_cache(index_path)
+    equity = load_link_equity(cache_dir.parent / "link-equity.json")
     out_dir = Path("data") / "outputs" / args.client_slug / "reports" / "service-briefs"
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -442,7 +468,7 @@ def main() -> None:
             slug = "index"
         out_path = out_dir / f"{slug}.md"
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.write_text(render_brief(brief), encoding="utf-8")
+        out_path.write_text(render_brief(brief, equity.get(url), len(equity)), encoding="utf-8")
         print(f"wrote {out_path}")
 
 
@@ -4,33 +4,21 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+INGEST_DIR = Path(__file__).resolve().parent
+if str(INGEST_DIR) not in sys.path:
+    sys.path.append(str(INGEST_DIR))
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
-
+from export_reader import iter_rows, load_csv  # noqa: E402,F401
 
-def normalize_header(value: str) -> str:
-    return value.strip().lower().replace(" ", "_")
 
-
-def load_csv(path: Path) -> list[dict[str, str]]:
-    try:
-        with path.open(encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if not reader.fieldnames:
-                raise SystemExit(f"CSV has no headers: {path}")
-            rows: list[dict[str, str]] = []
-            for row in reader:
-                rows.append({normalize_header(k): (v or "").strip() for k, v in row.items()})
-            return rows
-    except FileNotFoundError as exc:
-        raise SystemExit(f"CSV not found: {path}") from exc
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def pick_value(row: dict[str, Any], keys: Iterable[str]) -> str:
@@ -41,7 +29,7 @@ def pick_value(row: dict[str, Any], keys: Iterable[str]) -> str:
     return ""
 
 
-def build_citations(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def build_citations(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
     citations: list[dict[str, Any]] = []
     for row in rows:
         platform = pick_value(row, ("platform", "directory", "listing", "site"))
@@ -65,7 +53,12 @@ def build_citations(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Convert citation audit export CSV into input JSON.")
     parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
-    parser.add_argument("--input", required=True, help="Path to citation audit CSV.")
+    parser.add_argument("--input", required=True, help="Path to citation audit export (CSV or XLSX).")
+    parser.add_argument(
+        "--sheet",
+        default=None,
+        help="XLSX sheet to read (default: every sheet sharing the first sheet's header).",
+    )
     parser.add_argument("--client-name", default=None, help="Client display name override.")
     parser.add_argument("--client-website", default=None, help="Client website override.")
     parser.add_argument(
@@ -79,8 +72,7 @@ def main() -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = Path(args.output) if args.output else output_dir / "citation-log-input.json"
 
-    rows = load_csv(Path(args.input))
-    citations = build_citations(rows)
+    citations = build_citations(iter_rows(Path(args.input), sheet=args.sheet))
     if not citations:
         raise SystemExit("No valid citation entries found in export.")
 
@@ -4,13 +4,27 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
+import sys
 from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+INGEST_DIR = Path(__file__).resolve().parent
+if str(INGEST_DIR) not in sys.path:
+    sys.path.append(str(INGEST_DIR))
+
+from export_reader import (  # noqa: E402
+    DEFAULT_CHUNK_ROWS,
+    ColumnBatch,
+    ExportSpec,
+    JsonRowsWriter,
+    iter_batches,
+    load_csv,
+    parse_int,
+)
+
 
 ALIASES = {
     "url": ["url", "address", "page"],
@@ -22,38 +36,11 @@ ALIASES = {
 }
 
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
-
-
-def normalize_header(value: str) -> str:
-    return value.strip().lower().replace(" ", "_")
-
+EXPORT_SPEC = ExportSpec(aliases=ALIASES, types={"status_code": "int", "word_count": "int"})
 
-def parse_int(value: str) -> int | None:
-    if value is None:
-        return None
-    value = value.strip()
-    if not value:
-        return None
-    try:
-        return int(float(value))
-    except ValueError:
-        return None
 
-
-def load_csv(path: Path) -> list[dict[str, str]]:
-    try:
-        with path.open(encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if not reader.fieldnames:
-                raise SystemExit(f"CSV has no headers: {path}")
-            rows: list[dict[str, str]] = []
-            for row in reader:
-                rows.append({normalize_header(k): (v or "").strip() for k, v in row.items()})
-            return rows
-    except FileNotFoundError as exc:
-        raise SystemExit(f"CSV not found: {path}") from exc
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def pick_value(row: dict[str, str], keys: list[str]) -> str:
@@ -80,21 +67,38 @@ def normalize_rows(rows: list[dict[str, str]]) -> list[dict[str, Any]]:
     return normalized
 
 
-def build_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    status_counts: dict[str, int] = defaultdict(int)
+def batch_rows(batch: ColumnBatch) -> list[dict[str, Any]]:
+    return [row for row in batch.rows() if row["url"]]
+
+
+def count_statuses(rows: list[dict[str, Any]], status_counts: dict[str, int] | None = None) -> dict[str, int]:
+    status_counts = status_counts if status_counts is not None else defaultdict(int)
     for row in rows:
         status_counts[str(row.get("status_code") or 0)] += 1
+    return status_counts
+
+
+def render_summary(status_counts: dict[str, int], total_urls: int) -> dict[str, Any]:
     return {
         "generated_at": now_iso(),
         "status_counts": dict(status_counts),
-        "total_urls": len(rows),
+        "total_urls": total_urls,
     }
 
 
+def build_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return render_summary(count_statuses(rows), len(rows))
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Convert crawl export CSV into JSON.")
     parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
-    parser.add_argument("--input", required=True, help="Path to crawl export CSV.")
+    parser.add_argument("--input", required=True, help="Path to crawl export (CSV or XLSX).")
+    parser.add_argument(
+        "--sheet",
+        default=None,
+        help="XLSX sheet to read (default: every sheet sharing the first sheet's header).",
+    )
     parser.add_argument(
         "--output",
         default=None,
@@ -105,26 +109,32 @@ def main() -> None:
         action="store_true",
         help="Write crawl-summary.json with status counts.",
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help=f"Rows per processing chunk (default: {DEFAULT_CHUNK_ROWS}).",
+    )
     args = parser.parse_args()
 
     output_dir = Path("data") / "outputs" / args.client_slug / "reports"
     output_dir.mkdir(parents=True, exist_ok=True)
     output_path = Path(args.output) if args.output else output_dir / "crawl-export.json"
 
-    rows = normalize_rows(load_csv(Path(args.input)))
-    if not rows:
-        raise SystemExit("No crawl rows found in export.")
-
-    payload = {
-        "exported_at": now_iso(),
-        "rows": rows,
-    }
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    status_counts: dict[str, int] = defaultdict(int)
+    with JsonRowsWriter(output_path, {"exported_at": now_iso()}) as writer:
+        for batch in iter_batches(Path(args.input), EXPORT_SPEC, args.chunk_size, args.sheet):
+            rows = batch_rows(batch)
+            writer.write(rows)
+            count_statuses(rows, status_counts)
+        if not writer.count:
+            raise SystemExit("No crawl rows found in export.")
     print(f"wrote {output_path}")
 
     if args.summary:
         summary_path = output_dir / "crawl-summary.json"
-        summary_path.write_text(json.dumps(build_summary(rows), indent=2), encoding="utf-8")
+        summary = render_summary(status_counts, writer.count)
+        summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
         print(f"wrote {summary_path}")
 
 
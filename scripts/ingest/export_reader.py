@@ -0,0 +1,656 @@
+#!/usr/bin/env python3
+"""Streaming reader shared by the export ingesters (GSC, GA4, GBP, crawl, rank, citations, reviews).
+
+Exports are CSV files or XLSX workbooks (read row by row through openpyxl's
+read-only mode when it is installed). They are read a chunk of rows at a time
+and handed out as columnar batches (column name -> list of values). Headers
+are normalized once, aliased columns are resolved once per file, and typed
+columns are coerced a column at a time. No step holds the whole export in
+memory:
+
+- iter_batches() streams ColumnBatch objects for an ExportSpec.
+- map_batches() runs a function over every batch, optionally in worker
+  processes, and yields results in file order.
+- JsonRowsWriter writes the usual {"...": ..., "rows": [...]} payload
+  incrementally, one compact row per line so rows use the C JSON encoder.
+- ColumnarWriter writes the same rows as typed Parquet or Arrow IPC columns
+  (pyarrow, optional) so downstream programs can read only what they need.
+- MetricSummary keeps mergeable totals and per-group sums for the summaries.
+"""
+
+from __future__ import annotations
+
+import csv
+import heapq
+import io
+import json
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    from openpyxl import load_workbook
+except ImportError:  # optional dependency
+    load_workbook = None
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+    pq = None
+
+
+DEFAULT_CHUNK_ROWS = 50_000
+XLSX_SUFFIXES = {".xlsx", ".xlsm"}
+OUTPUT_FORMATS = ("json", "parquet", "arrow")
+OUTPUT_SUFFIXES = {"json": ".json", "parquet": ".parquet", "arrow": ".arrow"}
+# Schema metadata key holding the export payload fields (client, date range, ...).
+PAYLOAD_METADATA_KEY = b"export_payload"
+
+
+def normalize_header(value: str) -> str:
+    return value.strip().lower().replace(" ", "_")
+
+
+def parse_float(value: str) -> float | None:
+    if value is None:
+        return None
+    value = value.strip().replace("%", "")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def parse_int(value: str) -> int | None:
+    if value is None:
+        return None
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _float_column(values: list[str]) -> list[float]:
+    try:
+        return [float(value) if value else 0.0 for value in values]
+    except ValueError:
+        return [parse_float(value) or 0.0 for value in values]
+
+
+def _int_column(values: list[str]) -> list[int]:
+    try:
+        return [int(value) if value else 0 for value in values]
+    except ValueError:
+        return [parse_int(value) or 0 for value in values]
+
+
+# Whole-column coercion: a plain float()/int() pass, falling back to the
+# lenient parsers ("12%", "3.0") only for columns that need them.
+COERCERS: dict[str, Callable[[list[str]], list[Any]]] = {
+    "float": _float_column,
+    "int": _int_column,
+}
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """How raw export columns become output columns.
+
+    aliases maps each output column to its candidate source headers; the first
+    non-empty one wins per row. With aliases=None every source column is kept
+    under its normalized header. types maps output columns to "float" or "int".
+    """
+
+    aliases: dict[str, list[str]] | None = None
+    types: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ColumnBatch:
+    columns: dict[str, list[Any]]
+    size: int
+
+    @classmethod
+    def from_rows(cls, rows: list[dict[str, Any]]) -> "ColumnBatch":
+        names = list(dict.fromkeys(key for row in rows for key in row))
+        return cls({name: [row.get(name) for row in rows] for name in names}, len(rows))
+
+    def column(self, name: str, default: Any = "") -> list[Any]:
+        values = self.columns.get(name)
+        return values if values is not None else [default] * self.size
+
+    def numbers(self, name: str) -> list[float]:
+        return [float(value or 0) for value in self.column(name, 0)]
+
+    def coalesce(self, names: Iterable[str]) -> list[str]:
+        """First non-empty value across columns, per row (stripped text)."""
+        present = [self.columns[name] for name in names if name in self.columns]
+        if not present:
+            return [""] * self.size
+        if len(present) == 1:
+            return [str(value or "").strip() for value in present[0]]
+        return [
+            next((str(value).strip() for value in values if value), "")
+            for values in zip(*present)
+        ]
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        if not self.columns:
+            for _ in range(self.size):
+                yield {}
+            return
+        names = list(self.columns)
+        for values in zip(*self.columns.values()):
+            yield dict(zip(names, values))
+
+
+def _column_plan(headers: list[str], spec: ExportSpec) -> list[tuple[str, list[int]]]:
+    index: dict[str, int] = {}
+    for position, name in enumerate(headers):
+        index[name] = position
+    if spec.aliases is None:
+        return [(name, [position]) for name, position in index.items()]
+    return [
+        (name, [index[alias] for alias in aliases if alias in index])
+        for name, aliases in spec.aliases.items()
+    ]
+
+
+def _raw_column(raw_rows: list[list[str]], position: int) -> list[str]:
+    try:
+        values = list(map(itemgetter(position), raw_rows))
+    except IndexError:
+        # Short rows read as empty cells, like DictReader's restval.
+        values = [row[position] if position < len(row) else "" for row in raw_rows]
+    return list(map(str.strip, values))
+
+
+def build_batch(headers: list[str], raw_rows: list[list[str]], spec: ExportSpec) -> ColumnBatch:
+    """Turn raw csv.reader rows into a typed ColumnBatch."""
+    size = len(raw_rows)
+    columns: dict[str, list[Any]] = {}
+    for name, positions in _column_plan(headers, spec):
+        sources = [_raw_column(raw_rows, position) for position in positions]
+        if not sources:
+            values: list[Any] = [""] * size
+        elif len(sources) == 1:
+            values = sources[0]
+        else:
+            values = [next((value for value in candidates if value), "") for candidates in zip(*sources)]
+        coerce = COERCERS.get(spec.types.get(name, ""))
+        if coerce is not None:
+            values = coerce(values)
+        columns[name] = values
+    return ColumnBatch(columns, size)
+
+
+def _open(path: Path):
+    try:
+        return path.open(encoding="utf-8-sig", newline="")
+    except FileNotFoundError as exc:
+        raise SystemExit(f"CSV not found: {path}") from exc
+
+
+def is_xlsx(path: Path) -> bool:
+    return path.suffix.lower() in XLSX_SUFFIXES
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == time() else value.isoformat(sep=" ")
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def _sheet_header(rows: Iterator[tuple[Any, ...]]) -> list[str] | None:
+    for values in rows:
+        cells = [_cell_text(value) for value in values]
+        while cells and not cells[-1]:
+            cells.pop()
+        if cells:
+            return cells
+    return None
+
+
+def _xlsx_records(workbook: Any, path: Path, sheet: str | None) -> Iterator[list[str]]:
+    """Rows of one sheet, or of every sheet sharing the first sheet's header.
+
+    Large exports are split across sheets at Excel's row limit; sheets with a
+    different header (filters, notes, other report tabs) are skipped. Blank
+    rows come back as [] so callers drop them like blank CSV lines.
+    """
+    if sheet is not None:
+        if sheet not in workbook.sheetnames:
+            raise SystemExit(f"Sheet {sheet!r} not found in {path} (sheets: {', '.join(workbook.sheetnames)})")
+        worksheets = [workbook[sheet]]
+    else:
+        worksheets = workbook.worksheets
+    header: list[str] | None = None
+    for worksheet in worksheets:
+        rows = worksheet.iter_rows(values_only=True)
+        sheet_header = _sheet_header(rows)
+        if sheet_header is None:
+            continue
+        if header is None:
+            header = sheet_header
+            yield header
+        elif [normalize_header(name) for name in sheet_header] != [normalize_header(name) for name in header]:
+            continue
+        for values in rows:
+            cells = [_cell_text(value) for value in values]
+            yield cells if any(cells) else []
+
+
+@contextmanager
+def _records(path: Path, sheet: str | None = None) -> Iterator[Iterator[list[str]]]:
+    """Raw records (header first) of a CSV or XLSX export."""
+    if not is_xlsx(path):
+        with _open(path) as handle:
+            yield csv.reader(handle)
+        return
+    if load_workbook is None:
+        raise SystemExit(f"Reading {path} requires openpyxl (pip install openpyxl), or export it as CSV.")
+    try:
+        workbook = load_workbook(path, read_only=True, data_only=True)
+    except FileNotFoundError as exc:
+        raise SystemExit(f"XLSX not found: {path}") from exc
+    try:
+        yield _xlsx_records(workbook, path, sheet)
+    finally:
+        workbook.close()
+
+
+def _read_header(reader: Iterator[list[str]], path: Path) -> list[str]:
+    for row in reader:
+        if row:
+            return [normalize_header(name) for name in row]
+    raise SystemExit(f"Export has no headers: {path}")
+
+
+def read_headers(path: Path, sheet: str | None = None) -> list[str]:
+    with _records(path, sheet) as reader:
+        return _read_header(reader, path)
+
+
+def iter_raw_chunks(
+    path: Path, chunk_size: int = DEFAULT_CHUNK_ROWS, sheet: str | None = None
+) -> Iterator[tuple[list[str], list[list[str]]]]:
+    """Yield (normalized headers, up to chunk_size raw rows), skipping blank lines like DictReader."""
+    with _records(path, sheet) as reader:
+        headers = _read_header(reader, path)
+        while True:
+            raw = list(islice(reader, chunk_size))
+            if not raw:
+                return
+            rows = [row for row in raw if row]
+            if rows:
+                yield headers, rows
+
+
+def iter_batches(
+    path: Path,
+    spec: ExportSpec | None = None,
+    chunk_size: int = DEFAULT_CHUNK_ROWS,
+    sheet: str | None = None,
+) -> Iterator[ColumnBatch]:
+    spec = spec or ExportSpec()
+    for headers, raw in iter_raw_chunks(path, chunk_size, sheet):
+        yield build_batch(headers, raw, spec)
+
+
+def _record_end(data: mmap.mmap, start: int, cut: int) -> int:
+    """First CSV record boundary at or after cut (a newline outside quotes).
+
+    start must itself be a record boundary. A newline ends a record when the
+    quotes seen since start are balanced; escaped quotes ("") keep the parity.
+    """
+    size = len(data)
+    quotes = data[start:cut].count(b'"')
+    while cut < size:
+        newline = data.find(b"\n", cut)
+        if newline == -1:
+            return size
+        quotes += data[cut:newline].count(b'"')
+        cut = newline + 1
+        if quotes % 2 == 0:
+            return cut
+    return size
+
+
+def _header_end(data: mmap.mmap) -> int:
+    start = 0
+    while start < len(data):
+        end = _record_end(data, start, start)
+        if data[start:end].strip():
+            return end
+        start = end
+    return len(data)
+
+
+def split_ranges(path: Path, chunk_size: int = DEFAULT_CHUNK_ROWS) -> Iterator[tuple[int, int]]:
+    """Byte ranges of roughly chunk_size rows each, cut on record boundaries (header excluded)."""
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        start = _header_end(data)
+        sample = data[start : start + 65536]
+        row_bytes = max(len(sample) // max(sample.count(b"\n"), 1), 1)
+        while start < len(data):
+            end = _record_end(data, start, min(start + row_bytes * chunk_size, len(data)))
+            yield start, end
+            start = end
+
+
+def _run_range(
+    func: Callable[[ColumnBatch], Any], path: Path, start: int, end: int, headers: list[str], spec: ExportSpec
+) -> Any:
+    with path.open("rb") as handle:
+        handle.seek(start)
+        text = handle.read(end - start).decode("utf-8")
+    raw = [row for row in csv.reader(io.StringIO(text, newline="")) if row]
+    return func(build_batch(headers, raw, spec))
+
+
+def map_batches(
+    path: Path,
+    func: Callable[[ColumnBatch], Any],
+    spec: ExportSpec | None = None,
+    chunk_size: int = DEFAULT_CHUNK_ROWS,
+    jobs: int = 1,
+    sheet: str | None = None,
+) -> Iterator[Any]:
+    """Yield func(batch) for every batch, in file order.
+
+    With jobs > 1 the parent only cuts the file into byte ranges on record
+    boundaries; worker processes read and parse their own range, build the
+    typed batch and run func, which must be a picklable module-level function.
+    At most 2 * jobs ranges are in flight at once. XLSX workbooks are zip
+    archives that cannot be cut into byte ranges, so they are always read
+    serially.
+    """
+    spec = spec or ExportSpec()
+    if jobs <= 1 or is_xlsx(path):
+        for batch in iter_batches(path, spec, chunk_size, sheet):
+            yield func(batch)
+        return
+    headers = read_headers(path)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: deque = deque()
+        for start, end in split_ranges(path, chunk_size):
+            pending.append(pool.submit(_run_range, func, path, start, end, headers, spec))
+            if len(pending) >= jobs * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_rows(
+    path: Path, chunk_size: int = DEFAULT_CHUNK_ROWS, sheet: str | None = None
+) -> Iterator[dict[str, str]]:
+    for batch in iter_batches(path, chunk_size=chunk_size, sheet=sheet):
+        yield from batch.rows()
+
+
+def load_csv(path: Path, sheet: str | None = None) -> list[dict[str, str]]:
+    """All rows of a CSV or XLSX export (normalized headers, stripped text)."""
+    return list(iter_rows(path, sheet=sheet))
+
+
+def load_csv_with_headers(path: Path, sheet: str | None = None) -> tuple[list[str], list[dict[str, str]]]:
+    return read_headers(path, sheet), load_csv(path, sheet)
+
+
+def encode_rows(rows: Iterable[dict[str, Any]]) -> str:
+    """Rows as list items of an indent=2 payload, one compact row per line; joinable with ","."""
+    return ",".join("\n    " + json.dumps(row) for row in rows)
+
+
+class JsonRowsWriter:
+    """Stream a payload whose last key is a list of rows to disk.
+
+    The file is written to a temporary sibling and only moved into place when
+    the block exits cleanly, so a failed or empty ingest never leaves a
+    truncated export behind.
+    """
+
+    def __init__(self, path: Path, payload: dict[str, Any], rows_key: str = "rows") -> None:
+        self.path = path
+        self.payload = payload
+        self.rows_key = rows_key
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.count = 0
+        self._handle = None
+
+    def __enter__(self) -> "JsonRowsWriter":
+        head = json.dumps({**self.payload, self.rows_key: []}, indent=2)
+        self._handle = self.tmp_path.open("w", encoding="utf-8")
+        self._handle.write(head[: -len("[]\n}")] + "[")
+        return self
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self.write_encoded(encode_rows(rows), len(rows))
+
+    def write_encoded(self, fragment: str, count: int) -> None:
+        if not count:
+            return
+        if self.count:
+            self._handle.write(",")
+        self._handle.write(fragment)
+        self.count += count
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._handle.write("\n  ]\n}" if self.count else "]\n}")
+        self._handle.close()
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+        else:
+            self.tmp_path.unlink(missing_ok=True)
+
+
+def output_columns(headers: list[str], spec: ExportSpec) -> list[str]:
+    """Output column names, in order, for an export with these normalized headers."""
+    return [name for name, _ in _column_plan(headers, spec)]
+
+
+class ColumnarWriter:
+    """Stream batches into a Parquet (one row group per batch) or Arrow IPC file.
+
+    Columns typed "float"/"int" in the spec are stored as float64/int64 and
+    everything else as strings. The payload fields that sit next to "rows" in
+    the JSON export are kept as schema metadata. Like JsonRowsWriter, the file
+    only replaces the destination when the block exits cleanly.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: list[str],
+        spec: ExportSpec,
+        fmt: str = "parquet",
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        if pa is None:
+            raise SystemExit(f"Writing {fmt} output requires pyarrow (pip install pyarrow), or use --format json.")
+        arrow_types = {"float": pa.float64(), "int": pa.int64()}
+        self.schema = pa.schema(
+            [(name, arrow_types.get(spec.types.get(name, ""), pa.string())) for name in columns],
+            metadata={PAYLOAD_METADATA_KEY: json.dumps(payload or {})},
+        )
+        self.path = path
+        self.fmt = fmt
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.count = 0
+        self._writer = None
+
+    def __enter__(self) -> "ColumnarWriter":
+        if self.fmt == "parquet":
+            self._writer = pq.ParquetWriter(self.tmp_path, self.schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(str(self.tmp_path), self.schema)
+        return self
+
+    def write(self, batch: ColumnBatch) -> None:
+        if not batch.size:
+            return
+        arrays = [batch.column(name) for name in self.schema.names]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+        self.count += batch.size
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._writer.close()
+        if exc_type is None:
+            os.replace(self.tmp_path, self.path)
+        else:
+            self.tmp_path.unlink(missing_ok=True)
+
+
+def open_writer(
+    path: Path, fmt: str, payload: dict[str, Any], headers: list[str], spec: ExportSpec
+) -> JsonRowsWriter | ColumnarWriter:
+    if fmt == "json":
+        return JsonRowsWriter(path, payload)
+    return ColumnarWriter(path, output_columns(headers, spec), spec, fmt, payload)
+
+
+class MetricSummary:
+    """Running totals and per-group metric sums, mergeable across batches and processes.
+
+    groups maps an output name to the key columns to group by (first
+    non-empty wins); rows with no key are left out of that grouping. Group keys
+    are factorized to integer codes in first-seen order and sums are kept per
+    code: with NumPy a batch costs one bincount per metric and grouping,
+    otherwise plain lists are accumulated. top() selects with argpartition or
+    a heap instead of sorting every group.
+    """
+
+    def __init__(self, metrics: list[str], groups: dict[str, list[str]] | None = None) -> None:
+        self.metrics = list(metrics)
+        self.groups = groups or {}
+        self.rows = 0
+        self.totals = dict.fromkeys(self.metrics, 0.0)
+        self.codes: dict[str, dict[str, int]] = {name: {} for name in self.groups}
+        self.sums: dict[str, Any] = {name: self._zeros(0) for name in self.groups}
+
+    def _zeros(self, size: int) -> Any:
+        if np is not None:
+            return np.zeros((len(self.metrics), size))
+        return [[0.0] * size for _ in self.metrics]
+
+    def _grow(self, name: str) -> Any:
+        size = len(self.codes[name])
+        sums = self.sums[name]
+        if np is not None:
+            if sums.shape[1] < size:
+                sums = self.sums[name] = np.concatenate([sums, self._zeros(size - sums.shape[1])], axis=1)
+        else:
+            for column in sums:
+                column.extend([0.0] * (size - len(column)))
+        return sums
+
+    def _metric_values(self, batch: ColumnBatch) -> list[Any]:
+        if np is None:
+            return [batch.numbers(metric) for metric in self.metrics]
+        values = []
+        for metric in self.metrics:
+            try:
+                values.append(np.asarray(batch.column(metric, 0.0), dtype=np.float64))
+            except (TypeError, ValueError):
+                values.append(np.asarray(batch.numbers(metric), dtype=np.float64))
+        return values
+
+    def add(self, batch: ColumnBatch) -> "MetricSummary":
+        self.rows += batch.size
+        values = self._metric_values(batch)
+        for metric, column in zip(self.metrics, values):
+            self.totals[metric] += float(sum(column) if np is None else column.sum())
+        for name, keys in self.groups.items():
+            index = self.codes[name]
+            codes = [index.setdefault(key, len(index)) for key in batch.coalesce(keys)]
+            sums = self._grow(name)
+            if np is not None:
+                code_array = np.asarray(codes, dtype=np.intp)
+                for total, column in zip(sums, values):
+                    total += np.bincount(code_array, weights=column, minlength=len(index))
+            else:
+                for total, column in zip(sums, values):
+                    for code, value in zip(codes, column):
+                        total[code] += value
+        return self
+
+    def merge(self, other: "MetricSummary") -> "MetricSummary":
+        self.rows += other.rows
+        for metric, value in other.totals.items():
+            self.totals[metric] += value
+        for name, other_codes in other.codes.items():
+            index = self.codes[name]
+            mapping = [index.setdefault(key, len(index)) for key in other_codes]
+            sums = self._grow(name)
+            other_sums = other.sums[name]
+            if np is not None:
+                sums[:, np.asarray(mapping, dtype=np.intp)] += other_sums[:, : len(mapping)]
+            else:
+                for total, column in zip(sums, other_sums):
+                    for code, value in zip(mapping, column):
+                        total[code] += value
+        return self
+
+    def _top_codes(self, name: str, by: str, limit: int) -> list[int]:
+        index = self.codes[name]
+        column = self.sums[name][self.metrics.index(by)]
+        if np is None:
+            candidates = (code for key, code in index.items() if key)
+            return heapq.nlargest(limit, candidates, key=column.__getitem__)
+        scores = np.array(column[: len(index)], dtype=np.float64)
+        if "" in index:
+            scores[index[""]] = -np.inf
+        limit = min(limit, len(index) - ("" in index))
+        if limit <= 0:
+            return []
+        candidates = np.arange(len(scores))
+        if limit < len(scores):
+            threshold = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            candidates = np.flatnonzero(scores >= threshold)
+        # Stable sort on the survivors keeps first-seen order among ties.
+        return candidates[np.argsort(-scores[candidates], kind="stable")][:limit].tolist()
+
+    def group_totals(self, name: str) -> dict[str, dict[str, float]]:
+        """Sums of every metric per group key, in first-seen order (rows without a key included as "")."""
+        sums = self.sums[name]
+        return {
+            key: {metric: float(column[code]) for metric, column in zip(self.metrics, sums)}
+            for key, code in self.codes[name].items()
+        }
+
+    def top(self, name: str, by: str, limit: int = 10, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """Largest groups by one metric (ties keep first-seen order)."""
+        fields = fields or self.metrics
+        keys = list(self.codes[name])
+        sums = self.sums[name]
+        positions = [self.metrics.index(metric) for metric in fields]
+        return [
+            {"name": keys[code], **{metric: float(sums[pos][code]) for metric, pos in zip(fields, positions)}}
+            for code in self._top_codes(name, by, limit)
+        ]
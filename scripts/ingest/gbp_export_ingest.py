@@ -4,12 +4,31 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+INGEST_DIR = Path(__file__).resolve().parent
+if str(INGEST_DIR) not in sys.path:
+    sys.path.append(str(INGEST_DIR))
+
+from export_reader import (  # noqa: E402
+    DEFAULT_CHUNK_ROWS,
+    ColumnBatch,
+    ExportSpec,
+    OUTPUT_FORMATS,
+    OUTPUT_SUFFIXES,
+    MetricSummary,
+    iter_batches,
+    open_writer,
+    parse_float,
+    read_headers,
+)
+from export_reader import load_csv_with_headers as load_csv  # noqa: E402,F401
+from metrics_history import history_path, record_summary  # noqa: E402
+
 
 ALIASES = {
     "date": ["date", "day", "week", "month"],
@@ -22,39 +41,12 @@ ALIASES = {
 }
 
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
-
-
-def normalize_header(value: str) -> str:
-    return value.strip().lower().replace(" ", "_")
-
-
-def parse_float(value: str) -> float | None:
-    if value is None:
-        return None
-    value = value.strip().replace("%", "")
-    if not value:
-        return None
-    try:
-        return float(value)
-    except ValueError:
-        return None
+METRIC_KEYS = ("views", "searches", "calls", "website_clicks", "direction_requests", "messages")
+EXPORT_SPEC = ExportSpec(aliases=ALIASES, types={key: "float" for key in METRIC_KEYS})
 
 
-def load_csv(path: Path) -> tuple[list[str], list[dict[str, str]]]:
-    try:
-        with path.open(encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if not reader.fieldnames:
-                raise SystemExit(f"CSV has no headers: {path}")
-            headers = [normalize_header(name) for name in reader.fieldnames]
-            rows: list[dict[str, str]] = []
-            for row in reader:
-                rows.append({normalize_header(k): (v or "").strip() for k, v in row.items()})
-            return headers, rows
-    except FileNotFoundError as exc:
-        raise SystemExit(f"CSV not found: {path}") from exc
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def pick_value(row: dict[str, str], keys: list[str]) -> str:
@@ -70,63 +62,99 @@ def normalize_rows(rows: list[dict[str, str]]) -> list[dict[str, Any]]:
     for row in rows:
         entry: dict[str, Any] = {}
         entry["date"] = pick_value(row, ALIASES["date"])
-        for key in ("views", "searches", "calls", "website_clicks", "direction_requests", "messages"):
+        for key in METRIC_KEYS:
             raw = pick_value(row, ALIASES[key])
             entry[key] = parse_float(raw) or 0.0
         normalized.append(entry)
     return normalized
 
 
+def new_summary(dates: bool = False) -> MetricSummary:
+    groups = {"dates": ["date"]} if dates else None
+    return MetricSummary(["views", "searches", "calls", "website_clicks"], groups)
+
+
+def render_summary(summary: MetricSummary) -> dict[str, Any]:
+    return {"generated_at": now_iso(), "totals": dict(summary.totals)}
+
+
 def build_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    totals = {"views": 0.0, "searches": 0.0, "calls": 0.0, "website_clicks": 0.0}
-    for row in rows:
-        totals["views"] += float(row.get("views") or 0)
-        totals["searches"] += float(row.get("searches") or 0)
-        totals["calls"] += float(row.get("calls") or 0)
-        totals["website_clicks"] += float(row.get("website_clicks") or 0)
-    return {"generated_at": now_iso(), "totals": totals}
+    return render_summary(new_summary().add(ColumnBatch.from_rows(rows)))
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Convert GBP export CSV into JSON.")
     parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
-    parser.add_argument("--input", required=True, help="Path to GBP export CSV.")
+    parser.add_argument("--input", required=True, help="Path to GBP export (CSV or XLSX).")
+    parser.add_argument(
+        "--sheet",
+        default=None,
+        help="XLSX sheet to read (default: every sheet sharing the first sheet's header).",
+    )
     parser.add_argument("--location", default=None, help="Location name or ID.")
     parser.add_argument(
         "--output",
         default=None,
-        help="Output JSON path (default: data/outputs/<client>/reports/gbp-export.json).",
+        help="Output path (default: data/outputs/<client>/reports/gbp-export.<format>).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="Output format: json, or typed columns as parquet/arrow (requires pyarrow).",
     )
     parser.add_argument(
         "--summary",
         action="store_true",
         help="Write gbp-summary.json with totals.",
     )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record daily totals in the client's metric history.",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help=f"Rows per processing chunk (default: {DEFAULT_CHUNK_ROWS}).",
+    )
     args = parser.parse_args()
 
     output_dir = Path("data") / "outputs" / args.client_slug / "reports"
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = Path(args.output) if args.output else output_dir / "gbp-export.json"
-
-    headers, rows = load_csv(Path(args.input))
-    normalized = normalize_rows(rows)
-    if not normalized:
-        raise SystemExit("No rows found in export.")
+    output_path = Path(args.output) if args.output else output_dir / f"gbp-export{OUTPUT_SUFFIXES[args.format]}"
 
+    input_path = Path(args.input)
+    headers = read_headers(input_path, args.sheet)
     payload = {
         "location": args.location or "[location]",
         "exported_at": now_iso(),
         "source_columns": headers,
-        "rows": normalized,
     }
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    history = not args.no_history
+    summary = new_summary(dates=history)
+    with open_writer(output_path, args.format, payload, headers, EXPORT_SPEC) as writer:
+        for batch in iter_batches(input_path, EXPORT_SPEC, args.chunk_size, args.sheet):
+            writer.write(list(batch.rows()) if args.format == "json" else batch)
+            summary.add(batch)
+        if not writer.count:
+            raise SystemExit("No rows found in export.")
     print(f"wrote {output_path}")
 
     if args.summary:
         summary_path = output_dir / "gbp-summary.json"
-        summary_path.write_text(json.dumps(build_summary(normalized), indent=2), encoding="utf-8")
+        summary_path.write_text(json.dumps(render_summary(summary), indent=2), encoding="utf-8")
         print(f"wrote {summary_path}")
 
+    if history:
+        history_file = history_path(args.client_slug)
+        periods = record_summary(history_file, "gbp", summary.group_totals("dates"), input_path.name, writer.count)
+        if periods:
+            print(f"recorded {', '.join(periods)} in {history_file}")
+        else:
+            print("no dated rows; metric history not updated")
+
 
 if __name__ == "__main__":
     main()
@@ -4,136 +4,176 @@
 from __future__ import annotations
 
 import argparse
-import csv
 import json
-from collections import defaultdict
+import sys
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+INGEST_DIR = Path(__file__).resolve().parent
+if str(INGEST_DIR) not in sys.path:
+    sys.path.append(str(INGEST_DIR))
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
-
-
-def normalize_header(value: str) -> str:
-    return value.strip().lower().replace(" ", "_")
+from export_reader import (  # noqa: E402
+    DEFAULT_CHUNK_ROWS,
+    ColumnBatch,
+    ExportSpec,
+    OUTPUT_FORMATS,
+    OUTPUT_SUFFIXES,
+    MetricSummary,
+    encode_rows,
+    load_csv,
+    map_batches,
+    open_writer,
+    parse_float,
+    read_headers,
+)
+from metrics_history import DATE_KEYS, history_path, record_summary  # noqa: E402
 
 
-def parse_float(value: str) -> float | None:
-    if value is None:
-        return None
-    value = value.strip().replace("%", "")
-    if not value:
-        return None
-    try:
-        return float(value)
-    except ValueError:
-        return None
+NUMERIC_KEYS = ("clicks", "impressions", "ctr", "position")
+EXPORT_SPEC = ExportSpec(types={key: "float" for key in NUMERIC_KEYS})
 
 
-def load_csv(path: Path) -> list[dict[str, str]]:
-    try:
-        with path.open(encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if not reader.fieldnames:
-                raise SystemExit(f"CSV has no headers: {path}")
-            rows: list[dict[str, str]] = []
-            for row in reader:
-                rows.append({normalize_header(k): (v or "").strip() for k, v in row.items()})
-            return rows
-    except FileNotFoundError as exc:
-        raise SystemExit(f"CSV not found: {path}") from exc
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def normalize_rows(rows: list[dict[str, str]]) -> list[dict[str, Any]]:
     normalized: list[dict[str, Any]] = []
     for row in rows:
         cleaned: dict[str, Any] = dict(row)
-        for key in ("clicks", "impressions", "ctr", "position"):
+        for key in NUMERIC_KEYS:
             if key in cleaned:
                 cleaned[key] = parse_float(str(cleaned[key])) or 0.0
         normalized.append(cleaned)
     return normalized
 
 
-def build_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
-    totals = {"clicks": 0.0, "impressions": 0.0}
-    for row in rows:
-        totals["clicks"] += float(row.get("clicks") or 0)
-        totals["impressions"] += float(row.get("impressions") or 0)
-    ctr = (totals["clicks"] / totals["impressions"]) if totals["impressions"] else 0.0
+def new_summary(top: bool = True, dates: bool = False) -> MetricSummary:
+    groups = {"top_queries": ["query"], "top_pages": ["page"]} if top else {}
+    if dates:
+        groups["dates"] = DATE_KEYS
+    return MetricSummary(["clicks", "impressions"], groups)
 
-    def group_rows(key: str) -> list[dict[str, Any]]:
-        bucket: dict[str, dict[str, float]] = defaultdict(lambda: {"clicks": 0.0, "impressions": 0.0})
-        for row in rows:
-            value = str(row.get(key) or "").strip()
-            if not value:
-                continue
-            bucket[value]["clicks"] += float(row.get("clicks") or 0)
-            bucket[value]["impressions"] += float(row.get("impressions") or 0)
-        items = [
-            {"name": name, "clicks": data["clicks"], "impressions": data["impressions"]}
-            for name, data in bucket.items()
-        ]
-        items.sort(key=lambda item: item["clicks"], reverse=True)
-        return items[:10]
-
-    summary = {
+
+def render_summary(summary: MetricSummary) -> dict[str, Any]:
+    totals = summary.totals
+    ctr = (totals["clicks"] / totals["impressions"]) if totals["impressions"] else 0.0
+    return {
         "generated_at": now_iso(),
         "totals": {
             "clicks": totals["clicks"],
             "impressions": totals["impressions"],
             "ctr": round(ctr, 4),
         },
-        "top_queries": group_rows("query"),
-        "top_pages": group_rows("page"),
+        "top_queries": summary.top("top_queries", "clicks"),
+        "top_pages": summary.top("top_pages", "clicks"),
     }
-    return summary
+
+
+def build_summary(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    return render_summary(new_summary().add(ColumnBatch.from_rows(rows)))
+
+
+def process_batch(
+    batch: ColumnBatch, summarize: bool = False, encode: bool = True, history: bool = False
+) -> tuple[str | ColumnBatch, int, MetricSummary | None]:
+    """JSON-encode one batch of output rows (and its partial summary); runs in worker processes."""
+    rows = encode_rows(batch.rows()) if encode else batch
+    if not summarize and not history:
+        return rows, batch.size, None
+    return rows, batch.size, new_summary(top=summarize, dates=history).add(batch)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Convert GSC export CSV into JSON.")
     parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
-    parser.add_argument("--input", required=True, help="Path to GSC export CSV.")
+    parser.add_argument("--input", required=True, help="Path to GSC export (CSV or XLSX).")
+    parser.add_argument(
+        "--sheet",
+        default=None,
+        help="XLSX sheet to read (default: every sheet sharing the first sheet's header).",
+    )
     parser.add_argument("--site", default=None, help="GSC property or site URL.")
     parser.add_argument("--start-date", default=None, help="Report start date (YYYY-MM-DD).")
     parser.add_argument("--end-date", default=None, help="Report end date (YYYY-MM-DD).")
     parser.add_argument(
         "--output",
         default=None,
-        help="Output JSON path (default: data/outputs/<client>/reports/gsc-export.json).",
+        help="Output path (default: data/outputs/<client>/reports/gsc-export.<format>).",
+    )
+    parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="Output format: json, or typed columns as parquet/arrow (requires pyarrow).",
     )
     parser.add_argument(
         "--summary",
         action="store_true",
         help="Write gsc-summary.json with top queries/pages.",
     )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Do not record daily totals in the client's metric history.",
+    )
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for large exports (default: 1).")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help=f"Rows per processing chunk (default: {DEFAULT_CHUNK_ROWS}).",
+    )
     args = parser.parse_args()
 
     output_dir = Path("data") / "outputs" / args.client_slug / "reports"
     output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = Path(args.output) if args.output else output_dir / "gsc-export.json"
-
-    rows = normalize_rows(load_csv(Path(args.input)))
-    if not rows:
-        raise SystemExit("No rows found in export.")
+    output_path = Path(args.output) if args.output else output_dir / f"gsc-export{OUTPUT_SUFFIXES[args.format]}"
 
+    input_path = Path(args.input)
+    headers = read_headers(input_path, args.sheet)
     payload = {
         "client": {"site": args.site or "[property]"},
         "exported_at": now_iso(),
         "date_range": {"start": args.start_date or "", "end": args.end_date or ""},
-        "columns": sorted({key for row in rows for key in row.keys()}),
-        "rows": rows,
+        "columns": sorted(set(headers)),
     }
-    output_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    history = not args.no_history
+    summary = new_summary(top=args.summary, dates=history)
+    encode = args.format == "json"
+    worker = partial(process_batch, summarize=args.summary, encode=encode, history=history)
+    with open_writer(output_path, args.format, payload, headers, EXPORT_SPEC) as writer:
+        for rows, count, partial_summary in map_batches(
+            input_path, worker, EXPORT_SPEC, args.chunk_size, args.jobs, args.sheet
+        ):
+            if encode:
+                writer.write_encoded(rows, count)
+            else:
+                writer.write(rows)
+            if partial_summary is not None:
+                summary.merge(partial_summary)
+        if not writer.count:
+            raise SystemExit("No rows found in export.")
     print(f"wrote {output_path}")
 
     if args.summary:
         summary_path = output_dir / "gsc-summary.json"
-        summary_path.write_text(json.dumps(build_summary(rows), indent=2), encoding="utf-8")
+        summary_path.write_text(json.dumps(render_summary(summary), indent=2), encoding="utf-8")
         print(f"wrote {summary_path}")
 
+    if history:
+        history_file = history_path(args.client_slug)
+        periods = record_summary(
+            history_file, "gsc", summary.group_totals("dates"), input_path.name, writer.count
+        )
+        if periods:
+            print(f"recorded {', '.join(periods)} in {history_file}")
+        else:
+            print("no dated rows; metric history not updated")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""Per-client daily metric history, upserted by export ingests and queried as monthly totals."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+HISTORY_FILENAME = "metrics-history.sqlite"
+DATE_KEYS = ["date", "day"]
+DAY_FORMATS = ("%Y-%m-%d", "%Y%m%d", "%m/%d/%Y", "%Y/%m/%d")
+PERIOD_FORMATS = (*DAY_FORMATS, "%Y-%m")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_values (
+    source TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    day TEXT NOT NULL,
+    month INTEGER NOT NULL,
+    value REAL NOT NULL,
+    ingested_at TEXT NOT NULL,
+    PRIMARY KEY (source, metric, day)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ingest_runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    input TEXT NOT NULL,
+    periods TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    ingested_at TEXT NOT NULL
+);
+"""
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def history_path(client_slug: str) -> Path:
+    return Path("data") / "outputs" / client_slug / "reports" / HISTORY_FILENAME
+
+
+def to_day(value: str) -> str | None:
+    """ISO day ("YYYY-MM-DD") of a date cell; ISO datetimes and date ranges use their first date."""
+    text = value.strip()[:10]
+    for fmt in DAY_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def to_period(value: str) -> str | None:
+    """Month ("YYYY-MM") of a date cell; ISO datetimes and date ranges use their first date."""
+    text = value.strip()[:10]
+    for fmt in PERIOD_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m")
+        except ValueError:
+            continue
+    return None
+
+
+def month_index(period: str) -> int:
+    year, month = period.split("-")
+    return int(year) * 12 + int(month) - 1
+
+
+def period_of(index: int) -> str:
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def daily_totals(daily: dict[str, dict[str, float]]) -> dict[str, dict[str, float]]:
+    """Normalize per-date sums to ISO days, merging spellings of one day; undated rows are dropped."""
+    days: dict[str, dict[str, float]] = {}
+    for value, metrics in daily.items():
+        day = to_day(value) if value else None
+        if not day:
+            continue
+        bucket = days.setdefault(day, dict.fromkeys(metrics, 0.0))
+        for metric, amount in metrics.items():
+            bucket[metric] = bucket.get(metric, 0.0) + amount
+    return dict(sorted(days.items()))
+
+
+class MetricsHistory:
+    """SQLite store of one value per (source, metric, day); months are summed at query time.
+
+    Re-ingesting a day replaces it, so overlapping or partial exports never
+    erase the days of a month they do not cover.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "MetricsHistory":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def upsert(
+        self,
+        source: str,
+        days: dict[str, dict[str, float]],
+        input_name: str = "",
+        rows: int = 0,
+    ) -> list[str]:
+        """Replace the stored values for every day in the export, log the run and return its months."""
+        stamp = now_iso()
+        values = [
+            (source, metric, day, month_index(day[:7]), float(value), stamp)
+            for day, metrics in days.items()
+            for metric, value in metrics.items()
+        ]
+        months = sorted({day[:7] for day in days})
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO daily_values (source, metric, day, month, value, ingested_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (source, metric, day) DO UPDATE SET "
+                "value = excluded.value, ingested_at = excluded.ingested_at",
+                values,
+            )
+            self.conn.execute(
+                "INSERT INTO ingest_runs (source, input, periods, rows, ingested_at) VALUES (?, ?, ?, ?, ?)",
+                (source, input_name, ",".join(months), rows, stamp),
+            )
+        return months
+
+    def series(
+        self, source: str, metric: str, start: str | None = None, end: str | None = None
+    ) -> list[tuple[str, float]]:
+        low, high = self._bounds(start, end)
+        cursor = self.conn.execute(
+            "SELECT month, SUM(value) FROM daily_values "
+            "WHERE source = ? AND metric = ? AND day BETWEEN ? AND ? GROUP BY month ORDER BY month",
+            (source, metric, low, high),
+        )
+        return [(period_of(month), total) for month, total in cursor]
+
+    def value(self, source: str, metric: str, period: str) -> float | None:
+        low, high = self._bounds(period, period)
+        row = self.conn.execute(
+            "SELECT SUM(value) FROM daily_values WHERE source = ? AND metric = ? AND day BETWEEN ? AND ?",
+            (source, metric, low, high),
+        ).fetchone()
+        return row[0]
+
+    def compare(self, source: str, metric: str, period: str, offset: int = 1) -> dict[str, Any]:
+        """Period-over-period change; offset=1 is month over month, offset=12 year over year."""
+        previous_period = period_of(month_index(period) - offset)
+        current = self.value(source, metric, period)
+        previous = self.value(source, metric, previous_period)
+        change = current - previous if current is not None and previous is not None else None
+        return {
+            "metric": metric,
+            "period": period,
+            "value": current,
+            "previous_period": previous_period,
+            "previous": previous,
+            "change": change,
+            "change_pct": round(change / previous, 4) if change is not None and previous else None,
+        }
+
+    def rolling(
+        self,
+        source: str,
+        metric: str,
+        window: int = 3,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Trailing window over calendar months; missing months shrink the window, not shift it."""
+        if window < 1:
+            raise SystemExit("Rolling window must be at least 1 month.")
+        low, high = self._bounds(start, end)
+        cursor = self.conn.execute(
+            "SELECT month, value, total, months FROM ("
+            "  SELECT month, value,"
+            "    SUM(value) OVER w AS total, COUNT(*) OVER w AS months"
+            "  FROM ("
+            "    SELECT month, SUM(value) AS value FROM daily_values"
+            "    WHERE source = ? AND metric = ? AND day <= ? GROUP BY month"
+            "  )"
+            f"  WINDOW w AS (ORDER BY month RANGE BETWEEN {window - 1} PRECEDING AND CURRENT ROW)"
+            ") WHERE month >= ? ORDER BY month",
+            (source, metric, high, month_index(low[:7])),
+        )
+        return [
+            {"period": period_of(month), "value": value, "rolling_sum": total, "rolling_avg": total / months, "months": months}
+            for month, value, total, months in cursor
+        ]
+
+    def sources(self) -> dict[str, list[str]]:
+        metrics: dict[str, list[str]] = {}
+        for source, metric in self.conn.execute(
+            "SELECT DISTINCT source, metric FROM daily_values ORDER BY source, metric"
+        ):
+            metrics.setdefault(source, []).append(metric)
+        return metrics
+
+    def _bounds(self, start: str | None, end: str | None) -> tuple[str, str]:
+        """First and last ISO day of the months from start to end, for range scans on the key."""
+        low = f"{self._period(start)}-01" if start else "0000-01-01"
+        high = f"{self._period(end)}-31" if end else "9999-12-31"
+        return low, high
+
+    def _period(self, value: str) -> str:
+        period = to_period(value)
+        if not period:
+            raise SystemExit(f"Invalid period: {value} (expected YYYY-MM or a date).")
+        return period
+
+
+def record_summary(
+    path: Path,
+    source: str,
+    daily: dict[str, dict[str, float]],
+    input_name: str = "",
+    rows: int = 0,
+) -> list[str]:
+    """Upsert an ingest's per-date sums as daily values; returns the months touched.
+
+    Exports without a date column (GSC query or page reports) are not recorded:
+    their totals cannot be placed on days without guessing.
+    """
+    days = daily_totals(daily)
+    if not days:
+        return []
+    with MetricsHistory(path) as history:
+        return history.upsert(source, days, input_name, rows)
+
+
+def render_rows(items: Iterable[tuple[str, float]]) -> list[dict[str, Any]]:
+    return [{"period": period, "value": value} for period, value in items]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Query monthly totals of the metric history recorded by export ingests.")
+    parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
+    parser.add_argument("--source", default=None, help="Export source (gsc, ga4, gbp).")
+    parser.add_argument("--metric", default=None, help="Metric name, e.g. clicks or sessions.")
+    parser.add_argument("--period", default=None, help="Compare this month (YYYY-MM) with an earlier one.")
+    parser.add_argument("--offset", type=int, default=1, help="Months back to compare against (12 = year over year).")
+    parser.add_argument("--window", type=int, default=None, help="Trailing window in months for rolling totals.")
+    parser.add_argument("--start", default=None, help="First month to list (YYYY-MM).")
+    parser.add_argument("--end", default=None, help="Last month to list (YYYY-MM).")
+    parser.add_argument("--db", default=None, help=f"History database (default: data/outputs/<client>/reports/{HISTORY_FILENAME}).")
+    args = parser.parse_args()
+
+    path = Path(args.db) if args.db else history_path(args.client_slug)
+    if not path.exists():
+        raise SystemExit(f"No metric history found: {path}")
+    with MetricsHistory(path) as history:
+        if not args.source or not args.metric:
+            result: Any = history.sources()
+        elif args.period:
+            result = history.compare(args.source, args.metric, args.period, args.offset)
+        elif args.window:
+            result = history.rolling(args.source, args.metric, args.window, args.start, args.end)
+        else:
+            result = render_rows(history.series(args.source, args.metric, args.start, args.end))
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
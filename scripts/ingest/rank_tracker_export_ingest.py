@@ -6,10 +6,18 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+INGEST_DIR = Path(__file__).resolve().parent
+if str(INGEST_DIR) not in sys.path:
+    sys.path.append(str(INGEST_DIR))
+
+from export_reader import DEFAULT_CHUNK_ROWS, ExportSpec, iter_batches, read_headers  # noqa: E402
+from export_reader import load_csv_with_headers as load_csv  # noqa: E402,F401
+
 
 CANONICAL_FIELDS = [
     "keyword",
@@ -36,25 +44,6 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
-def normalize_header(value: str) -> str:
-    return value.strip().lower().replace(" ", "_")
-
-
-def load_csv(path: Path) -> tuple[list[str], list[dict[str, str]]]:
-    try:
-        with path.open(encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if not reader.fieldnames:
-                raise SystemExit(f"CSV has no headers: {path}")
-            headers = [normalize_header(name) for name in reader.fieldnames]
-            rows: list[dict[str, str]] = []
-            for row in reader:
-                rows.append({normalize_header(k): (v or "").strip() for k, v in row.items()})
-            return headers, rows
-    except FileNotFoundError as exc:
-        raise SystemExit(f"CSV not found: {path}") from exc
-
-
 def map_headers(headers: list[str]) -> dict[str, str | None]:
     mapping: dict[str, str | None] = {}
     header_set = set(headers)
@@ -79,10 +68,19 @@ def normalize_rows(rows: list[dict[str, str]], mapping: dict[str, str | None]) -
     return normalized
 
 
+def export_spec(mapping: dict[str, str | None]) -> ExportSpec:
+    return ExportSpec(aliases={field: [mapping[field]] if mapping.get(field) else [] for field in CANONICAL_FIELDS})
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Normalize rank tracker CSV exports.")
     parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
-    parser.add_argument("--input", required=True, help="Path to rank tracker CSV export.")
+    parser.add_argument("--input", required=True, help="Path to rank tracker export (CSV or XLSX).")
+    parser.add_argument(
+        "--sheet",
+        default=None,
+        help="XLSX sheet to read (default: every sheet sharing the first sheet's header).",
+    )
     parser.add_argument(
         "--output-csv",
         default=None,
@@ -93,6 +91,12 @@ def main() -> None:
         default=None,
         help="Output JSON summary path (default: data/outputs/<client>/reports/rank-tracker-export.json).",
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_ROWS,
+        help=f"Rows per processing chunk (default: {DEFAULT_CHUNK_ROWS}).",
+    )
     args = parser.parse_args()
 
     output_dir = Path("data") / "outputs" / args.client_slug / "reports"
@@ -100,20 +104,23 @@ def main() -> None:
     output_csv = Path(args.output_csv) if args.output_csv else output_dir / "rank-tracker-export.csv"
     output_json = Path(args.output_json) if args.output_json else output_dir / "rank-tracker-export.json"
 
-    headers, rows = load_csv(Path(args.input))
+    input_path = Path(args.input)
+    headers = read_headers(input_path, args.sheet)
     mapping = map_headers(headers)
-    normalized_rows = normalize_rows(rows, mapping)
+    row_count = 0
 
     with output_csv.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=CANONICAL_FIELDS)
-        writer.writeheader()
-        writer.writerows(normalized_rows)
+        writer = csv.writer(handle)
+        writer.writerow(CANONICAL_FIELDS)
+        for batch in iter_batches(input_path, export_spec(mapping), args.chunk_size, args.sheet):
+            writer.writerows(zip(*(batch.columns[field] for field in CANONICAL_FIELDS)))
+            row_count += batch.size
 
     summary = {
         "exported_at": now_iso(),
         "source_columns": headers,
         "mapping": mapping,
-        "row_count": len(normalized_rows),
+        "row_count": row_count,
     }
     output_json.write_text(json.dumps(summary, indent=2), encoding="utf-8")
 
@@ -6,31 +6,20 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+INGEST_DIR = Path(__file__).resolve().parent
+if str(INGEST_DIR) not in sys.path:
+    sys.path.append(str(INGEST_DIR))
 
-def now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat(timespec="seconds")
-
+from export_reader import iter_rows, load_csv  # noqa: E402,F401
 
-def normalize_header(value: str) -> str:
-    return value.strip().lower().replace(" ", "_")
 
-
-def load_csv(path: Path) -> list[dict[str, str]]:
-    try:
-        with path.open(encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            if not reader.fieldnames:
-                raise SystemExit(f"CSV has no headers: {path}")
-            rows: list[dict[str, str]] = []
-            for row in reader:
-                rows.append({normalize_header(k): (v or "").strip() for k, v in row.items()})
-            return rows
-    except FileNotFoundError as exc:
-        raise SystemExit(f"CSV not found: {path}") from exc
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 def load_json(path: Path) -> list[dict[str, Any]]:
@@ -82,7 +71,7 @@ def parse_issues(value: str) -> list[str]:
     return [item for item in tokens if item]
 
 
-def build_reviews(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def build_reviews(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
     reviews: list[dict[str, Any]] = []
     for row in rows:
         reviewer = pick_value(
@@ -137,7 +126,12 @@ def scaffold_csv(path: Path) -> None:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Convert review exports into input JSON.")
     parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
-    parser.add_argument("--input", required=True, help="Path to review export (CSV or JSON).")
+    parser.add_argument("--input", required=True, help="Path to review export (CSV, XLSX or JSON).")
+    parser.add_argument(
+        "--sheet",
+        default=None,
+        help="XLSX sheet to read (default: every sheet sharing the first sheet's header).",
+    )
     parser.add_argument("--format", choices=("csv", "json"), default=None, help="Override input format.")
     parser.add_argument("--client-name", default=None, help="Client display name override.")
     parser.add_argument("--client-contact", default=None, help="Client contact email override.")
@@ -165,10 +159,11 @@ def main() -> None:
     output_path = Path(args.output) if args.output else output_dir / "review-templates-input.json"
 
     fmt = args.format or input_path.suffix.lstrip(".").lower()
+    rows: Iterable[dict[str, Any]]
     if fmt == "json":
         rows = load_json(input_path)
     else:
-        rows = load_csv(input_path)
+        rows = iter_rows(input_path, sheet=args.sheet)
 
     reviews = build_reviews(rows)
     if not reviews:
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""Build the internal link graph from cached site HTML snapshots.
+
+Reads data/outputs/<client>/reports/site-cache/index.json, extracts every
+internal <a href> from the cached pages, and writes an adjacency list to
+data/outputs/<client>/reports/site-link-graph.json. No live requests are made.
+
+Also computes internal PageRank and click depth from the homepage and writes
+them to data/outputs/<client>/reports/link-equity.json.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from html import unescape
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin, urlparse
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+
+SKIP_SCHEMES = ("#", "mailto:", "tel:", "javascript:", "data:", "sms:")
+# A regex scan is several times faster than a full HTML parse and only anchors are needed.
+ANCHOR_HREF_RE = re.compile(
+    r"<a\s[^>]*?\bhref\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))",
+    re.IGNORECASE,
+)
+BASE_HREF_RE = re.compile(
+    r"<base\s[^>]*?\bhref\s*=\s*(?:\"([^\"]*)\"|'([^']*)'|([^\s>]+))",
+    re.IGNORECASE,
+)
+COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+DAMPING = 0.85
+MAX_CLICK_DEPTH = 3
+# PageRank is skewed toward hubs, so most pages sit below the site average; only the
+# bottom quartile of cached pages by score counts as low equity.
+LOW_EQUITY_PERCENTILE = 0.25
+
+
+@dataclass
+class LinkGraph:
+    """Integer-indexed adjacency store; nodes are URLs, edges are unique per source."""
+
+    nodes: list[str] = field(default_factory=list)
+    cached: list[bool] = field(default_factory=list)
+    edges: list[list[int]] = field(default_factory=list)
+    index: dict[str, int] = field(default_factory=dict)
+
+    def node_id(self, url: str, cached: bool = False) -> int:
+        idx = self.index.get(url)
+        if idx is None:
+            idx = len(self.nodes)
+            self.index[url] = idx
+            self.nodes.append(url)
+            self.cached.append(cached)
+            self.edges.append([])
+        elif cached:
+            self.cached[idx] = True
+        return idx
+
+    @property
+    def edge_count(self) -> int:
+        return sum(len(targets) for targets in self.edges)
+
+    def in_degree(self) -> list[int]:
+        counts = [0] * len(self.nodes)
+        for source, targets in enumerate(self.edges):
+            for target in targets:
+                if target != source:
+                    counts[target] += 1
+        return counts
+
+    def reverse_edges(self) -> list[list[int]]:
+        reverse: list[list[int]] = [[] for _ in self.nodes]
+        for source, targets in enumerate(self.edges):
+            for target in targets:
+                reverse[target].append(source)
+        return reverse
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "nodes": [
+                {"id": idx, "url": url, "cached": self.cached[idx]}
+                for idx, url in enumerate(self.nodes)
+            ],
+            "edges": self.edges,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LinkGraph":
+        graph = cls()
+        for node in data.get("nodes", []):
+            graph.node_id(str(node["url"]), bool(node.get("cached")))
+        for source, targets in enumerate(data.get("edges", [])):
+            graph.edges[source] = [int(target) for target in targets]
+        return graph
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def url_key(url: str) -> str:
+    """Lookup key that ignores fragments, host case, a leading www. and trailing slashes."""
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    path = parsed.path.rstrip("/") or "/"
+    key = f"{host}{path}"
+    if parsed.query:
+        key = f"{key}?{parsed.query}"
+    return key
+
+
+def normalize_link(href: str, page_url: str, site_host: str) -> str | None:
+    if not href or href.lower().startswith(SKIP_SCHEMES):
+        return None
+    full = urljoin(page_url, href)
+    parsed = urlparse(full)
+    if parsed.scheme not in {"http", "https"}:
+        return None
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host != site_host:
+        return None
+    return parsed._replace(fragment="").geturl()
+
+
+def extract_hrefs(html: str) -> tuple[list[str], str]:
+    """Return raw <a href> values and the <base href> (if any), skipping HTML comments."""
+    if "<!--" in html:
+        html = COMMENT_RE.sub("", html)
+    hrefs: list[str] = []
+    for match in ANCHOR_HREF_RE.finditer(html):
+        value = next(group for group in match.groups() if group is not None).strip()
+        if value:
+            hrefs.append(unescape(value) if "&" in value else value)
+    base_match = BASE_HREF_RE.search(html)
+    base_href = ""
+    if base_match:
+        base_href = unescape(next(group for group in base_match.groups() if group is not None).strip())
+    return hrefs, base_href
+
+
+def extract_links(html: str, page_url: str, site_host: str) -> list[str]:
+    hrefs, base_href = extract_hrefs(html)
+    base_url = urljoin(page_url, base_href) if base_href else page_url
+    links: list[str] = []
+    for href in hrefs:
+        url = normalize_link(href, base_url, site_host)
+        if url:
+            links.append(url)
+    return links
+
+
+def load_cache_index(index_path: Path) -> dict[str, Path]:
+    try:
+        data = json.loads(index_path.read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise SystemExit(f"Cache index not found: {index_path}") from exc
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"Invalid JSON in {index_path}: {exc}") from exc
+    return {url: Path(meta["path"]) for url, meta in data.items() if meta.get("path")}
+
+
+def site_host_for(urls: list[str]) -> str:
+    for url in urls:
+        host = urlparse(url).netloc.lower()
+        if host:
+            return host[4:] if host.startswith("www.") else host
+    return ""
+
+
+def build_link_graph(cache: dict[str, Path]) -> LinkGraph:
+    """Extract internal links from every cached page and resolve them against the cache index.
+
+    Navigation links repeat on nearly every page, so href resolution is memoized:
+    root-relative hrefs per origin, everything else per base URL.
+    """
+    graph = LinkGraph()
+    known_by_key: dict[str, str] = {}
+    for url in cache:
+        known_by_key.setdefault(url_key(url), url)
+        graph.node_id(url, cached=True)
+
+    site_host = site_host_for(list(cache))
+    resolved: dict[tuple[str, str], int] = {}
+    for url, path in cache.items():
+        try:
+            html = path.read_text(encoding="utf-8", errors="ignore")
+        except FileNotFoundError:
+            continue
+        hrefs, base_href = extract_hrefs(html)
+        base_url = urljoin(url, base_href) if base_href else url
+        origin = "/".join(base_url.split("/", 3)[:3])
+        source = graph.index[url]
+        seen: set[int] = set()
+        targets = graph.edges[source]
+        for href in hrefs:
+            scope = origin if href.startswith("/") and not href.startswith("//") else base_url
+            memo_key = (scope, href)
+            target = resolved.get(memo_key)
+            if target is None:
+                link = normalize_link(href, base_url, site_host)
+                target = -1 if link is None else graph.node_id(known_by_key.setdefault(url_key(link), link))
+                resolved[memo_key] = target
+            if target < 0 or target in seen:
+                continue
+            seen.add(target)
+            targets.append(target)
+    return graph
+
+
+def find_orphans(graph: LinkGraph) -> list[str]:
+    """Cached pages that no other page links to (the homepage is exempt)."""
+    in_degree = graph.in_degree()
+    orphans: list[str] = []
+    for idx, url in enumerate(graph.nodes):
+        if not graph.cached[idx] or in_degree[idx]:
+            continue
+        if not urlparse(url).path.strip("/"):
+            continue
+        orphans.append(url)
+    return orphans
+
+
+def edge_lists(graph: LinkGraph) -> tuple[list[int], list[int]]:
+    sources: list[int] = []
+    targets: list[int] = []
+    for source, outgoing in enumerate(graph.edges):
+        for target in outgoing:
+            if target != source:
+                sources.append(source)
+                targets.append(target)
+    return sources, targets
+
+
+def _pagerank_numpy(
+    n: int, sources: list[int], targets: list[int], damping: float, tol: float, max_iter: int
+) -> list[float]:
+    src = np.asarray(sources, dtype=np.int64)
+    dst = np.asarray(targets, dtype=np.int64)
+    out_degree = np.bincount(src, minlength=n).astype(np.float64)
+    dangling = out_degree == 0
+    inv_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+    ranks = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        contrib = (ranks * inv_degree)[src]
+        updated = np.bincount(dst, weights=contrib, minlength=n)
+        leaked = ranks[dangling].sum()
+        updated = damping * (updated + leaked / n) + (1.0 - damping) / n
+        delta = np.abs(updated - ranks).sum()
+        ranks = updated
+        if delta < tol:
+            break
+    return ranks.tolist()
+
+
+def _pagerank_python(
+    n: int, sources: list[int], targets: list[int], damping: float, tol: float, max_iter: int
+) -> list[float]:
+    out_degree = [0] * n
+    for source in sources:
+        out_degree[source] += 1
+    dangling = [idx for idx in range(n) if not out_degree[idx]]
+    edges = list(zip(sources, targets))
+    ranks = [1.0 / n] * n
+    for _ in range(max_iter):
+        updated = [0.0] * n
+        for source, target in edges:
+            updated[target] += ranks[source] / out_degree[source]
+        leaked = sum(ranks[idx] for idx in dangling)
+        base = (1.0 - damping) / n + damping * leaked / n
+        updated = [base + damping * value for value in updated]
+        delta = sum(abs(new - old) for new, old in zip(updated, ranks))
+        ranks = updated
+        if delta < tol:
+            break
+    return ranks
+
+
+def pagerank(
+    graph: LinkGraph, damping: float = DAMPING, tol: float = 1e-6, max_iter: int = 100
+) -> list[float]:
+    """Internal PageRank per node (sums to 1); dangling nodes spread their rank uniformly.
+
+    Uses NumPy bincount scatter-adds when available, a pure Python power iteration otherwise.
+    """
+    n = len(graph.nodes)
+    if not n:
+        return []
+    sources, targets = edge_lists(graph)
+    if np is not None:
+        return _pagerank_numpy(n, sources, targets, damping, tol, max_iter)
+    return _pagerank_python(n, sources, targets, damping, tol, max_iter)
+
+
+def find_home(graph: LinkGraph) -> int | None:
+    for idx, url in enumerate(graph.nodes):
+        if graph.cached[idx] and not urlparse(url).path.strip("/"):
+            return idx
+    return None
+
+
+def click_depths(graph: LinkGraph, start: int | None) -> list[int | None]:
+    """Breadth-first click depth from start; None for unreachable nodes."""
+    depths: list[int | None] = [None] * len(graph.nodes)
+    if start is None:
+        return depths
+    depths[start] = 0
+    frontier = [start]
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier: list[int] = []
+        for node in frontier:
+            for target in graph.edges[node]:
+                if depths[target] is None:
+                    depths[target] = depth
+                    next_frontier.append(target)
+        frontier = next_frontier
+    return depths
+
+
+def needs_links(page: dict[str, Any]) -> bool:
+    """Bottom-quartile equity, too deep, or unreachable from the homepage."""
+    depth = page.get("depth")
+    return depth is None or depth > MAX_CLICK_DEPTH or page.get("percentile", 0) <= LOW_EQUITY_PERCENTILE
+
+
+def link_equity(graph: LinkGraph) -> list[dict[str, Any]]:
+    """Per cached page PageRank, click depth and link counts, highest equity first.
+
+    score is PageRank scaled so that 1.0 is the site average. percentile is the
+    share of cached pages whose score is at or below this page's, so pages
+    tied with many others (such as a hub's leaf pages) are not low equity.
+    """
+    ranks = pagerank(graph)
+    depths = click_depths(graph, find_home(graph))
+    in_degree = graph.in_degree()
+    n = len(graph.nodes)
+    pages = [
+        {
+            "url": url,
+            "pagerank": ranks[idx],
+            "score": round(ranks[idx] * n, 4),
+            "depth": depths[idx],
+            "inbound": in_degree[idx],
+            "outbound": len(graph.edges[idx]),
+        }
+        for idx, url in enumerate(graph.nodes)
+        if graph.cached[idx]
+    ]
+    pages.sort(key=lambda page: (-page["pagerank"], page["url"]))
+    scores = sorted(page["score"] for page in pages)
+    for position, page in enumerate(pages, start=1):
+        page["rank"] = position
+        page["percentile"] = round(bisect_right(scores, page["score"]) / len(scores), 4)
+        page["needs_links"] = needs_links(page)
+    return pages
+
+
+def summarize(graph: LinkGraph) -> dict[str, int]:
+    return {
+        "nodes": len(graph.nodes),
+        "cached_nodes": sum(1 for flag in graph.cached if flag),
+        "uncached_targets": sum(1 for flag in graph.cached if not flag),
+        "edges": graph.edge_count,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the internal link graph from the site cache.")
+    parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
+    args = parser.parse_args()
+
+    base_dir = Path("data") / "outputs" / args.client_slug / "reports"
+    cache = load_cache_index(base_dir / "site-cache" / "index.json")
+    graph = build_link_graph(cache)
+
+    output = {
+        "generated_at": now_iso(),
+        "summary": summarize(graph),
+        "orphans": find_orphans(graph),
+        **graph.to_dict(),
+    }
+    json_path = base_dir / "site-link-graph.json"
+    json_path.write_text(json.dumps(output), encoding="utf-8")
+    print(f"wrote {json_path}")
+
+    pages = link_equity(graph)
+    equity = {
+        "generated_at": now_iso(),
+        "damping": DAMPING,
+        "max_click_depth": MAX_CLICK_DEPTH,
+        "low_equity_percentile": LOW_EQUITY_PERCENTILE,
+        "total": len(pages),
+        "pages": pages,
+    }
+    equity_path = base_dir / "link-equity.json"
+    equity_path.write_text(json.dumps(equity, indent=2), encoding="utf-8")
+    print(f"wrote {equity_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Compiled multi-pattern matchers shared by the compliance linters.
+
+- LineScanner finds candidate lines with plain substring searches for each
+  pattern's literal anchors (C-speed str.find over the whole file) and only runs
+  the regexes on those lines.
+- PhraseMatcher folds a list of literal phrases into a single trie-shaped regex,
+  so "does any policy phrase occur in this text" is one C-level search.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable
+
+
+PLACEHOLDER_RE = re.compile(r"\[[^\]]+\](?!\()")
+TODO_RE = re.compile(r"\b(TODO|TBD|PLACEHOLDER|FIXME|TK)\b", re.IGNORECASE)
+CLAIM_RE = re.compile(
+    r"\b(best|top[- ]?rated|#1|number one|award[- ]?winning|guaranteed|guarantee|"
+    r"certified|licensed|insured|bonded)\b",
+    re.IGNORECASE,
+)
+SOURCE_RE = re.compile(r"\b(source needed|citation needed|\[source\]|source:\s*\[)\b", re.IGNORECASE)
+
+# Lowercase literals at least one of which must occur on a line for the pattern to match.
+ANCHORS: dict[re.Pattern[str], tuple[str, ...]] = {
+    PLACEHOLDER_RE: ("[",),
+    TODO_RE: ("todo", "tbd", "placeholder", "fixme", "tk"),
+    CLAIM_RE: (
+        "best",
+        "top",
+        "#1",
+        "number one",
+        "award",
+        "guarantee",
+        "certified",
+        "licensed",
+        "insured",
+        "bonded",
+    ),
+    SOURCE_RE: ("source", "citation"),
+}
+
+
+def _scoped(pattern: re.Pattern[str]) -> str:
+    if pattern.flags & re.IGNORECASE:
+        return f"(?i:{pattern.pattern})"
+    return f"(?:{pattern.pattern})"
+
+
+class LineScanner:
+    """Report which of several line patterns match each line, without a regex pass per line."""
+
+    def __init__(self, patterns: dict[str, re.Pattern[str]]) -> None:
+        self.patterns = list(patterns.items())
+        self.anchors = sorted({anchor for _, pattern in self.patterns for anchor in ANCHORS.get(pattern, ())})
+        unanchored = [pattern for _, pattern in self.patterns if pattern not in ANCHORS]
+        self.fallback = re.compile("|".join(_scoped(pattern) for pattern in unanchored)) if unanchored else None
+
+    def _candidate_starts(self, content: str) -> set[int]:
+        lowered = content.lower()
+        if len(lowered) != len(content):
+            # Lowercasing changed offsets (rare Unicode); every line is a candidate.
+            return {0} | {idx + 1 for idx, char in enumerate(content) if char == "\n"}
+        starts: set[int] = set()
+        for anchor in self.anchors:
+            pos = lowered.find(anchor)
+            while pos != -1:
+                starts.add(lowered.rfind("\n", 0, pos) + 1)
+                end = lowered.find("\n", pos)
+                if end == -1:
+                    break
+                pos = lowered.find(anchor, end + 1)
+        if self.fallback is not None:
+            match = self.fallback.search(content)
+            while match is not None:
+                starts.add(content.rfind("\n", 0, match.start()) + 1)
+                end = content.find("\n", match.start())
+                if end == -1:
+                    break
+                match = self.fallback.search(content, end + 1)
+        return starts
+
+    def scan(self, content: str) -> list[tuple[int, str, list[str]]]:
+        """Return (line number, line, matching kinds) for every line with a match."""
+        hits: list[tuple[int, str, list[str]]] = []
+        lineno = 1
+        counted = 0
+        for start in sorted(self._candidate_starts(content)):
+            end = content.find("\n", start)
+            if end == -1:
+                end = len(content)
+            line = content[start:end]
+            kinds = [kind for kind, pattern in self.patterns if pattern.search(line)]
+            if kinds:
+                lineno += content.count("\n", counted, start)
+                counted = start
+                hits.append((lineno, line, kinds))
+        return hits
+
+
+def _trie_pattern(node: dict[str, dict]) -> str:
+    if "" in node:
+        # A shorter phrase already ends here; for an "any phrase" test longer ones are redundant.
+        return ""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items())]
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+class PhraseMatcher:
+    """Substring test for many literal phrases at once (phrases are matched as given)."""
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.phrases = list(dict.fromkeys(phrase for phrase in phrases if phrase))
+        trie: dict[str, dict] = {}
+        for phrase in self.phrases:
+            node = trie
+            for char in phrase:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        self.regex = re.compile(_trie_pattern(trie)) if self.phrases else None
+
+    def search(self, text: str) -> bool:
+        return bool(self.regex and self.regex.search(text))
@@ -1,24 +1,43 @@
 #!/usr/bin/env python3
-"""Lint draft markdown files for placeholders and risky claims."""
+"""Lint draft markdown files for placeholders and risky claims.
+
+Results are cached per file in reports/.draft-compliance-lint-cache.json, keyed
+on the file's content hash plus a hash of the rule set (patterns, NAP inputs,
+rules version), so unchanged drafts are not re-linted. --watch keeps running and
+re-lints only the drafts that change.
+"""
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-import re
+import queue
+import sys
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable
 
+VALIDATION_DIR = Path(__file__).resolve().parent
+if str(VALIDATION_DIR) not in sys.path:
+    sys.path.append(str(VALIDATION_DIR))
+
+from compliance_matcher import CLAIM_RE, PLACEHOLDER_RE, TODO_RE, LineScanner
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # optional dependency
+    FileSystemEventHandler = object
+    Observer = None
 
-PLACEHOLDER_RE = re.compile(r"\[[^\]]+\](?!\()")
-TODO_RE = re.compile(r"\b(TODO|TBD|PLACEHOLDER|FIXME|TK)\b", re.IGNORECASE)
-CLAIM_RE = re.compile(
-    r"\b(best|top[- ]?rated|#1|number one|award[- ]?winning|guaranteed|guarantee|"
-    r"certified|licensed|insured|bonded)\b",
-    re.IGNORECASE,
-)
+
+LINE_SCANNER = LineScanner({"placeholder": PLACEHOLDER_RE, "todo": TODO_RE, "claim": CLAIM_RE})
+# Bump when lint_content/required_schema_for change so cached results are discarded.
+LINT_RULES_VERSION = "1"
+CACHE_FILENAME = ".draft-compliance-lint-cache.json"
 
 
 @dataclass
@@ -78,15 +97,14 @@ def required_schema_for(path: Path) -> list[str]:
 
 
 def lint_file(path: Path, nap: dict[str, str] | None = None) -> list[Issue]:
+    return lint_content(path, path.read_text(encoding="utf-8"), nap)
+
+
+def lint_content(path: Path, content: str, nap: dict[str, str] | None = None) -> list[Issue]:
     issues: list[Issue] = []
-    content = path.read_text(encoding="utf-8")
-    for idx, line in enumerate(content.splitlines(), start=1):
-        if PLACEHOLDER_RE.search(line):
-            issues.append(Issue(file=str(path), line=idx, kind="placeholder", text=line.strip()))
-        if TODO_RE.search(line):
-            issues.append(Issue(file=str(path), line=idx, kind="todo", text=line.strip()))
-        if CLAIM_RE.search(line):
-            issues.append(Issue(file=str(path), line=idx, kind="claim", text=line.strip()))
+    for idx, line, kinds in LINE_SCANNER.scan(content):
+        for kind in kinds:
+            issues.append(Issue(file=str(path), line=idx, kind=kind, text=line.strip()))
     required_schema = required_schema_for(path)
     missing_schema = [schema for schema in required_schema if schema.lower() not in content.lower()]
     if missing_schema:
@@ -120,6 +138,217 @@ def lint_file(path: Path, nap: dict[str, str] | None = None) -> list[Issue]:
     return issues
 
 
+def ruleset_hash(nap: dict[str, str] | None) -> str:
+    rules = {
+        "version": LINT_RULES_VERSION,
+        "patterns": [[kind, pattern.pattern, pattern.flags] for kind, pattern in LINE_SCANNER.patterns],
+        "nap": sorted((nap or {}).items()),
+    }
+    return hashlib.sha256(json.dumps(rules, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class LintCache:
+    """Per-file lint results keyed on (content hash, rule-set hash); stat data skips re-hashing."""
+
+    def __init__(self, path: Path, rules: str) -> None:
+        self.path = path
+        self.rules = rules
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        if path.exists():
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                data = {}
+            if data.get("rules") == rules:
+                self.entries = data.get("files", {})
+
+    def set_rules(self, rules: str) -> None:
+        """Switch to a new rule-set hash, dropping entries linted under the old one."""
+        if rules == self.rules:
+            return
+        self.rules = rules
+        self.entries = {}
+        self.dirty = True
+
+    def lint(self, path: Path, nap: dict[str, str] | None) -> list[Issue]:
+        key = str(path)
+        stat = path.stat()
+        entry = self.entries.get(key)
+        if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+            return [Issue(**item) for item in entry["issues"]]
+        raw = path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        if entry and entry.get("sha256") == digest:
+            issues = [Issue(**item) for item in entry["issues"]]
+        else:
+            issues = lint_content(path, raw.decode("utf-8"), nap)
+        self.entries[key] = {
+            "sha256": digest,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "issues": [issue.__dict__ for issue in issues],
+        }
+        self.dirty = True
+        return issues
+
+    def prune(self, files: Iterable[Path]) -> None:
+        keep = {str(path) for path in files}
+        for key in list(self.entries):
+            if key not in keep:
+                del self.entries[key]
+                self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"rules": self.rules, "files": self.entries}
+        self.path.write_text(json.dumps(payload), encoding="utf-8")
+        self.dirty = False
+
+
+def lint_files(files: list[Path], nap: dict[str, str], cache: LintCache | None) -> list[Issue]:
+    issues: list[Issue] = []
+    for path in files:
+        issues.extend(cache.lint(path, nap) if cache else lint_file(path, nap))
+    if cache:
+        cache.prune(files)
+        cache.save()
+    return issues
+
+
+def write_reports(report_dir: Path, issues: list[Issue]) -> None:
+    report_dir.mkdir(parents=True, exist_ok=True)
+    md_path = report_dir / "draft-compliance-lint.md"
+    json_path = report_dir / "draft-compliance-lint.json"
+
+    payload = {
+        "generated_at": now_iso(),
+        "total": len(issues),
+        "issues": [issue.__dict__ for issue in issues],
+    }
+
+    md_path.write_text(render_markdown(issues), encoding="utf-8")
+    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+    print(f"wrote {md_path}")
+    print(f"wrote {json_path}")
+
+
+class _ChangeHandler(FileSystemEventHandler):
+    """Queue markdown changes in watched directories and changes to individually watched files.
+
+    Both maps are keyed by resolved path and give back the path as the caller passed it,
+    so queued paths match the ones iter_markdown_files reports.
+    """
+
+    def __init__(self, changes: "queue.Queue[Path]", dirs: dict[Path, Path], files: dict[Path, Path]) -> None:
+        super().__init__()
+        self.changes = changes
+        self.dirs = dirs
+        self.files = files
+
+    def on_any_event(self, event) -> None:  # watchdog callback
+        for attr in ("src_path", "dest_path"):
+            value = getattr(event, attr, "")
+            if not value:
+                continue
+            path = Path(str(value)).resolve()
+            if path in self.files:
+                self.changes.put(self.files[path])
+            elif path.suffix == ".md" and path.parent in self.dirs:
+                self.changes.put(self.dirs[path.parent] / path.name)
+
+
+def snapshot(scan_paths: list[Path]) -> dict[Path, tuple[int, int]]:
+    state: dict[Path, tuple[int, int]] = {}
+    for path in iter_markdown_files(scan_paths):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def _watchdog_changes(scan_paths: list[Path], interval: float):
+    changes: "queue.Queue[Path]" = queue.Queue()
+    dirs = {path.resolve(): path for path in scan_paths if path.is_dir()}
+    # Single files cannot be watched directly: watch their directory and filter events to them.
+    files = {path.resolve(): path for path in scan_paths if not path.is_dir()}
+    handler = _ChangeHandler(changes, dirs, files)
+    observer = Observer()
+    for directory in sorted({*dirs, *(path.parent for path in files)}):
+        if directory.is_dir():
+            observer.schedule(handler, str(directory), recursive=False)
+    observer.start()
+    try:
+        while True:
+            batch = {changes.get()}
+            time.sleep(interval)  # debounce editor save bursts
+            while not changes.empty():
+                batch.add(changes.get_nowait())
+            yield batch
+    finally:
+        observer.stop()
+        observer.join()
+
+
+def _polled_changes(
+    scan_paths: list[Path],
+    interval: float,
+    previous: dict[Path, tuple[int, int]] | None = None,
+):
+    if previous is None:
+        previous = snapshot(scan_paths)
+    while True:
+        time.sleep(interval)
+        current = snapshot(scan_paths)
+        changed = {path for path, state in current.items() if previous.get(path) != state}
+        changed |= set(previous) - set(current)
+        previous = current
+        if changed:
+            yield changed
+
+
+def iter_changes(scan_paths: list[Path], interval: float):
+    """Yield batches of changed markdown paths; watchdog events if installed, else stat polling."""
+    if Observer is not None:
+        return _watchdog_changes(scan_paths, interval)
+    return _polled_changes(scan_paths, interval)
+
+
+def watch(
+    scan_paths: list[Path],
+    inputs_path: Path,
+    cache: LintCache,
+    report_dir: Path,
+    interval: float,
+) -> None:
+    """Re-lint drafts as they change; edits to inputs.md reload the NAP rules and re-lint everything."""
+    print(f"watching {', '.join(str(path) for path in scan_paths)} (Ctrl+C to stop)")
+    nap = parse_nap(inputs_path)
+    try:
+        for changed in iter_changes([*scan_paths, inputs_path], interval):
+            if inputs_path in changed:
+                changed.discard(inputs_path)
+                nap = parse_nap(inputs_path)
+                cache.set_rules(ruleset_hash(nap))
+                print(f"\n{inputs_path}: reloaded NAP inputs")
+            files = iter_markdown_files(scan_paths)
+            issues = lint_files(files, nap, cache)
+            for path in sorted(changed):
+                found = [issue for issue in issues if issue.file == str(path)]
+                state = "removed" if not path.exists() else f"{len(found)} issue(s)"
+                print(f"\n{path}: {state}")
+                for issue in found:
+                    print(f"- {issue.kind.upper()} | line {issue.line} | {issue.text}")
+            write_reports(report_dir, issues)
+    except KeyboardInterrupt:
+        print("stopped")
+
+
 def render_markdown(issues: list[Issue]) -> str:
     lines: list[str] = []
     lines.append("# Draft compliance lint report")
@@ -155,39 +384,31 @@ def main() -> None:
         default=None,
         help="Optional relative paths under data/outputs/<client> to scan (default: pages and articles).",
     )
+    parser.add_argument("--no-cache", action="store_true", help="Re-lint every file (ignored with --watch)")
+    parser.add_argument("--watch", action="store_true", help="Keep running and re-lint drafts as they change")
+    parser.add_argument("--interval", type=float, default=0.5, help="Watch debounce/poll interval seconds")
     args = parser.parse_args()
 
     base_dir = Path("data") / "outputs" / args.client_slug
     if not base_dir.exists():
         raise SystemExit(f"Client folder not found: {base_dir}")
 
-    nap = parse_nap(base_dir / "inputs.md")
+    inputs_path = base_dir / "inputs.md"
+    nap = parse_nap(inputs_path)
     if args.paths:
         scan_paths = [base_dir / Path(path) for path in args.paths]
     else:
         scan_paths = [base_dir / "pages", base_dir / "articles"]
 
-    files = iter_markdown_files(scan_paths)
-    issues: list[Issue] = []
-    for path in files:
-        issues.extend(lint_file(path, nap))
-
     report_dir = base_dir / "reports"
-    report_dir.mkdir(parents=True, exist_ok=True)
-    md_path = report_dir / "draft-compliance-lint.md"
-    json_path = report_dir / "draft-compliance-lint.json"
-
-    payload = {
-        "generated_at": now_iso(),
-        "total": len(issues),
-        "issues": [issue.__dict__ for issue in issues],
-    }
-
-    md_path.write_text(render_markdown(issues), encoding="utf-8")
-    json_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    cache = None
+    if args.watch or not args.no_cache:
+        cache = LintCache(report_dir / CACHE_FILENAME, ruleset_hash(nap))
+    files = iter_markdown_files(scan_paths)
+    write_reports(report_dir, lint_files(files, nap, cache))
 
-    print(f"wrote {md_path}")
-    print(f"wrote {json_path}")
+    if args.watch:
+        watch(scan_paths, inputs_path, cache, report_dir, args.interval)
 
 
 if __name__ == "__main__":
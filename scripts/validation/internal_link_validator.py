@@ -3,16 +3,42 @@
 
 Reads data/outputs/<client>/reports/metadata-internal-link-map.json and produces
 data/outputs/<client>/reports/internal-link-validation.json/.md.
+
+With --site-cache, also checks the links that actually exist on the cached
+pages (site-cache/index.json): targets missing from the cache are checked with
+pooled HEAD requests and 4xx/5xx responses, redirect chains and orphan pages
+are reported, along with pages whose internal PageRank or click depth says
+they need more internal links.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+INGEST_DIR = Path(__file__).resolve().parents[1] / "ingest"
+if str(INGEST_DIR) not in sys.path:
+    sys.path.append(str(INGEST_DIR))
+
+from site_link_graph import (
+    LinkGraph,
+    build_link_graph,
+    find_orphans,
+    link_equity,
+    load_cache_index,
+)
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # optional dependency
+    requests = None
 
 
 REQUIRED_LINK_TYPES = {
@@ -90,7 +116,147 @@ def validate_page(page: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def render_markdown(results: list[dict[str, Any]], client_name: str) -> str:
+def make_http_checker(timeout: int, workers: int) -> Callable[[str], dict[str, Any]]:
+    """Return a HEAD checker backed by one keep-alive session sized for the worker pool."""
+    if requests is None:
+        raise SystemExit("requests is required for --site-cache HEAD checks (or pass --skip-head)")
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    def check(url: str) -> dict[str, Any]:
+        try:
+            resp = session.head(url, timeout=timeout, allow_redirects=True)
+            if resp.status_code in {405, 501}:
+                resp = session.get(url, timeout=timeout, allow_redirects=True, stream=True)
+                resp.close()
+        except requests.RequestException as exc:
+            return {"url": url, "status": 0, "redirects": [], "final_url": url, "error": str(exc)}
+        return {
+            "url": url,
+            "status": resp.status_code,
+            "redirects": [hop.url for hop in resp.history],
+            "final_url": resp.url,
+            "error": "",
+        }
+
+    return check
+
+
+def check_targets(
+    urls: list[str],
+    checker: Callable[[str], dict[str, Any]],
+    workers: int,
+) -> dict[str, dict[str, Any]]:
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return {result["url"]: result for result in pool.map(checker, urls)}
+
+
+def validate_site_cache(
+    graph: LinkGraph,
+    checker: Callable[[str], dict[str, Any]] | None,
+    workers: int = 8,
+) -> dict[str, Any]:
+    """Report broken targets, redirect chains and orphans for the cached link graph."""
+    uncached = [url for idx, url in enumerate(graph.nodes) if not graph.cached[idx]]
+    checks = check_targets(uncached, checker, workers) if checker else {}
+
+    reverse = graph.reverse_edges()
+    broken: list[dict[str, Any]] = []
+    redirects: list[dict[str, Any]] = []
+    for url, result in sorted(checks.items()):
+        sources = sorted(graph.nodes[src] for src in reverse[graph.index[url]])
+        status = result.get("status", 0)
+        if status == 0 or status >= 400:
+            broken.append(
+                {
+                    "url": url,
+                    "status": status,
+                    "error": result.get("error", ""),
+                    "linked_from": sources,
+                }
+            )
+        elif result.get("redirects"):
+            redirects.append(
+                {
+                    "url": url,
+                    "chain": result["redirects"][1:] + [result.get("final_url", url)],
+                    "hops": len(result["redirects"]),
+                    "linked_from": sources,
+                }
+            )
+
+    orphans = find_orphans(graph)
+    low_equity = [page for page in link_equity(graph) if page["needs_links"]]
+    low_equity.sort(key=lambda page: page["pagerank"])
+    return {
+        "summary": {
+            "pages": sum(1 for flag in graph.cached if flag),
+            "edges": graph.edge_count,
+            "uncached_targets": len(uncached),
+            "checked": len(checks),
+            "broken": len(broken),
+            "redirects": len(redirects),
+            "orphans": len(orphans),
+            "needs_links": len(low_equity),
+        },
+        "broken": broken,
+        "redirects": redirects,
+        "orphans": orphans,
+        "needs_links": low_equity,
+    }
+
+
+def render_site_cache_markdown(report: dict[str, Any]) -> list[str]:
+    lines: list[str] = []
+    summary = report.get("summary", {})
+    lines.append("## Site cache link check")
+    lines.append(
+        f"- Pages: {summary.get('pages', 0)} | Edges: {summary.get('edges', 0)} | "
+        f"Uncached targets: {summary.get('uncached_targets', 0)} (checked {summary.get('checked', 0)})"
+    )
+    lines.append("")
+    lines.append("### Broken links (4xx/5xx)")
+    for item in report.get("broken", []):
+        status = item.get("status") or item.get("error") or "no response"
+        lines.append(f"- {item.get('url')} ({status}) <- {', '.join(item.get('linked_from', []))}")
+    if not report.get("broken"):
+        lines.append("- [None]")
+    lines.append("")
+    lines.append("### Redirect chains")
+    for item in report.get("redirects", []):
+        chain = " -> ".join([item.get("url", "")] + item.get("chain", []))
+        lines.append(f"- {chain} ({item.get('hops')} hops)")
+    if not report.get("redirects"):
+        lines.append("- [None]")
+    lines.append("")
+    lines.append("### Orphan pages")
+    for url in report.get("orphans", []):
+        lines.append(f"- {url}")
+    if not report.get("orphans"):
+        lines.append("- [None]")
+    lines.append("")
+    lines.append("### Pages needing internal links (lowest PageRank first)")
+    for page in report.get("needs_links", []):
+        depth = page.get("depth")
+        depth_label = "unreachable" if depth is None else f"depth {depth}"
+        lines.append(
+            f"- {page.get('url')} (score {page.get('score')}, {depth_label}, {page.get('inbound')} inbound)"
+        )
+    if not report.get("needs_links"):
+        lines.append("- [None]")
+    lines.append("")
+    return lines
+
+
+def render_markdown(
+    results: list[dict[str, Any]],
+    client_name: str,
+    site_cache: dict[str, Any] | None = None,
+) -> str:
     lines: list[str] = []
     lines.append(f"# Internal Link Validation: {client_name}")
     lines.append("")
@@ -104,6 +270,8 @@ def render_markdown(results: list[dict[str, Any]], client_name: str) -> str:
             for issue in issues:
                 lines.append(f"- {issue.get('kind')}: {issue.get('detail')}")
         lines.append("")
+    if site_cache:
+        lines.extend(render_site_cache_markdown(site_cache))
     return "\n".join(lines)
 
 
@@ -116,6 +284,14 @@ def summarize(results: list[dict[str, Any]]) -> dict[str, int]:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Validate internal links from metadata link map.")
     parser.add_argument("--client-slug", required=True, help="Client slug under data/outputs/")
+    parser.add_argument(
+        "--site-cache",
+        action="store_true",
+        help="Also check links found on cached pages (site-cache/index.json)",
+    )
+    parser.add_argument("--skip-head", action="store_true", help="Do not HEAD-check uncached targets")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent HEAD requests")
+    parser.add_argument("--timeout", type=int, default=15, help="HEAD request timeout seconds")
     args = parser.parse_args()
 
     base_dir = Path("data") / "outputs" / args.client_slug / "reports"
@@ -136,12 +312,19 @@ def main() -> None:
         "results": results,
     }
 
+    site_cache = None
+    if args.site_cache:
+        graph = build_link_graph(load_cache_index(base_dir / "site-cache" / "index.json"))
+        checker = None if args.skip_head else make_http_checker(args.timeout, args.workers)
+        site_cache = validate_site_cache(graph, checker, args.workers)
+        output["site_cache"] = site_cache
+
     base_dir.mkdir(parents=True, exist_ok=True)
     json_path = base_dir / "internal-link-validation.json"
     json_path.write_text(json.dumps(output, indent=2), encoding="utf-8")
 
     md_path = base_dir / "internal-link-validation.md"
-    md_path.write_text(render_markdown(results, client_name), encoding="utf-8")
+    md_path.write_text(render_markdown(results, client_name, site_cache), encoding="utf-8")
 
     print(f"wrote {json_path}")
     print(f"wrote {md_path}")
@@ -4,11 +4,16 @@
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass
+import hashlib
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
-from .io_utils import write_json, write_markdown
+from .column_table import ColumnTable
+from .io_utils import COLUMNAR_SUFFIXES, file_digest, read_table, write_json, write_markdown
+
+CACHE_DIRNAME = ".cache"
 
 
 @dataclass
@@ -16,16 +21,21 @@ class ProgramConfig:
     client_name: str
     client_slug: str
     output_dir: Path
+    use_cache: bool = False
 
     @classmethod
     def from_args(cls, args: Any) -> "ProgramConfig":
         output_dir = Path(args.output_dir)
-        return cls(args.client_name, args.client_slug, output_dir)
+        return cls(args.client_name, args.client_slug, output_dir, getattr(args, "cache", False))
 
 
 @dataclass
 class ProgramInputs:
     values: dict[str, str]
+    # Loaded tables by (path, columns); pass one dict to several inputs to share loads.
+    tables: dict[tuple[Path, tuple[str, ...] | None], ColumnTable] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     def require_path(self, key: str) -> Path:
         value = self.values.get(key)
@@ -36,6 +46,22 @@ class ProgramInputs:
             raise SystemExit(f"Input not found: {path}")
         return path
 
+    def load_table(self, key: str, columns: Iterable[str] | None = None) -> ColumnTable:
+        """Read the file named by an input once; later calls reuse its rows and cached columns."""
+        path = self.require_path(key).resolve()
+        # CSVs are always read whole, so the requested columns only matter for columnar files.
+        wanted = tuple(columns) if columns is not None and path.suffix.lower() in COLUMNAR_SUFFIXES else None
+        cache_key = (path, wanted)
+        if cache_key not in self.tables:
+            self.tables[cache_key] = ColumnTable(read_table(path, wanted))
+        return self.tables[cache_key]
+
+    def fingerprint(self) -> dict[str, Any]:
+        """Input values plus a content hash of every value that names a file."""
+        values = dict(sorted(self.values.items()))
+        files = {key: file_digest(Path(value)) for key, value in values.items() if value and Path(value).is_file()}
+        return {"values": values, "files": files}
+
     def require_text(self, key: str) -> str:
         value = (self.values.get(key) or "").strip()
         if not value:
@@ -49,25 +75,70 @@ class ProgramOutput:
     report_md: str
     report_path: Path
     json_path: Path
+    cached: bool = False
 
-    def write(self) -> None:
-        write_markdown(self.report_path, self.report_md)
-        write_json(self.json_path, self.payload)
+    def write(self) -> bool:
+        """Write both outputs, leaving files that already hold the same bytes untouched."""
+        wrote_md = write_markdown(self.report_path, self.report_md)
+        wrote_json = write_json(self.json_path, self.payload)
+        return wrote_md or wrote_json
 
 
 class ProgramRunner(abc.ABC):
+    # Bump when execute() or render_report() change output so cached results are recomputed.
+    version = "1"
+
     def __init__(self, config: ProgramConfig, inputs: ProgramInputs) -> None:
         self.config = config
         self.inputs = inputs
 
     def run(self) -> ProgramOutput:
-        data = self.execute()
-        report_md = self.render_report(data)
         report_path, json_path = self.get_output_paths()
-        output = ProgramOutput(data, report_md, report_path, json_path)
+        key = self.cache_key() if self.config.use_cache else ""
+        cached = self.load_cached(key) if key else None
+        if cached:
+            output = ProgramOutput(cached["payload"], cached["report_md"], report_path, json_path, cached=True)
+        else:
+            data = self.execute()
+            output = ProgramOutput(data, self.render_report(data), report_path, json_path)
         output.write()
+        if key and not cached:
+            write_json(self.cache_path(), {"key": key, "payload": output.payload, "report_md": output.report_md})
         return output
 
+    def cache_key(self) -> str:
+        """Identify a run by program class, its version, the client it reports on, and the inputs it reads."""
+        cls = type(self)
+        parts = {
+            "program": f"{cls.__module__}.{cls.__qualname__}",
+            "version": cls.version,
+            # Reports are titled with client_name, so a rename must not reuse the old report.
+            "client": {"name": self.config.client_name, "slug": self.config.client_slug},
+            **self.inputs.fingerprint(),
+        }
+        implicit = self.implicit_inputs()
+        if implicit:
+            parts["implicit"] = {key: [str(path), file_digest(path)] for key, path in sorted(implicit.items())}
+        return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def implicit_inputs(self) -> dict[str, Path]:
+        """Files a run reads that are not named by an input value, e.g. earlier steps' outputs."""
+        return {}
+
+    def cache_path(self) -> Path:
+        base = self.config.output_dir / self.config.client_slug / "reports" / CACHE_DIRNAME
+        return base / f"{self.report_basename()}.json"
+
+    def load_cached(self, key: str) -> dict[str, Any] | None:
+        path = self.cache_path()
+        if not path.exists():
+            return None
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            return None
+        return cached if cached.get("key") == key else None
+
     @abc.abstractmethod
     def execute(self) -> dict[str, Any]:
         raise NotImplementedError
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Column views over loaded report rows, with cached numeric conversions."""
+
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Iterable, Sequence
+
+from .metrics_utils import to_float, to_int
+
+
+def _convert(values: list[str], convert: Callable[[str], float], fast: Callable[[str], float]) -> list:
+    """Convert a text column; bad cells become None so rows outside a selection cannot fail a report."""
+    converted = []
+    append = converted.append
+    for value in values:
+        try:
+            # Plain numbers skip the comma/blank cleanup; fast() accepts exactly what convert() does for them.
+            append(fast(value))
+        except ValueError:
+            try:
+                append(convert(value))
+            except ValueError:
+                append(None)
+    return converted
+
+
+class ColumnTable:
+    """Rows of one export plus columns built on first use.
+
+    Text columns coalesce one or more keys the way pick_value does. Numeric
+    columns are converted once with to_int/to_float and reused by every sum
+    and top-k, optionally restricted to a list of row positions.
+    """
+
+    def __init__(self, rows: list[dict[str, str]]) -> None:
+        self.rows = rows
+        self._columns: dict[tuple, list] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, *names: str) -> list[str]:
+        key = ("text",) + names
+        if key not in self._columns:
+            if len(names) == 1:
+                name = names[0]
+                values = [row.get(name) or "" for row in self.rows]
+            else:
+                values = [next((row[name] for name in names if row.get(name)), "") for row in self.rows]
+            self._columns[key] = values
+        return self._columns[key]
+
+    def ints(self, *names: str) -> list[int | None]:
+        return self._numbers("int", names, to_int, int)
+
+    def floats(self, *names: str) -> list[float | None]:
+        return self._numbers("float", names, to_float, float)
+
+    def derived(self, name: str, func: Callable[[str], object], *names: str) -> list:
+        """A column computed from a text column, cached under name."""
+        key = ("derived", name) + names
+        if key not in self._columns:
+            self._columns[key] = [func(value) for value in self.column(*names)]
+        return self._columns[key]
+
+    def take(self, values: Sequence, positions: Iterable[int] | None = None, label: str = "") -> list:
+        """Values at positions (all rows when None); a label marks numeric columns to validate."""
+        taken = list(values) if positions is None else [values[pos] for pos in positions]
+        if label and None in taken:
+            raise SystemExit(f"Non-numeric {label} value in report rows.")
+        return taken
+
+    def sum(self, name: str, positions: Iterable[int] | None = None) -> int:
+        return sum(self.take(self.ints(name), positions, name))
+
+    def top(
+        self, values: Sequence[float], limit: int, positions: Iterable[int] | None = None
+    ) -> list[int]:
+        """Positions of the largest values; ties keep row order, as a stable sort would."""
+        candidates = range(len(values)) if positions is None else positions
+        return heapq.nlargest(limit, candidates, key=values.__getitem__)
+
+    def _numbers(
+        self, kind: str, names: tuple[str, ...], convert: Callable[[str], float], fast: Callable[[str], float]
+    ) -> list:
+        key = (kind,) + names
+        if key not in self._columns:
+            self._columns[key] = _convert(self.column(*names), convert, fast)
+        return self._columns[key]
@@ -4,31 +4,98 @@
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 from pathlib import Path
 from typing import Iterable
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # optional dependency
+    pa = None
+    pc = None
+    pq = None
+
+
+COLUMNAR_SUFFIXES = {".parquet", ".arrow", ".feather"}
+
 
 def read_csv(path: Path) -> list[dict[str, str]]:
     with path.open(encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        if not reader.fieldnames:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if not header:
             raise SystemExit(f"CSV has no headers: {path}")
-        return [normalize_row(row) for row in reader]
+        # Normalize the header once instead of every key of every row.
+        keys = [normalize_key(key) for key in header]
+        width = len(keys)
+        rows = []
+        for values in reader:
+            if not values:
+                continue
+            if len(values) < width:
+                values += [""] * (width - len(values))
+            rows.append(dict(zip(keys, [value.strip() for value in values])))
+        return rows
+
+
+def read_table(path: Path, columns: Iterable[str] | None = None) -> list[dict[str, str]]:
+    """Rows of a CSV or of a Parquet/Arrow export written by the ingesters.
+
+    Columnar files are read lazily: only the requested columns that exist are
+    loaded (Arrow IPC files are memory-mapped). Values come back as the same
+    text the CSV path produces so programs can treat both alike.
+    """
+    if path.suffix.lower() not in COLUMNAR_SUFFIXES:
+        return read_csv(path)
+    if pa is None:
+        raise SystemExit(f"Reading {path} requires pyarrow (pip install pyarrow).")
+    if path.suffix.lower() == ".parquet":
+        names = pq.read_schema(path).names
+        selected = [name for name in columns if name in names] if columns is not None else None
+        table = pq.read_table(path, columns=selected)
+    else:
+        table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+        if columns is not None:
+            table = table.select([name for name in columns if name in table.column_names])
+    # Arrow's own cast formats whole floats without ".0", matching the CSV text.
+    text = [pc.cast(column, pa.string()).fill_null("") for column in table.columns]
+    return pa.Table.from_arrays(text, names=table.column_names).to_pylist()
 
 
 def read_json(path: Path) -> dict:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def write_json(path: Path, payload: dict) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+def write_json(path: Path, payload: dict) -> bool:
+    return write_text_if_changed(path, json.dumps(payload, indent=2))
 
 
-def write_markdown(path: Path, content: str) -> None:
+def write_markdown(path: Path, content: str) -> bool:
+    return write_text_if_changed(path, content)
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    """Write content unless the file already holds exactly these bytes; returns whether it wrote."""
+    data = content.encode("utf-8")
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    path.write_bytes(data)
+    return True
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as handle:
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def normalize_row(row: dict[str, str]) -> dict[str, str]:
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Group keywords by text similarity and shared SERP results."""
+
+from __future__ import annotations
+
+import json
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable
+
+from scripts.ingest.serp_dataforseo_fetch import extract_items
+
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(TOKEN_PATTERN.findall(keyword.lower()))
+
+
+def keyword_features(text: str, ngram: int = 3) -> set[str]:
+    """Word unigrams and bigrams plus character n-grams of a normalized keyword."""
+    tokens = text.split()
+    features = {f"w:{token}" for token in tokens}
+    features.update(f"b:{left} {right}" for left, right in zip(tokens, tokens[1:]))
+    padded = f" {text} "
+    features.update(padded[pos : pos + ngram] for pos in range(len(padded) - ngram + 1))
+    return features
+
+
+def load_serp_results(path: Path, depth: int = 10) -> dict[str, set[str]]:
+    """Organic result URLs per normalized keyword from a serp_dataforseo_fetch export."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    response = data.get("response", data)
+    results: dict[str, list[str]] = {}
+    for item in extract_items(response):
+        if item.get("type") != "organic" or not item.get("url"):
+            continue
+        urls = results.setdefault(normalize_keyword(item.get("keyword") or ""), [])
+        if len(urls) < depth:
+            urls.append(item["url"])
+    return {keyword: set(urls) for keyword, urls in results.items() if keyword}
+
+
+class UnionFind:
+    def __init__(self, size: int) -> None:
+        self.parent = list(range(size))
+        self.size = [1] * size
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, left: int, right: int) -> bool:
+        left, right = self.find(left), self.find(right)
+        if left == right:
+            return False
+        if self.size[left] < self.size[right]:
+            left, right = right, left
+        self.parent[right] = left
+        self.size[left] += self.size[right]
+        return True
+
+
+@dataclass
+class KeywordClusterer:
+    """Cluster keywords whose n-gram sets are similar or whose SERPs overlap.
+
+    Keywords are visited by volume and join the most similar existing leader
+    (Jaccard over their feature sets), so clusters do not chain through
+    near-duplicates. Leaders are found through a prefix-filtered inverted index:
+    features are ordered rarest first and only the first few are indexed, which
+    still finds every leader at or above the threshold without comparing all
+    pairs. SERP overlaps then merge whole clusters with union-find.
+    """
+
+    threshold: float = 0.5
+    serp_min_shared: int = 3
+    serp: dict[str, set[str]] = field(default_factory=dict)
+
+    def cluster(self, keywords: list[str], volumes: Iterable[int] | None = None) -> dict[str, list[str]]:
+        """Clusters labelled by their highest-volume keyword, in first-seen order."""
+        weights = list(volumes) if volumes is not None else [0] * len(keywords)
+        texts: dict[str, int] = {}
+        members: list[int] = []
+        peak: list[int] = []
+        for keyword, weight in zip(keywords, weights):
+            member = texts.setdefault(normalize_keyword(keyword), len(texts))
+            if member == len(peak):
+                peak.append(weight)
+            peak[member] = max(peak[member], weight)
+            members.append(member)
+        groups = UnionFind(len(texts))
+        self._join_similar(list(texts), peak, groups)
+        self._join_serp_overlap(texts, groups)
+
+        labels: dict[int, tuple[int, str]] = {}
+        clusters: dict[int, list[str]] = {}
+        for keyword, member, weight in zip(keywords, members, weights):
+            root = groups.find(member)
+            clusters.setdefault(root, []).append(keyword)
+            if root not in labels or weight > labels[root][0]:
+                labels[root] = (weight, keyword)
+        return {labels[root][1]: values for root, values in clusters.items()}
+
+    def _join_similar(self, texts: list[str], weights: list[int], groups: UnionFind) -> None:
+        """Attach each keyword, highest volume first, to its most similar leader or make it one."""
+        feature_sets = [keyword_features(text) for text in texts]
+        frequency = Counter(feature for features in feature_sets for feature in features)
+        rank = {feature: pos for pos, (feature, _) in enumerate(sorted(frequency.items(), key=lambda item: item[1]))}
+        encoded = [sorted(rank[feature] for feature in features) for features in feature_sets]
+        sets = [set(features) for features in encoded]
+        index: dict[int, list[int]] = {}
+        for item in sorted(range(len(texts)), key=lambda pos: -weights[pos]):
+            features = encoded[item]
+            size = len(features)
+            if not size:
+                continue
+            prefix = features[: size - math.ceil(self.threshold * size) + 1]
+            best, best_score = -1, self.threshold
+            seen: set[int] = set()
+            for feature in prefix:
+                for leader in index.get(feature, ()):
+                    if leader in seen:
+                        continue
+                    seen.add(leader)
+                    other = len(sets[leader])
+                    if other < self.threshold * size or size < self.threshold * other:
+                        continue
+                    shared = len(sets[item] & sets[leader])
+                    score = shared / (size + other - shared)
+                    if score > best_score or (score == best_score and best < 0):
+                        best, best_score = leader, score
+            if best >= 0:
+                groups.union(best, item)
+                continue
+            for feature in prefix:
+                index.setdefault(feature, []).append(item)
+
+    def _join_serp_overlap(self, texts: dict[str, int], groups: UnionFind) -> None:
+        if not self.serp or self.serp_min_shared <= 0:
+            return
+        by_url: dict[str, list[int]] = {}
+        for text, urls in self.serp.items():
+            if text in texts:
+                for url in urls:
+                    by_url.setdefault(url, []).append(texts[text])
+        for item_text, urls in self.serp.items():
+            item = texts.get(item_text)
+            if item is None:
+                continue
+            shared = Counter(other for url in urls for other in by_url[url] if other > item)
+            for other, count in shared.items():
+                if count >= self.serp_min_shared:
+                    groups.union(item, other)
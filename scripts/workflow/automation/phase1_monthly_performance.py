@@ -3,14 +3,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, ClassVar, Sequence
 
 from .base import ProgramConfig, ProgramInputs, ProgramRunner
-from .io_utils import pick_value, read_csv
-from .metrics_utils import safe_div, sum_metric, to_float, to_int
+from .column_table import ColumnTable
+from .io_utils import pick_value, read_table
+from .metrics_utils import safe_div
 from .report_templates import render_list, render_section, render_table
 
 
@@ -28,14 +30,72 @@ def parse_date(value: str) -> datetime | None:
     return None
 
 
+DATE_KEYS = ("date", "day", "date_range")
+
+
+@dataclass
+class DateIndex:
+    """Row positions sorted by parsed date, built once per report."""
+
+    dates: list[datetime]
+    positions: list[int]
+    undated: list[int]
+
+    @classmethod
+    def build(cls, rows: list[dict[str, str]]) -> "DateIndex":
+        parsed: dict[str, datetime | None] = {}
+        dated: list[tuple[datetime, int]] = []
+        undated: list[int] = []
+        for pos, row in enumerate(rows):
+            value = pick_value(row, DATE_KEYS)
+            if not value:
+                undated.append(pos)
+                continue
+            # Daily exports repeat each date on many rows; parse every distinct value once.
+            if value not in parsed:
+                parsed[value] = parse_date(value)
+            row_date = parsed[value]
+            if row_date is not None:
+                dated.append((row_date, pos))
+        dated.sort()
+        return cls([item[0] for item in dated], [item[1] for item in dated], undated)
+
+    def select(self, start: datetime, end: datetime) -> list[int]:
+        """Positions of undated rows and rows dated within [start, end], in original order."""
+        low = bisect_left(self.dates, start)
+        high = bisect_right(self.dates, end)
+        return sorted(self.positions[low:high] + self.undated)
+
+
 @dataclass
 class CsvReportBase:
     rows: list[dict[str, str]]
     date_range: tuple[datetime, datetime] | None = None
+    _table: ColumnTable | None = field(default=None, init=False, repr=False, compare=False)
+    _index: DateIndex | None = field(default=None, init=False, repr=False, compare=False)
+    _cached_rows: tuple[int, int] = field(default=(0, -1), init=False, repr=False, compare=False)
+    _cache: dict[tuple[Any, ...], Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Columns read from Parquet/Arrow exports; CSVs are always read whole.
+    COLUMNS: ClassVar[tuple[str, ...]] = DATE_KEYS
 
     @classmethod
     def import_csv(cls, path: Path) -> "CsvReportBase":
-        return cls(read_csv(path))
+        return cls(read_table(path, cls.COLUMNS))
+
+    @classmethod
+    def from_table(cls, table: ColumnTable) -> "CsvReportBase":
+        """Wrap a table loaded through ProgramInputs, reusing its cached columns."""
+        report = cls(table.rows)
+        report._table = table
+        report._cached_rows = (id(table.rows), len(table.rows))
+        return report
+
+    @property
+    def table(self) -> ColumnTable:
+        if self._table is None:
+            self._table = ColumnTable(self.rows)
+        return self._table
 
     def set_date_range(self, start: str | None, end: str | None) -> None:
         if not start or not end:
@@ -49,92 +109,121 @@ class CsvReportBase:
     def filtered_rows(self) -> list[dict[str, str]]:
         if not self.date_range:
             return self.rows
-        return [row for row in self.rows if self._row_in_range(row)]
-
-    def _row_in_range(self, row: dict[str, str]) -> bool:
-        value = pick_value(row, ("date", "day", "date_range"))
-        if not value or not self.date_range:
-            return True
-        row_date = parse_date(value)
-        if not row_date:
-            return False
+        rows = self.rows
+        return self._memo("rows", lambda: [rows[pos] for pos in self.positions()])
+
+    def positions(self) -> Sequence[int]:
+        """Row positions inside the date range (every row when no range is set)."""
+        if not self.date_range:
+            return range(len(self.rows))
+        return self._memo("positions", self._select_positions)
+
+    def metric_total(self, key: str) -> int:
+        """Sum of an int column over the filtered rows, computed once per date range."""
+        return self._memo(("sum", key), lambda: self.table.sum(key, self.positions()))
+
+    def _memo(self, name: Any, compute: Callable[[], Any]) -> Any:
+        rows_key = (id(self.rows), len(self.rows))
+        if self._cached_rows != rows_key:
+            # Rows were replaced or appended: drop the columns, the index and every cached result.
+            self._table = None
+            self._index = None
+            self._cache.clear()
+            self._cached_rows = rows_key
+        key = (name, self.date_range)
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def _select_positions(self) -> list[int]:
+        if self._index is None:
+            self._index = DateIndex.build(self.rows)
         start, end = self.date_range
-        return start <= row_date <= end
+        return self._index.select(start, end)
 
 
 class GA4Report(CsvReportBase):
+    COLUMNS = DATE_KEYS + ("sessions", "conversions", "users", "engaged_sessions", "page", "page_path")
+
     def get_sessions(self) -> int:
-        return sum_metric(self.filtered_rows(), "sessions")
+        return self.metric_total("sessions")
 
     def get_conversions(self) -> int:
-        return sum_metric(self.filtered_rows(), "conversions")
+        return self.metric_total("conversions")
 
     def get_users(self) -> int:
-        return sum_metric(self.filtered_rows(), "users")
+        return self.metric_total("users")
 
     def get_engaged_sessions(self) -> int:
-        return sum_metric(self.filtered_rows(), "engaged_sessions")
+        return self.metric_total("engaged_sessions")
 
     def get_top_pages(self, limit: int = 10) -> list[dict[str, Any]]:
-        rows = self.filtered_rows()
-        scored = [
-            {"page": pick_value(row, ("page", "page_path")), "sessions": to_int(row.get("sessions", ""))}
-            for row in rows
-        ]
-        ranked = sorted(scored, key=lambda item: item["sessions"], reverse=True)
-        return [item for item in ranked if item["page"]][:limit]
+        return list(self._memo(("top_pages", limit), lambda: self._rank_pages(limit)))
+
+    def _rank_pages(self, limit: int) -> list[dict[str, Any]]:
+        table = self.table
+        positions = self.positions()
+        sessions = table.ints("sessions")
+        table.take(sessions, positions, "sessions")
+        pages = table.column("page", "page_path")
+        candidates = [pos for pos in positions if pages[pos]]
+        return [{"page": pages[pos], "sessions": sessions[pos]} for pos in table.top(sessions, limit, candidates)]
 
 
 class GBPReport(CsvReportBase):
+    COLUMNS = DATE_KEYS + ("profile_views", "calls", "directions", "website_clicks")
+
     def get_profile_views(self) -> int:
-        return sum_metric(self.filtered_rows(), "profile_views")
+        return self.metric_total("profile_views")
 
     def get_calls(self) -> int:
-        return sum_metric(self.filtered_rows(), "calls")
+        return self.metric_total("calls")
 
     def get_directions(self) -> int:
-        return sum_metric(self.filtered_rows(), "directions")
+        return self.metric_total("directions")
 
     def get_website_clicks(self) -> int:
-        return sum_metric(self.filtered_rows(), "website_clicks")
+        return self.metric_total("website_clicks")
 
     def get_total_actions(self) -> int:
-        rows = self.filtered_rows()
-        return self.get_calls() + self.get_directions() + sum_metric(rows, "website_clicks")
+        return self.get_calls() + self.get_directions() + self.metric_total("website_clicks")
 
 
 class RankTrackerReport(CsvReportBase):
+    COLUMNS = DATE_KEYS + ("keyword", "query", "position", "rank", "change", "delta")
+
     def get_avg_position(self) -> float:
-        positions = [to_float(pick_value(row, ("position", "rank"))) for row in self.filtered_rows()]
-        valid = [pos for pos in positions if pos > 0]
+        valid = [row["position"] for row in self._scored() if row["position"] > 0]
         return safe_div(sum(valid), len(valid))
 
     def get_top_movers(self, limit: int = 10) -> list[dict[str, Any]]:
-        rows = self._score_changes(self.filtered_rows())
+        rows = self._scored()
         ranked = sorted(rows, key=lambda item: abs(item["change"]), reverse=True)
         return ranked[:limit]
 
     def get_winners(self, limit: int = 10) -> list[dict[str, Any]]:
-        rows = [row for row in self._score_changes(self.filtered_rows()) if row["change"] < 0]
+        rows = [row for row in self._scored() if row["change"] < 0]
         ranked = sorted(rows, key=lambda item: item["change"])
         return ranked[:limit]
 
     def get_losers(self, limit: int = 10) -> list[dict[str, Any]]:
-        rows = [row for row in self._score_changes(self.filtered_rows()) if row["change"] > 0]
+        rows = [row for row in self._scored() if row["change"] > 0]
         ranked = sorted(rows, key=lambda item: item["change"], reverse=True)
         return ranked[:limit]
 
-    def _score_changes(self, rows: Iterable[dict[str, str]]) -> list[dict[str, Any]]:
-        scored: list[dict[str, Any]] = []
-        for row in rows:
-            scored.append(
-                {
-                    "keyword": pick_value(row, ("keyword", "query")),
-                    "position": to_float(pick_value(row, ("position", "rank"))),
-                    "change": to_float(pick_value(row, ("change", "delta"))),
-                }
-            )
-        return scored
+    def _scored(self) -> list[dict[str, Any]]:
+        return self._memo("scored", self._score_changes)
+
+    def _score_changes(self) -> list[dict[str, Any]]:
+        table = self.table
+        positions = self.positions()
+        keywords = table.take(table.column("keyword", "query"), positions)
+        ranks = table.take(table.floats("position", "rank"), positions, "position")
+        changes = table.take(table.floats("change", "delta"), positions, "change")
+        return [
+            {"keyword": keyword, "position": rank, "change": change}
+            for keyword, rank, change in zip(keywords, ranks, changes)
+        ]
 
 
 class KPISummary:
@@ -226,9 +315,12 @@ class MonthlyPerformanceProgram(ProgramRunner):
         return self._build_payload(ga4, rank, kpis, opportunities)
 
     def _load_sources(self) -> tuple[GA4Report, GBPReport, RankTrackerReport]:
-        ga4 = GA4Report.import_csv(self.inputs.require_path("ga4_csv"))
-        gbp = GBPReport.import_csv(self.inputs.require_path("gbp_csv"))
-        rank = RankTrackerReport.import_csv(self.inputs.require_path("rank_csv"))
+        ga4 = GA4Report.from_table(self.inputs.load_table("ga4_csv", GA4Report.COLUMNS))
+        gbp = GBPReport.from_table(self.inputs.load_table("gbp_csv", GBPReport.COLUMNS))
+        rank = RankTrackerReport.from_table(self.inputs.load_table("rank_csv", RankTrackerReport.COLUMNS))
+        start, end = self.inputs.values.get("start_date"), self.inputs.values.get("end_date")
+        for report in (ga4, gbp, rank):
+            report.set_date_range(start, end)
         return ga4, gbp, rank
 
     def _build_kpis(self, ga4: GA4Report, gbp: GBPReport, rank: RankTrackerReport) -> KPISummary:
@@ -3,26 +3,49 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 from .base import ProgramConfig, ProgramInputs, ProgramRunner
+from .column_table import ColumnTable
 from .io_utils import pick_value, read_csv
 from .report_templates import render_list, render_section, render_table
 
 
+def word_count(body: str) -> int:
+    return len(body.split()) if body else 0
+
+
 @dataclass
 class CrawlSnapshot:
     rows: list[dict[str, str]]
     service: str | None = None
+    _table: ColumnTable | None = field(default=None, init=False, repr=False, compare=False)
+    _service_positions: list[int] | None = field(default=None, init=False, repr=False, compare=False)
+    _url_index: dict[str, int] | None = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def import_csv(cls, path: Path) -> "CrawlSnapshot":
         return cls(read_csv(path))
 
+    @classmethod
+    def from_table(cls, table: ColumnTable) -> "CrawlSnapshot":
+        """Wrap a table loaded through ProgramInputs, reusing its cached columns."""
+        snapshot = cls(table.rows)
+        snapshot._table = table
+        return snapshot
+
+    @property
+    def table(self) -> ColumnTable:
+        if self._table is None or self._table.rows is not self.rows:
+            self._table = ColumnTable(self.rows)
+        return self._table
+
     def set_service(self, service: str) -> None:
         self.service = service.strip().lower()
+        self._service_positions = None
 
     def get_pages(self) -> list[dict[str, str]]:
         return self.rows
@@ -30,34 +53,42 @@ class CrawlSnapshot:
     def get_page(self, url: str) -> dict[str, str] | None:
         if not url:
             return None
-        for row in self.rows:
-            if pick_value(row, ("url", "page")) == url:
-                return row
-        return None
+        if self._url_index is None:
+            self._url_index = {}
+            for pos, value in enumerate(self.table.column("url", "page")):
+                self._url_index.setdefault(value, pos)
+        pos = self._url_index.get(url)
+        return self.rows[pos] if pos is not None else None
+
+    def service_positions(self) -> Sequence[int]:
+        """Positions of rows whose URL contains the service (every row when unset)."""
+        if not self.service:
+            return range(len(self.rows))
+        if self._service_positions is None:
+            urls = self.table.derived("url_lower", str.lower, "url", "page")
+            self._service_positions = [pos for pos, url in enumerate(urls) if self.service in url]
+        return self._service_positions
 
     def get_pages_by_service(self) -> list[dict[str, str]]:
         if not self.service:
             return self.rows
-        return [
-            row
-            for row in self.rows
-            if self.service in (pick_value(row, ("url", "page")) or "").lower()
-        ]
+        return self.table.take(self.rows, self.service_positions())
 
     def get_titles(self) -> list[str]:
-        return [pick_value(row, ("title", "page_title")) for row in self.get_pages_by_service()]
+        return self._service_column("title", "page_title")
 
     def get_meta_descriptions(self) -> list[str]:
-        return [pick_value(row, ("meta_description", "description")) for row in self.get_pages_by_service()]
+        return self._service_column("meta_description", "description")
 
     def get_urls(self) -> list[str]:
-        return [pick_value(row, ("url", "page")) for row in self.get_pages_by_service()]
+        return self._service_column("url", "page")
 
     def get_status_codes(self) -> list[str]:
-        return [pick_value(row, ("status_code", "status")) for row in self.get_pages_by_service()]
+        return self._service_column("status_code", "status")
 
     def get_word_counts(self) -> list[int]:
-        return [self._word_count(row) for row in self.get_pages_by_service()]
+        counts = self.table.derived("word_count", word_count, "text", "body", "content")
+        return self.table.take(counts, self.service_positions())
 
     def get_missing_titles(self) -> list[str]:
         return [url for url, title in self._zip_urls(self.get_titles()) if not title]
@@ -69,17 +100,22 @@ class CrawlSnapshot:
         counts = self.get_word_counts()
         return sum(counts) / len(counts) if counts else 0.0
 
+    def _service_column(self, *names: str) -> list[str]:
+        return self.table.take(self.table.column(*names), self.service_positions())
+
     def _zip_urls(self, values: list[str]) -> list[tuple[str, str]]:
         return list(zip(self.get_urls(), values))
 
     def _word_count(self, row: dict[str, str]) -> int:
-        body = pick_value(row, ("text", "body", "content"))
-        return len(body.split()) if body else 0
+        return word_count(pick_value(row, ("text", "body", "content")))
 
 
 class ContentGapAnalyzer:
     def __init__(self) -> None:
         self.pages: list[dict[str, str]] = []
+        self._text_pages: list[dict[str, str]] | None = None
+        self._bodies: list[str] = []
+        self._word_counts: list[int] = []
 
     def set_pages(self, pages: list[dict[str, str]]) -> None:
         self.pages = pages
@@ -92,7 +128,7 @@ class ContentGapAnalyzer:
         return missing
 
     def get_thin_content_pages(self) -> list[dict[str, str]]:
-        return [row for row in self.pages if self._word_count(row) < 300]
+        return [row for row, count in zip(self.pages, self._page_text()[1]) if count < 300]
 
     def get_priority_gaps(self) -> list[str]:
         gaps = self.get_missing_sections()
@@ -101,11 +137,8 @@ class ContentGapAnalyzer:
         return gaps
 
     def get_duplicate_titles(self) -> list[str]:
-        titles = [
-            (pick_value(row, ("title", "page_title")) or "").lower()
-            for row in self.pages
-        ]
-        return [title for title in set(titles) if title and titles.count(title) > 1]
+        titles = Counter((pick_value(row, ("title", "page_title")) or "").lower() for row in self.pages)
+        return [title for title, count in titles.items() if title and count > 1]
 
     def get_missing_meta(self) -> list[str]:
         return [
@@ -115,7 +148,7 @@ class ContentGapAnalyzer:
         ]
 
     def get_average_word_count(self) -> float:
-        counts = [self._word_count(row) for row in self.pages]
+        counts = self._page_text()[1]
         return sum(counts) / len(counts) if counts else 0.0
 
     def get_gap_summary(self) -> list[str]:
@@ -125,15 +158,19 @@ class ContentGapAnalyzer:
         return summary
 
     def _section_present(self, section: str) -> bool:
-        for row in self.pages:
-            body = (pick_value(row, ("text", "body", "content")) or "").lower()
-            if section in body:
-                return True
-        return False
+        return any(section in body for body in self._page_text()[0])
+
+    def _page_text(self) -> tuple[list[str], list[int]]:
+        """Lowercased bodies and word counts, extracted once per page list."""
+        if self._text_pages is not self.pages:
+            bodies = [pick_value(row, ("text", "body", "content")) for row in self.pages]
+            self._bodies = [body.lower() for body in bodies]
+            self._word_counts = [word_count(body) for body in bodies]
+            self._text_pages = self.pages
+        return self._bodies, self._word_counts
 
     def _word_count(self, row: dict[str, str]) -> int:
-        body = pick_value(row, ("text", "body", "content"))
-        return len(body.split()) if body else 0
+        return word_count(pick_value(row, ("text", "body", "content")))
 
 
 class OutlineBuilder:
@@ -200,7 +237,7 @@ class ServiceBriefProgram(ProgramRunner):
         return self._build_payload(snapshot, service, gaps, outline, schema)
 
     def _load_snapshot(self) -> tuple[CrawlSnapshot, str]:
-        snapshot = CrawlSnapshot.import_csv(self.inputs.require_path("crawl_csv"))
+        snapshot = CrawlSnapshot.from_table(self.inputs.load_table("crawl_csv"))
         service = self.inputs.require_text("service")
         snapshot.set_service(service)
         return snapshot, service
@@ -4,17 +4,26 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from scripts.validation.compliance_matcher import PhraseMatcher
+
 from .base import ProgramRunner
 from .report_templates import render_list, render_section, render_table
 
 
+CLAIM_TOKENS = PhraseMatcher(("guarantee", "best", "only", "%"))
+
+
 @dataclass
 class ComplianceScanner:
     policy_phrases: list[str]
+    matcher: PhraseMatcher = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.matcher = PhraseMatcher(self.policy_phrases)
 
     @classmethod
     def from_policy(cls, path: Path) -> "ComplianceScanner":
@@ -49,10 +58,10 @@ class ComplianceScanner:
 
     @staticmethod
     def _looks_like_claim(sentence: str) -> bool:
-        return any(token in sentence.lower() for token in ("guarantee", "best", "only", "%"))
+        return CLAIM_TOKENS.search(sentence.lower())
 
     def _is_allowed(self, claim: str) -> bool:
-        return any(phrase in claim.lower() for phrase in self.policy_phrases)
+        return self.matcher.search(claim.lower())
 
 
 class RiskScorer:
@@ -3,24 +3,47 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
-from .base import ProgramRunner
-from .io_utils import pick_value, read_csv
+from .base import ProgramConfig, ProgramInputs, ProgramRunner
+from .column_table import ColumnTable
+from .io_utils import pick_value, read_table
+from .keyword_clusters import KeywordClusterer, load_serp_results
 from .metrics_utils import to_int
 from .report_templates import render_list, render_section, render_table
 
+SERP_EXPORT_FILENAME = "serp-export.json"
+
 
 @dataclass
 class KeywordImporter:
     rows: list[dict[str, str]]
     volume_min: int = 0
+    _table: ColumnTable | None = field(default=None, init=False, repr=False, compare=False)
+    _filtered: tuple[int, list[int]] | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Columns read from Parquet/Arrow exports; CSVs are always read whole.
+    COLUMNS: ClassVar[tuple[str, ...]] = ("keyword", "query", "volume", "search_volume")
 
     @classmethod
     def import_csv(cls, path: Path) -> "KeywordImporter":
-        return cls(read_csv(path))
+        return cls(read_table(path, cls.COLUMNS))
+
+    @classmethod
+    def from_table(cls, table: ColumnTable) -> "KeywordImporter":
+        """Wrap a table loaded through ProgramInputs, reusing its cached columns."""
+        importer = cls(table.rows)
+        importer._table = table
+        return importer
+
+    @property
+    def table(self) -> ColumnTable:
+        if self._table is None or self._table.rows is not self.rows:
+            self._table = ColumnTable(self.rows)
+            self._filtered = None
+        return self._table
 
     def set_volume_min(self, volume: int) -> None:
         self.volume_min = volume
@@ -29,33 +52,53 @@ class KeywordImporter:
         return self.rows
 
     def get_keywords(self) -> list[str]:
-        keywords = [pick_value(row, ("keyword", "query")) for row in self._filtered_rows()]
+        keywords = self.table.take(self.table.column("keyword", "query"), self._filtered_positions())
         return [keyword for keyword in keywords if keyword]
 
+    def get_keyword_volumes(self) -> list[tuple[str, int]]:
+        """Non-empty keywords above volume_min with their volumes, from the same cached filter."""
+        positions = self._filtered_positions()
+        keywords = self.table.take(self.table.column("keyword", "query"), positions)
+        volumes = self.table.take(self._volumes(), positions)
+        return [(keyword, volume) for keyword, volume in zip(keywords, volumes) if keyword]
+
     def get_top_keywords(self, limit: int = 20) -> list[dict[str, str]]:
-        rows = sorted(self._filtered_rows(), key=self._volume_key, reverse=True)
-        return rows[:limit]
+        positions = self.table.top(self._volumes(), limit, self._filtered_positions())
+        return self.table.take(self.rows, positions)
 
     def _filtered_rows(self) -> list[dict[str, str]]:
-        return [row for row in self.rows if self._volume_key(row) >= self.volume_min]
+        return self.table.take(self.rows, self._filtered_positions())
+
+    def _filtered_positions(self) -> list[int]:
+        """Rows at or above volume_min, recomputed only when the rows or threshold change."""
+        volumes = self._volumes()
+        if self._filtered is None or self._filtered[0] != self.volume_min:
+            self.table.take(volumes, None, "volume")
+            self._filtered = (self.volume_min, [pos for pos, volume in enumerate(volumes) if volume >= self.volume_min])
+        return self._filtered[1]
+
+    def _volumes(self) -> list[int]:
+        return self.table.ints("volume", "search_volume")
 
     def _volume_key(self, row: dict[str, str]) -> int:
         return to_int(pick_value(row, ("volume", "search_volume")))
 
 
 class ClusterBuilder:
-    def __init__(self) -> None:
+    def __init__(self, clusterer: KeywordClusterer | None = None) -> None:
         self.keywords: list[str] = []
+        self.volumes: list[int] | None = None
+        self.clusterer = clusterer or KeywordClusterer()
 
-    def set_keywords(self, keywords: list[str]) -> None:
+    def set_keywords(self, keywords: list[str], volumes: list[int] | None = None) -> None:
         self.keywords = keywords
+        self.volumes = volumes
+
+    def set_serp_results(self, serp: dict[str, set[str]]) -> None:
+        self.clusterer.serp = serp
 
     def build_clusters(self) -> dict[str, list[str]]:
-        clusters: dict[str, list[str]] = {}
-        for keyword in self.keywords:
-            key = self._cluster_key(keyword)
-            clusters.setdefault(key, []).append(keyword)
-        return clusters
+        return self.clusterer.cluster(self.keywords, self.volumes)
 
     def get_priority_clusters(self, clusters: dict[str, list[str]]) -> list[dict[str, Any]]:
         items = [{"cluster": key, "count": len(values)} for key, values in clusters.items()]
@@ -64,10 +107,6 @@ class ClusterBuilder:
     def get_cluster_keywords(self, clusters: dict[str, list[str]], key: str) -> list[str]:
         return clusters.get(key, [])
 
-    def _cluster_key(self, keyword: str) -> str:
-        tokens = keyword.split()
-        return " ".join(tokens[:2]).lower() if tokens else "misc"
-
 
 class ContentCalendar:
     def __init__(self) -> None:
@@ -110,21 +149,40 @@ class KpiPlanner:
 
 
 class KeywordStrategyProgram(ProgramRunner):
+    version = "3"
+
+    def serp_path(self) -> Path | None:
+        """The serp_json input, else serp_dataforseo_fetch output in the client's reports, if present."""
+        if self.inputs.values.get("serp_json"):
+            return self.inputs.require_path("serp_json")
+        default = self.config.output_dir / self.config.client_slug / "reports" / SERP_EXPORT_FILENAME
+        return default if default.is_file() else None
+
+    def implicit_inputs(self) -> dict[str, Path]:
+        path = None if self.inputs.values.get("serp_json") else self.serp_path()
+        return {"serp_json": path} if path else {}
+
     def execute(self) -> dict[str, Any]:
         importer = self._load_keywords()
-        clustered = self._build_clusters(importer)
+        serp_path = self.serp_path()
+        clustered = self._build_clusters(importer, serp_path)
         plan = self._build_calendar(clustered)
         kpis = self._build_kpis(clustered)
-        return self._build_payload(importer, clustered, plan, kpis)
+        payload = self._build_payload(importer, clustered, plan, kpis)
+        payload["serp_export"] = str(serp_path) if serp_path else ""
+        return payload
 
     def _load_keywords(self) -> KeywordImporter:
-        importer = KeywordImporter.import_csv(self.inputs.require_path("keywords_csv"))
+        importer = KeywordImporter.from_table(self.inputs.load_table("keywords_csv", KeywordImporter.COLUMNS))
         importer.set_volume_min(10)
         return importer
 
-    def _build_clusters(self, importer: KeywordImporter) -> dict[str, list[str]]:
+    def _build_clusters(self, importer: KeywordImporter, serp_path: Path | None = None) -> dict[str, list[str]]:
         clusters = ClusterBuilder()
-        clusters.set_keywords(importer.get_keywords())
+        pairs = importer.get_keyword_volumes()
+        clusters.set_keywords([keyword for keyword, _ in pairs], [volume for _, volume in pairs])
+        if serp_path is not None:
+            clusters.set_serp_results(load_serp_results(serp_path))
         return clusters.build_clusters()
 
     def _build_calendar(self, clustered: dict[str, list[str]]) -> list[dict[str, Any]]:
@@ -164,26 +222,29 @@ class KeywordStrategyProgram(ProgramRunner):
     def _build_sections(self, data: dict[str, Any]) -> list[str]:
         return [
             self._build_summary(data),
-            self._build_clusters(data),
-            self._build_calendar(data),
-            self._build_kpis(data),
+            self._render_clusters(data),
+            self._render_calendar(data),
+            self._render_kpis(data),
         ]
 
     def report_basename(self) -> str:
         return "keyword-strategy-plan"
 
     def _build_summary(self, data: dict[str, Any]) -> str:
-        rows = [["Total KPI Target", str(data["total_target"])]]
+        rows = [
+            ["Total KPI Target", str(data["total_target"])],
+            ["SERP Overlap Export", data.get("serp_export") or "not used"],
+        ]
         return render_section("Strategy Summary", render_table(["Metric", "Value"], rows))
 
-    def _build_clusters(self, data: dict[str, Any]) -> str:
+    def _render_clusters(self, data: dict[str, Any]) -> str:
         rows = [[item["cluster"], str(item["count"])] for item in data["clusters"]]
         return render_section("Keyword Clusters", render_table(["Cluster", "Count"], rows))
 
-    def _build_calendar(self, data: dict[str, Any]) -> str:
+    def _render_calendar(self, data: dict[str, Any]) -> str:
         items = [f"Month {item['month']}: {item['focus']}" for item in data["calendar"]]
         return render_section("12-Month Content Calendar", render_list(items))
 
-    def _build_kpis(self, data: dict[str, Any]) -> str:
+    def _render_kpis(self, data: dict[str, Any]) -> str:
         rows = [[item["cluster"], str(item["target"])] for item in data["kpi_targets"]]
         return render_section("KPI Targets", render_table(["Cluster", "Target"], rows))
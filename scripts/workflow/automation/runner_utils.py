@@ -16,6 +16,7 @@ def build_parser(description: str, input_keys: Iterable[str]) -> argparse.Argume
     parser.add_argument("--output-dir", default="data/outputs")
     for key in input_keys:
         parser.add_argument(f"--{key}", required=True)
+    parser.add_argument("--cache", action="store_true", help="Reuse the last result when inputs are unchanged")
     parser.add_argument("--dry-run", action="store_true")
     return parser
 
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Run site audits and automation phases for many clients on a bounded worker pool.
+
+Each client's steps run in order (audit, then phases); clients run in parallel.
+Crawling steps take a per-host slot so one host is never crawled by more than
+--per-host audits at once. Progress is saved after every step so an interrupted
+batch can be resumed with --resume.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_BATCH_DIR = Path("data") / "outputs" / "_batch"
+
+
+@dataclass
+class Step:
+    name: str
+    cmd: list[str]
+    host: str = ""
+
+
+@dataclass
+class ClientJob:
+    client: str
+    slug: str
+    steps: list[Step]
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def host_of(url: str) -> str:
+    host = urlparse(url if "://" in url else f"https://{url}").hostname or ""
+    return host.lower().removeprefix("www.")
+
+
+def load_clients(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        raise SystemExit(f"Clients file not found: {path}")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    clients = data.get("clients", []) if isinstance(data, dict) else data
+    for entry in clients:
+        if not entry.get("slug"):
+            raise SystemExit(f"Client entry missing slug: {entry}")
+    return clients
+
+
+def entries_from_configs(paths: list[Path]) -> list[dict[str, Any]]:
+    entries = []
+    for path in paths:
+        if not path.exists():
+            raise SystemExit(f"Config not found: {path}")
+        data = json.loads(path.read_text(encoding="utf-8"))
+        entries.append({"client": data["client_name"], "slug": data["client_slug"], "config": str(path.resolve())})
+    return entries
+
+
+def build_job(entry: dict[str, Any], python: str = sys.executable) -> ClientJob:
+    slug = entry["slug"]
+    client = entry.get("client") or slug
+    steps: list[Step] = []
+    site_url = entry.get("site_url")
+    if site_url:
+        cmd = [
+            python,
+            str(REPO_ROOT / "scripts" / "workflow" / "site_audit_runner.py"),
+            "--client",
+            client,
+            "--slug",
+            slug,
+            "--site-url",
+            site_url,
+        ]
+        if entry.get("crawl_only"):
+            cmd.append("--crawl-only")
+        steps.append(Step("audit", cmd, host_of(site_url)))
+    if entry.get("config"):
+        orchestrator = REPO_ROOT / "scripts" / "workflow" / "swarm_orchestrator.py"
+        steps.append(Step("phases", [python, str(orchestrator), "--config", str(Path(entry["config"]).resolve()), "--all"]))
+    if not steps:
+        raise SystemExit(f"Client {slug} needs a site_url, a config, or both.")
+    return ClientJob(client, slug, steps)
+
+
+def interleave_hosts(jobs: list[ClientJob]) -> list[ClientJob]:
+    """Order jobs round-robin by crawl host so workers do not queue behind one host."""
+    by_host: dict[str, list[ClientJob]] = {}
+    for job in jobs:
+        host = next((step.host for step in job.steps if step.host), "")
+        by_host.setdefault(host, []).append(job)
+    ordered: list[ClientJob] = []
+    queues = list(by_host.values())
+    while queues:
+        ordered.extend(queue.pop(0) for queue in queues)
+        queues = [queue for queue in queues if queue]
+    return ordered
+
+
+def run_command(cmd: list[str], log_path: Path) -> int:
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("w", encoding="utf-8") as log:
+        proc = subprocess.run(cmd, stdout=log, stderr=subprocess.STDOUT, cwd=REPO_ROOT, check=False)
+    return proc.returncode
+
+
+class BatchState:
+    """Per-client step status, rewritten atomically after every change."""
+
+    def __init__(self, path: Path, name: str, resume: bool) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.data: dict[str, Any] = {"name": name, "started_at": now_iso(), "clients": {}}
+        if resume and path.exists():
+            self.data = json.loads(path.read_text(encoding="utf-8"))
+
+    def step_done(self, slug: str, step: str) -> bool:
+        entry = self.data["clients"].get(slug, {}).get("steps", {}).get(step, {})
+        return entry.get("status") == "ok"
+
+    def update(self, job: ClientJob, step: str, **fields: Any) -> None:
+        with self.lock:
+            client = self.data["clients"].setdefault(job.slug, {"client": job.client, "steps": {}})
+            client["steps"].setdefault(step, {}).update(fields)
+            statuses = [client["steps"].get(item.name, {}).get("status", "pending") for item in job.steps]
+            client["status"] = (
+                "failed" if "failed" in statuses else "ok" if all(item == "ok" for item in statuses) else "running"
+            )
+            self.data["updated_at"] = now_iso()
+            tmp = self.path.with_suffix(".tmp")
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+
+class HostSlots:
+    def __init__(self, per_host: int) -> None:
+        self.per_host = per_host
+        self.lock = threading.Lock()
+        self.slots: dict[str, threading.BoundedSemaphore] = {}
+
+    def get(self, host: str) -> threading.BoundedSemaphore:
+        with self.lock:
+            if host not in self.slots:
+                self.slots[host] = threading.BoundedSemaphore(self.per_host)
+            return self.slots[host]
+
+
+def run_job(
+    job: ClientJob,
+    state: BatchState,
+    slots: HostSlots,
+    log_dir: Path,
+    runner: Callable[[list[str], Path], int],
+) -> None:
+    for step in job.steps:
+        if state.step_done(job.slug, step.name):
+            continue
+        log_path = log_dir / f"{job.slug}-{step.name}.log"
+        slot = slots.get(step.host) if step.host else None
+        if slot:
+            slot.acquire()
+        try:
+            started = time.perf_counter()
+            state.update(job, step.name, status="running", started_at=now_iso(), log=str(log_path))
+            code = runner(step.cmd, log_path)
+        finally:
+            if slot:
+                slot.release()
+        status = "ok" if code == 0 else "failed"
+        seconds = round(time.perf_counter() - started, 2)
+        state.update(job, step.name, status=status, exit_code=code, seconds=seconds, finished_at=now_iso())
+        print(f"[{status}] {job.slug}: {step.name}")
+        if code != 0:
+            # Later steps read this step's outputs; leave them pending for a resumed run.
+            return
+
+
+def run_batch(
+    jobs: list[ClientJob],
+    state: BatchState,
+    workers: int,
+    per_host: int,
+    log_dir: Path,
+    runner: Callable[[list[str], Path], int] = run_command,
+) -> None:
+    slots = HostSlots(per_host)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = [pool.submit(run_job, job, state, slots, log_dir, runner) for job in interleave_hosts(jobs)]
+        for future in as_completed(futures):
+            future.result()
+
+
+def render_status(data: dict[str, Any]) -> str:
+    lines = [
+        f"# Batch Status - {data['name']}",
+        "",
+        f"Started: {data.get('started_at', '')}  ",
+        f"Updated: {data.get('updated_at', '')}",
+        "",
+        "| Client | Slug | Status | Steps | Seconds |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for slug, client in sorted(data["clients"].items()):
+        steps = ", ".join(f"{name}: {step.get('status', 'pending')}" for name, step in client["steps"].items())
+        seconds = sum(step.get("seconds", 0) for step in client["steps"].values())
+        lines.append(f"| {client['client']} | {slug} | {client.get('status', 'pending')} | {steps} | {seconds:.1f} |")
+    totals: dict[str, int] = {}
+    for client in data["clients"].values():
+        totals[client.get("status", "pending")] = totals.get(client.get("status", "pending"), 0) + 1
+    lines.extend(["", "Totals: " + ", ".join(f"{key} {value}" for key, value in sorted(totals.items()))])
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run audits and automation phases for many clients.")
+    parser.add_argument("--clients", help="JSON list of {client, slug, site_url, config, crawl_only} entries")
+    parser.add_argument("--configs", nargs="*", default=[], help="Orchestrator configs to run phases for")
+    parser.add_argument("--jobs", type=int, default=4, help="Clients processed at once (default: 4)")
+    parser.add_argument("--per-host", type=int, default=1, help="Concurrent crawls allowed per host (default: 1)")
+    parser.add_argument("--name", default="batch", help="Batch name for the state and status files")
+    parser.add_argument("--batch-dir", default=str(DEFAULT_BATCH_DIR), help="Where state, logs and status go")
+    parser.add_argument("--resume", action="store_true", help="Skip steps that already succeeded in this batch")
+    args = parser.parse_args()
+
+    entries = load_clients(Path(args.clients)) if args.clients else []
+    entries.extend(entries_from_configs([Path(path) for path in args.configs]))
+    if not entries:
+        raise SystemExit("Pass --clients and/or --configs.")
+    slugs = [entry["slug"] for entry in entries]
+    if len(set(slugs)) != len(slugs):
+        raise SystemExit("Each client slug may appear only once per batch.")
+
+    batch_dir = Path(args.batch_dir)
+    state = BatchState(batch_dir / f"{args.name}.json", args.name, args.resume)
+    jobs = [build_job(entry) for entry in entries]
+    try:
+        run_batch(jobs, state, args.jobs, args.per_host, batch_dir / "logs" / args.name)
+    finally:
+        status_path = batch_dir / f"{args.name}-status.md"
+        status_path.write_text(render_status(state.data), encoding="utf-8")
+        print(f"wrote {status_path}")
+    failed = [slug for slug, client in state.data["clients"].items() if client.get("status") != "ok"]
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,10 +17,15 @@ INPUT_KEYS = ["ga4_csv", "gbp_csv", "rank_csv"]
 
 def main() -> int:
     parser = build_parser("Run Phase 1 monthly performance", INPUT_KEYS)
+    parser.add_argument("--start-date", default=None, help="Report start date (YYYY-MM-DD).")
+    parser.add_argument("--end-date", default=None, help="Report end date (YYYY-MM-DD).")
     args = parser.parse_args()
     from scripts.workflow.automation.phase1_monthly_performance import MonthlyPerformanceProgram
 
-    program = MonthlyPerformanceProgram(build_config(args), build_inputs(args, INPUT_KEYS))
+    inputs = build_inputs(args, INPUT_KEYS)
+    if args.start_date and args.end_date:
+        inputs.values.update(start_date=args.start_date, end_date=args.end_date)
+    program = MonthlyPerformanceProgram(build_config(args), inputs)
     if not args.dry_run:
         program.run()
     return 0
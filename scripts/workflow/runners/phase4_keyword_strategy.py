@@ -17,10 +17,11 @@ INPUT_KEYS = ["keywords_csv", "competitors_csv"]
 
 def main() -> int:
     parser = build_parser("Run Phase 4 keyword strategy", INPUT_KEYS)
+    parser.add_argument("--serp_json", default="", help="serp_dataforseo_fetch export (default: reports/serp-export.json)")
     args = parser.parse_args()
     from scripts.workflow.automation.phase4_keyword_strategy import KeywordStrategyProgram
 
-    program = KeywordStrategyProgram(build_config(args), build_inputs(args, INPUT_KEYS))
+    program = KeywordStrategyProgram(build_config(args), build_inputs(args, INPUT_KEYS + ["serp_json"]))
     if not args.dry_run:
         program.run()
     return 0
@@ -96,6 +96,15 @@ def main() -> None:
                     args.slug,
                 ],
             ),
+            (
+                "Build site link graph + link equity",
+                [
+                    python,
+                    str(REPO_ROOT / "scripts" / "ingest" / "site_link_graph.py"),
+                    "--client-slug",
+                    args.slug,
+                ],
+            ),
             (
                 "Generate service briefs",
                 [
@@ -357,7 +366,7 @@ def main() -> None:
             )
         )
     else:
-        print("[skip] Crawl export ingest: missing crawl-export.csv")
+        print("[skip] Crawl export ingest: missing crawl-export.csv/.xlsx")
 
     gsc_export = first_existing([reports_dir / "gsc-export.csv", reports_dir / "gsc-export.xlsx"])
     if gsc_export:
@@ -375,7 +384,7 @@ def main() -> None:
             )
         )
     else:
-        print("[skip] GSC export ingest: missing gsc-export.csv")
+        print("[skip] GSC export ingest: missing gsc-export.csv/.xlsx")
 
     ga4_export = first_existing([reports_dir / "ga4-export.csv", reports_dir / "ga4-export.xlsx"])
     if ga4_export:
@@ -393,7 +402,7 @@ def main() -> None:
             )
         )
     else:
-        print("[skip] GA4 export ingest: missing ga4-export.csv")
+        print("[skip] GA4 export ingest: missing ga4-export.csv/.xlsx")
 
     gbp_export = first_existing([reports_dir / "gbp-export.csv", reports_dir / "gbp-export.xlsx"])
     if gbp_export:
@@ -412,7 +421,7 @@ def main() -> None:
             )
         )
     else:
-        print("[skip] GBP export ingest: missing gbp-export.csv")
+        print("[skip] GBP export ingest: missing gbp-export.csv/.xlsx")
 
     citation_export = first_existing([reports_dir / "citation-audit.csv", reports_dir / "citation-audit.xlsx"])
     if citation_export:
@@ -430,9 +439,15 @@ def main() -> None:
             )
         )
     else:
-        print("[skip] Citation audit ingest: missing citation-audit.csv")
+        print("[skip] Citation audit ingest: missing citation-audit.csv/.xlsx")
 
-    rank_export = first_existing([reports_dir / "rank-tracker.csv", reports_dir / "rank-tracker-export.csv"])
+    rank_export = first_existing(
+        [
+            reports_dir / "rank-tracker.csv",
+            reports_dir / "rank-tracker-export.csv",
+            reports_dir / "rank-tracker.xlsx",
+        ]
+    )
     if rank_export:
         steps.append(
             (
@@ -4,8 +4,13 @@
 from __future__ import annotations
 
 import argparse
+import json
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
+from typing import Any
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
@@ -15,12 +20,25 @@ from scripts.workflow.automation.base import ProgramConfig, ProgramInputs
 from scripts.workflow.automation.config_loader import OrchestratorConfig
 from scripts.workflow.automation.phase_registry import PHASE_BUILDERS
 
+SUMMARY_FILENAME = "swarm-run-summary.json"
+
+
+@dataclass
+class PhaseResult:
+    phase: str
+    status: str
+    seconds: float = 0.0
+    outputs: list[str] = field(default_factory=list)
+    detail: str = ""
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run automation programs by phase")
     parser.add_argument("--config", required=True, help="Path to orchestration JSON")
     parser.add_argument("--phase", type=int, help="Phase number (1-8)")
-    parser.add_argument("--all", action="store_true", help="Run all phases")
+    parser.add_argument("--all", action="store_true", help="Run all phases configured in the JSON")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for --all (default: 1)")
+    parser.add_argument("--cache", action="store_true", help="Reuse results of phases whose inputs are unchanged")
     parser.add_argument("--dry-run", action="store_true", help="Validate config only")
     return parser.parse_args()
 
@@ -33,24 +51,118 @@ def get_phase_keys(args: argparse.Namespace) -> list[str]:
     raise SystemExit("Must pass --phase or --all")
 
 
-def run_phase(phase_key: str, cfg: OrchestratorConfig, dry_run: bool) -> None:
-    inputs = ProgramInputs(cfg.get_inputs(phase_key))
-    config = ProgramConfig(cfg.client_name, cfg.client_slug, cfg.output_dir)
+def run_phase(
+    phase_key: str,
+    cfg: OrchestratorConfig,
+    dry_run: bool,
+    tables: dict | None = None,
+    use_cache: bool = False,
+) -> PhaseResult:
+    inputs = ProgramInputs(cfg.get_inputs(phase_key), tables if tables is not None else {})
+    config = ProgramConfig(cfg.client_name, cfg.client_slug, cfg.output_dir, use_cache)
     builder = PHASE_BUILDERS.get(phase_key)
     if not builder:
         raise SystemExit(f"Unknown phase: {phase_key}")
+    started = time.perf_counter()
     program = builder(config, inputs)
     if dry_run:
-        return
-    program.run()
+        return PhaseResult(phase_key, "validated")
+    output = program.run()
+    seconds = round(time.perf_counter() - started, 3)
+    detail = "cached" if output.cached else ""
+    return PhaseResult(phase_key, "ok", seconds, [str(output.report_path), str(output.json_path)], detail)
+
+
+def run_phase_group(phase_keys: list[str], cfg: OrchestratorConfig, use_cache: bool = False) -> list[PhaseResult]:
+    """Run phases that read the same input files in one process, loading each file once."""
+    tables: dict = {}
+    results = []
+    for phase_key in phase_keys:
+        started = time.perf_counter()
+        try:
+            results.append(run_phase(phase_key, cfg, False, tables, use_cache))
+        except (Exception, SystemExit) as exc:
+            seconds = round(time.perf_counter() - started, 3)
+            results.append(PhaseResult(phase_key, "failed", seconds, detail=f"{type(exc).__name__}: {exc}"))
+    return results
+
+
+def input_files(phase_key: str, cfg: OrchestratorConfig) -> set[Path]:
+    paths = (Path(value) for value in cfg.get_inputs(phase_key).values())
+    return {path.resolve() for path in paths if path.is_file()}
+
+
+def group_phases(phase_keys: list[str], cfg: OrchestratorConfig) -> list[list[str]]:
+    """Split phases into groups that share no input file, keeping phase order within each group."""
+    groups: list[tuple[list[str], set[Path]]] = []
+    for phase_key in phase_keys:
+        keys, files = [phase_key], input_files(phase_key, cfg)
+        for group in [group for group in groups if group[1] & files]:
+            groups.remove(group)
+            keys = group[0] + keys
+            files |= group[1]
+        groups.append((sorted(keys, key=int), files))
+    return [keys for keys, _ in groups]
+
+
+def run_phases(
+    phase_keys: list[str], cfg: OrchestratorConfig, jobs: int, use_cache: bool = False
+) -> list[PhaseResult]:
+    groups = group_phases(phase_keys, cfg)
+    if jobs <= 1 or len(groups) <= 1:
+        results = run_phase_group(phase_keys, cfg, use_cache)
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=min(jobs, len(groups))) as pool:
+            futures = {pool.submit(run_phase_group, keys, cfg, use_cache): keys for keys in groups}
+            for future in as_completed(futures):
+                try:
+                    results.extend(future.result())
+                except Exception as exc:
+                    detail = f"{type(exc).__name__}: {exc}"
+                    results.extend(PhaseResult(key, "failed", detail=detail) for key in futures[future])
+    return sorted(results, key=lambda result: int(result.phase))
+
+
+def write_summary(cfg: OrchestratorConfig, results: list[PhaseResult], jobs: int, seconds: float) -> Path:
+    path = cfg.output_dir / cfg.client_slug / "reports" / SUMMARY_FILENAME
+    payload: dict[str, Any] = {
+        "client": cfg.client_slug,
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "jobs": jobs,
+        "seconds": round(seconds, 3),
+        "phases": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    return path
+
+
+def print_summary(results: list[PhaseResult], seconds: float) -> None:
+    for result in results:
+        detail = f" - {result.detail}" if result.detail else ""
+        print(f"phase {result.phase}: {result.status} ({result.seconds:.2f}s){detail}")
+    print(f"total: {seconds:.2f}s")
 
 
 def main() -> int:
     args = parse_args()
     cfg = OrchestratorConfig.load(Path(args.config))
-    for phase_key in get_phase_keys(args):
-        run_phase(phase_key, cfg, args.dry_run)
-    return 0
+    phase_keys = get_phase_keys(args)
+    skipped: list[PhaseResult] = []
+    if args.all:
+        skipped = [PhaseResult(key, "skipped", detail="no inputs configured") for key in phase_keys if key not in cfg.phases]
+        phase_keys = [key for key in phase_keys if key in cfg.phases]
+    if args.dry_run:
+        for phase_key in phase_keys:
+            run_phase(phase_key, cfg, True)
+        return 0
+    started = time.perf_counter()
+    results = sorted(run_phases(phase_keys, cfg, args.jobs, args.cache) + skipped, key=lambda result: int(result.phase))
+    seconds = time.perf_counter() - started
+    print_summary(results, seconds)
+    print(f"wrote {write_summary(cfg, results, args.jobs, seconds)}")
+    return 1 if any(result.status == "failed" for result in results) else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,105 @@
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_agentctl():
+    path = ROOT / ".codex-swarm" / "agentctl.py"
+    spec = importlib.util.spec_from_file_location("agentctl_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+agentctl = load_agentctl()
+
+
+def load_local_backend():
+    path = ROOT / ".codex-swarm" / "backends" / "local" / "backend.py"
+    spec = importlib.util.spec_from_file_location("local_backend_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+local = load_local_backend()
+
+
+class DependencyGraphTests(unittest.TestCase):
+    def test_cycle_detection_handles_long_chains(self):
+        size = sys.getrecursionlimit() * 3
+        edges = {f"T{idx}": [f"T{idx + 1}"] for idx in range(size)}
+        edges[f"T{size}"] = []
+        self.assertEqual(agentctl.detect_cycles(edges), [])
+        edges[f"T{size}"] = [f"T{size - 2}"]
+        self.assertEqual(agentctl.detect_cycles(edges), [[f"T{size - 2}", f"T{size - 1}", f"T{size}", f"T{size - 2}"]])
+
+    def test_cycles_and_self_dependencies_are_reported_once(self):
+        edges = {"A": ["B"], "B": ["A"], "C": ["C"], "D": ["A", "missing"]}
+        self.assertEqual(agentctl.detect_cycles(edges), [["A", "B", "A"], ["C", "C"]])
+
+    def test_critical_path_follows_longest_open_chain(self):
+        edges = {
+            "A": [],
+            "B": ["A"],
+            "C": ["B"],
+            "D": ["C", "X"],
+            "E": ["A"],
+            "F": ["G"],
+            "G": ["F"],
+            "X": [],
+        }
+        self.assertEqual(agentctl.critical_path(edges, done=set()), ["A", "B", "C", "D"])
+        self.assertEqual(agentctl.critical_path(edges, done={"A", "B"}), ["C", "D"])
+        self.assertEqual(agentctl.critical_path({"F": ["F"]}, done=set()), [])
+
+
+class TaskIndexWarningTests(unittest.TestCase):
+    def test_index_path_reports_full_list_warnings(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir) / "tasks"
+            plain = local.LocalBackend({"dir": str(root)})
+            for task in (
+                {"id": "202601010000-AAAA", "title": "Base", "depends_on": "202601010000-BBBB"},
+                {"id": "202601010000-BBBB", "title": "Next", "depends_on": ["202601010000-AAAA", 7]},
+                {"id": "202601010000-CCCC", "title": "Self", "depends_on": ["202601010000-CCCC"]},
+            ):
+                plain.write_task(task)
+            (root / "202601010000-ZZZZ").mkdir()
+            (root / "202601010000-ZZZZ" / "README.md").write_text('---\ntitle: "No id"\n---\n', encoding="utf-8")
+            indexed = local.LocalBackend({"dir": str(root), "index_path": str(root / ".index.sqlite")})
+            results = []
+            for backend in (plain, indexed):
+                with (
+                    mock.patch.object(agentctl, "backend_instance", return_value=backend),
+                    mock.patch.object(agentctl, "_TASK_INDEX_CACHE", None),
+                    mock.patch.object(agentctl, "_TASK_DEP_CACHE", None),
+                ):
+                    results.append(agentctl.load_task_dependencies("202601010000-BBBB")[2])
+                    if backend is indexed:
+                        with mock.patch.object(indexed.index, "refresh", wraps=indexed.index.refresh) as refresh:
+                            agentctl.load_task_index()
+                        self.assertEqual(refresh.call_count, 1)
+            indexed.index.close()
+        self.assertEqual(results[1], results[0])
+        self.assertEqual(
+            results[0],
+            [
+                "tasks[3] is missing a non-empty id",
+                "202601010000-AAAA: depends_on must be a list of task IDs",
+                "202601010000-BBBB: depends_on entries must be strings",
+                "202601010000-CCCC: depends_on contains itself",
+                "Dependency cycle detected: 202601010000-CCCC -> 202601010000-CCCC",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
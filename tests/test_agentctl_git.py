@@ -0,0 +1,89 @@
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_agentctl():
+    path = ROOT / ".codex-swarm" / "agentctl.py"
+    spec = importlib.util.spec_from_file_location("agentctl_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+agentctl = load_agentctl()
+
+IDENTITY = ["-c", "user.name=Test", "-c", "user.email=test@example.com"]
+
+
+class GitCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmpdir.name)
+        self.git("init", "-q", "-b", "main")
+        (self.repo / "notes.txt").write_text("base\n", encoding="utf-8")
+        self.git("add", "notes.txt")
+        self.git(*IDENTITY, "commit", "-q", "-m", "base")
+        for idx in range(20):
+            self.git("branch", f"task/202601010000-A{idx:03d}/work")
+        self.git("tag", "v1")
+        agentctl.GIT.invalidate()
+        agentctl.GIT.timings.clear()
+
+    def tearDown(self):
+        agentctl.GIT.invalidate()
+        self.tmpdir.cleanup()
+
+    def git(self, *args):
+        return subprocess.run(["git", *args], cwd=self.repo, check=True, capture_output=True, text=True).stdout
+
+    def spawned(self, label):
+        return int(agentctl.GIT.timings.get(label, [0])[0])
+
+    def test_ref_queries_share_one_for_each_ref(self):
+        head = self.git("rev-parse", "HEAD").strip()
+        branches = agentctl.git_list_task_branches(cwd=self.repo)
+        self.assertEqual(len(branches), 20)
+        for branch in branches:
+            self.assertTrue(agentctl.git_branch_exists(branch, cwd=self.repo))
+            self.assertEqual(agentctl.git_rev_parse(branch, cwd=self.repo), head)
+        self.assertEqual(agentctl.git_rev_parse("v1", cwd=self.repo), head)
+        self.assertFalse(agentctl.git_branch_exists("missing", cwd=self.repo))
+        self.assertEqual(agentctl.git_merged_branches("main", cwd=self.repo), {"main", *branches})
+        self.assertEqual(self.spawned("for-each-ref"), 2)
+        self.assertEqual(self.spawned("rev-parse"), 0)
+
+        self.assertEqual(agentctl.git_rev_parse("HEAD~0", cwd=self.repo), head)
+        self.assertEqual(agentctl.git_rev_parse("HEAD~0", cwd=self.repo), head)
+        self.assertEqual(self.spawned("rev-parse"), 1)
+        self.assertIn("git:", agentctl.GIT.report()[0])
+
+    def test_git_commands_that_write_drop_cached_answers(self):
+        self.assertFalse(agentctl.git_branch_exists("feature", cwd=self.repo))
+        self.assertEqual(agentctl.git_config_get("Core.Bare", cwd=self.repo), "false")
+        agentctl.run(["git", "branch", "feature"], cwd=self.repo)
+        agentctl.git_config_set("agentctl.baseBranch", "main", cwd=self.repo)
+        self.assertTrue(agentctl.git_branch_exists("feature", cwd=self.repo))
+        self.assertEqual(agentctl.git_config_get("agentctl.basebranch", cwd=self.repo), "main")
+
+    def test_file_reads_share_one_cat_file_process(self):
+        self.assertEqual(agentctl.git_show_text("main", "notes.txt", cwd=self.repo), "base\n")
+        self.assertIsNone(agentctl.git_show_text("main", "missing.txt", cwd=self.repo))
+        self.assertIsNone(agentctl.git_show_text("main", "", cwd=self.repo))
+        self.assertEqual(agentctl.git_show_text("v1", "notes.txt", cwd=self.repo), "base\n")
+        self.assertEqual(self.spawned("cat-file"), 1)
+
+        (self.repo / "notes.txt").write_text("changed\n", encoding="utf-8")
+        agentctl.run(["git", *IDENTITY, "commit", "-q", "-am", "change"], cwd=self.repo)
+        self.assertEqual(agentctl.git_show_text("main", "notes.txt", cwd=self.repo), "changed\n")
+        self.assertEqual(self.spawned("cat-file"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
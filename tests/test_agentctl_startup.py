@@ -0,0 +1,71 @@
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_agentctl():
+    path = ROOT / ".codex-swarm" / "agentctl.py"
+    spec = importlib.util.spec_from_file_location("agentctl_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+agentctl = load_agentctl()
+
+
+class LazyParserTests(unittest.TestCase):
+    def test_only_invoked_command_gets_arguments(self):
+        parser = agentctl.build_parser(["ready", "202601010000-AAAA"])
+        args = parser.parse_args(["ready", "202601010000-AAAA"])
+        self.assertIs(args.func, agentctl.cmd_ready)
+        skipped, _ = parser.parse_known_args(["sync"])
+        self.assertFalse(hasattr(skipped, "func"))
+
+    def test_full_parser_when_no_command_given(self):
+        parser = agentctl.build_parser()
+        self.assertIs(parser.parse_args(["task", "list"]).func, agentctl.cmd_task_list)
+        self.assertIs(parser.parse_args(["sync"]).func, agentctl.cmd_sync)
+
+
+class LintCacheTests(unittest.TestCase):
+    def test_lint_result_reused_until_tasks_json_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tasks_path = Path(tmpdir) / "tasks.json"
+            data = {"tasks": [{"id": "202601010000-AAAA", "title": "Base", "status": "TODO"}]}
+            agentctl.update_tasks_meta(data)
+            tasks_path.write_text(json.dumps(data), encoding="utf-8")
+            with (
+                mock.patch.object(agentctl, "TASKS_PATH", tasks_path),
+                mock.patch.object(agentctl, "LINT_CACHE_PATH", Path(tmpdir) / ".lint.json"),
+            ):
+                self.assertEqual(agentctl.lint_tasks_json(), {"errors": [], "warnings": []})
+                with (
+                    mock.patch.object(agentctl, "lint_tasks_payload", side_effect=AssertionError("re-linted")),
+                    mock.patch.object(agentctl, "tasks_json_sha256", wraps=agentctl.tasks_json_sha256) as digest,
+                ):
+                    self.assertEqual(agentctl.lint_tasks_json(), {"errors": [], "warnings": []})
+                    self.assertEqual(digest.call_count, 0)
+                    # A touch changes the stat but not the bytes: hashed once, still not re-linted.
+                    stat = tasks_path.stat()
+                    os.utime(tasks_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+                    self.assertEqual(agentctl.lint_tasks_json(), {"errors": [], "warnings": []})
+                    self.assertEqual(agentctl.lint_tasks_json(), {"errors": [], "warnings": []})
+                    self.assertEqual(digest.call_count, 1)
+
+                data["tasks"][0]["title"] = "Edited by hand"
+                tasks_path.write_text(json.dumps(data), encoding="utf-8")
+                errors = agentctl.lint_tasks_json()["errors"]
+        self.assertEqual(errors, ["tasks.json meta.checksum does not match tasks payload (manual edit?)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
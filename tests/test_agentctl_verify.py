@@ -0,0 +1,75 @@
+import importlib.util
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_agentctl():
+    path = ROOT / ".codex-swarm" / "agentctl.py"
+    spec = importlib.util.spec_from_file_location("agentctl_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+agentctl = load_agentctl()
+
+TASK_ID = "202601010000-AAAA"
+
+
+class VerifyRunnerTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = Path(self.tmpdir.name)
+        self.log_path = self.cwd / "pr" / "verify.log"
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def verify(self, commands, **kwargs):
+        with mock.patch.object(agentctl, "get_task_verify_commands_for", return_value=commands):
+            return agentctl.run_verify_with_capture(
+                TASK_ID, cwd=self.cwd, quiet=True, log_path=self.log_path, current_sha="abc1234", **kwargs
+            )
+
+    def test_jobs_run_commands_concurrently_and_record_durations(self):
+        started = time.monotonic()
+        entries = self.verify(["sleep 0.5; echo first", "echo second >&2; sleep 0.5"], jobs=2)
+        self.assertLess(time.monotonic() - started, 0.9)
+        self.assertEqual([header.split("] ", 1)[1] for header, _ in entries[:2]], [
+            "sha=abc1234 $ sleep 0.5; echo first",
+            "sha=abc1234 $ echo second >&2; sleep 0.5",
+        ])
+        self.assertTrue(entries[0][1].startswith("first\n"))
+        self.assertRegex(entries[1][1], r"^second\n\[.*\] ✅ exit=0 duration=0\.\d\ds$")
+        log = self.log_path.read_text(encoding="utf-8")
+        self.assertIn("#2 | second", log)
+        self.assertEqual(agentctl.extract_last_verified_sha_from_log(log), "abc1234")
+
+    def test_output_is_logged_before_timeout_kills_the_command(self):
+        with self.assertRaises(SystemExit) as ctx:
+            self.verify(["echo started; sleep 10"], timeout=0.3)
+        self.assertEqual(ctx.exception.code, agentctl.VERIFY_TIMEOUT_EXIT_CODE)
+        log = self.log_path.read_text(encoding="utf-8")
+        self.assertIn("started\n", log)
+        self.assertIn("⏱️ timeout after 0.3s exit=124", log)
+        self.assertIsNone(agentctl.extract_last_verified_sha_from_log(log))
+
+    def test_failure_stops_remaining_commands(self):
+        with self.assertRaises(SystemExit) as ctx:
+            self.verify(["echo broken; exit 3", "echo never"])
+        self.assertEqual(ctx.exception.code, 3)
+        log = self.log_path.read_text(encoding="utf-8")
+        self.assertIn("broken\n", log)
+        self.assertIn("❌ exit=3", log)
+        self.assertNotIn("never", log)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.workflow import batch_runner
+
+
+class FakeRunner:
+    """Records per-host concurrency and fails the commands it is told to."""
+
+    def __init__(self, fail=()):
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.calls: list[tuple[str, str]] = []
+
+    def __call__(self, cmd, log_path):
+        slug = cmd[cmd.index("--slug") + 1] if "--slug" in cmd else Path(cmd[cmd.index("--config") + 1]).stem
+        host = batch_runner.host_of(cmd[cmd.index("--site-url") + 1]) if "--site-url" in cmd else ""
+        with self.lock:
+            self.calls.append((slug, log_path.stem))
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self.active[host])
+        time.sleep(0.02)
+        with self.lock:
+            self.active[host] -= 1
+        return 1 if log_path.stem in self.fail else 0
+
+
+class BatchRunnerTests(unittest.TestCase):
+    def entries(self):
+        return [
+            {"client": "A", "slug": "a", "site_url": "https://shared.example/a", "config": "a.json"},
+            {"client": "B", "slug": "b", "site_url": "https://www.shared.example/b"},
+            {"client": "C", "slug": "c", "site_url": "https://other.example", "config": "c.json"},
+            {"client": "D", "slug": "d", "config": "d.json"},
+        ]
+
+    def test_per_host_budget_and_step_order(self):
+        jobs = [batch_runner.build_job(entry, "python") for entry in self.entries()]
+        self.assertEqual([job.slug for job in batch_runner.interleave_hosts(jobs)], ["a", "c", "d", "b"])
+        runner = FakeRunner()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            state = batch_runner.BatchState(base / "batch.json", "nightly", resume=False)
+            batch_runner.run_batch(jobs, state, 4, 1, base / "logs", runner)
+        self.assertEqual(runner.peak["shared.example"], 1)
+        self.assertEqual(max(runner.active.values()), 0)
+        calls = [step for slug, step in runner.calls if slug == "a"]
+        self.assertEqual(calls, ["a-audit", "a-phases"])
+        self.assertEqual({slug: client["status"] for slug, client in state.data["clients"].items()}, dict.fromkeys("abcd", "ok"))
+
+    def test_resume_skips_finished_steps(self):
+        jobs = [batch_runner.build_job(entry, "python") for entry in self.entries()]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            state = batch_runner.BatchState(base / "batch.json", "nightly", resume=False)
+            batch_runner.run_batch(jobs, state, 2, 1, base / "logs", FakeRunner(fail={"c-audit", "d-phases"}))
+            self.assertEqual(state.data["clients"]["c"]["status"], "failed")
+            self.assertNotIn("phases", state.data["clients"]["c"]["steps"])
+            report = batch_runner.render_status(state.data)
+            self.assertIn("| C | c | failed | audit: failed | ", report)
+            self.assertIn("Totals: failed 2, ok 2", report)
+
+            rerun = FakeRunner()
+            resumed = batch_runner.BatchState(base / "batch.json", "nightly", resume=True)
+            batch_runner.run_batch(jobs, resumed, 2, 1, base / "logs", rerun)
+        self.assertEqual(sorted(step for _, step in rerun.calls), ["c-audit", "c-phases", "d-phases"])
+        self.assertTrue(all(client["status"] == "ok" for client in resumed.data["clients"].values()))
+
+    def test_config_paths_are_absolute(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "a.json").write_text('{"client_name": "A", "client_slug": "a"}', encoding="utf-8")
+            cwd = os.getcwd()
+            os.chdir(base)
+            try:
+                entries = batch_runner.entries_from_configs([Path("a.json")])
+                job = batch_runner.build_job({"slug": "d", "config": "d.json"}, "python")
+            finally:
+                os.chdir(cwd)
+            self.assertEqual(entries[0]["config"], str((base / "a.json").resolve()))
+            cmd = job.steps[0].cmd
+            self.assertEqual(cmd[cmd.index("--config") + 1], str((base / "d.json").resolve()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+from pathlib import Path
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.workflow.automation.column_table import ColumnTable
+from scripts.workflow.automation.phase2_service_brief import CrawlSnapshot
+from scripts.workflow.automation.phase4_keyword_strategy import KeywordImporter
+
+
+class ColumnTableTests(unittest.TestCase):
+    def test_columns_coalesce_and_numbers_are_cached(self):
+        table = ColumnTable(
+            [
+                {"keyword": "plumber", "volume": "1,200"},
+                {"query": "drain", "volume": ""},
+                {"keyword": "heater", "search_volume": "40", "volume": "bad"},
+            ]
+        )
+        self.assertEqual(table.column("keyword", "query"), ["plumber", "drain", "heater"])
+        volumes = table.ints("volume")
+        self.assertEqual(volumes, [1200, 0, None])
+        self.assertIs(table.ints("volume"), volumes)
+        self.assertEqual(table.sum("volume", [0, 1]), 1200)
+        with self.assertRaises(SystemExit):
+            table.sum("volume")
+
+    def test_top_keeps_row_order_for_ties(self):
+        table = ColumnTable([{"v": value} for value in ("5", "9", "5", "9", "1")])
+        self.assertEqual(table.top(table.ints("v"), 3), [1, 3, 0])
+        self.assertEqual(table.top(table.ints("v"), 2, [0, 2, 4]), [0, 2])
+
+    def test_programs_read_through_the_table(self):
+        importer = KeywordImporter(
+            [{"keyword": f"kw {idx}", "volume": str(idx % 4 * 10)} for idx in range(8)]
+        )
+        importer.set_volume_min(10)
+        self.assertEqual(importer.get_keywords(), ["kw 1", "kw 2", "kw 3", "kw 5", "kw 6", "kw 7"])
+        self.assertEqual([row["keyword"] for row in importer.get_top_keywords(3)], ["kw 3", "kw 7", "kw 2"])
+
+        snapshot = CrawlSnapshot(
+            [
+                {"url": "https://e.com/Plumbing/a", "title": "", "text": "one two"},
+                {"url": "https://e.com/drains", "title": "Drains", "text": "x"},
+                {"page": "https://e.com/plumbing/b", "title": "B", "body": "three four five six"},
+            ]
+        )
+        snapshot.set_service("Plumbing")
+        self.assertEqual(snapshot.get_urls(), ["https://e.com/Plumbing/a", "https://e.com/plumbing/b"])
+        self.assertEqual(snapshot.get_missing_titles(), ["https://e.com/Plumbing/a"])
+        self.assertEqual(snapshot.get_average_word_count(), 3.0)
+        self.assertEqual(snapshot.get_page("https://e.com/drains")["title"], "Drains")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.validation import compliance_matcher, draft_compliance_lint
+from scripts.workflow.automation.phase3_compliance_risk import ComplianceScanner
+
+
+class ComplianceMatcherTests(unittest.TestCase):
+    def test_scanner_matches_per_line_regexes(self):
+        scanner = compliance_matcher.LineScanner(
+            {
+                "placeholder": compliance_matcher.PLACEHOLDER_RE,
+                "todo": compliance_matcher.TODO_RE,
+                "claim": compliance_matcher.CLAIM_RE,
+            }
+        )
+        content = "\n".join(
+            [
+                "# Draft",
+                "Fill in [TODO] later",
+                "An open [bracket",
+                "the best plumber",
+                "closed] here",
+                "[Link](https://example.com) is fine",
+            ]
+        )
+        hits = scanner.scan(content)
+        self.assertEqual(
+            [(line, kinds) for line, _, kinds in hits],
+            [(2, ["placeholder", "todo"]), (4, ["claim"])],
+        )
+        self.assertEqual(hits[1][1], "the best plumber")
+
+    def test_scanner_agrees_with_line_by_line_search(self):
+        patterns = {
+            "placeholder": compliance_matcher.PLACEHOLDER_RE,
+            "todo": compliance_matcher.TODO_RE,
+            "claim": compliance_matcher.CLAIM_RE,
+            "missing_source": compliance_matcher.SOURCE_RE,
+        }
+        scanner = compliance_matcher.LineScanner(patterns)
+        rng = random.Random(3)
+        words = ["Best", "bestow", "[City]", "[a](b)", "tk", "Atkins", "source needed", "Top-Rated", "plain", "#1", "TODO:"]
+        content = "\n".join(" ".join(rng.choice(words) for _ in range(3)) for _ in range(300))
+        expected = []
+        for idx, line in enumerate(content.splitlines(), start=1):
+            kinds = [kind for kind, pattern in patterns.items() if pattern.search(line)]
+            if kinds:
+                expected.append((idx, line, kinds))
+        self.assertEqual(scanner.scan(content), expected)
+
+    def test_phrase_matcher_agrees_with_substring_search(self):
+        rng = random.Random(7)
+        words = ["licensed", "insured", "best", "same day", "bonded", "family owned", "free estimate"]
+        phrases = [" ".join(rng.sample(words, 2)) for _ in range(50)] + ["best", "lic"]
+        matcher = compliance_matcher.PhraseMatcher(phrases)
+        for _ in range(200):
+            text = " ".join(rng.choice(words) for _ in range(4))
+            expected = any(phrase in text for phrase in phrases)
+            self.assertEqual(matcher.search(text), expected, text)
+        self.assertFalse(compliance_matcher.PhraseMatcher([]).search("anything"))
+
+    def test_draft_lint_uses_scanner(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "draft.md"
+            path.write_text("Intro\nWe are licensed.\n- TBD: pricing\n", encoding="utf-8")
+            issues = draft_compliance_lint.lint_file(path)
+        self.assertEqual([(issue.line, issue.kind) for issue in issues], [(2, "claim"), (3, "todo")])
+
+    def test_phase3_allowed_claims(self):
+        scanner = ComplianceScanner(["satisfaction guarantee", "best value"])
+        claims = scanner.get_claims("We guarantee results. Our satisfaction guarantee applies. Call today")
+        self.assertEqual(scanner.get_disallowed_claims(claims), ["We guarantee results"])
+        self.assertEqual(scanner.get_allowed_claims(claims), ["Our satisfaction guarantee applies"])
+
+
+if __name__ == "__main__":
+    unittest.main()
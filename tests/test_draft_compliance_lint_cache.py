@@ -0,0 +1,110 @@
+import os
+import queue
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.validation import draft_compliance_lint
+
+
+class DraftComplianceLintCacheTests(unittest.TestCase):
+    def test_unchanged_files_reuse_cached_issues(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            draft = base / "draft.md"
+            draft.write_text("We are the best.\n", encoding="utf-8")
+            cache_path = base / "cache.json"
+            rules = draft_compliance_lint.ruleset_hash({})
+
+            first = draft_compliance_lint.lint_files([draft], {}, draft_compliance_lint.LintCache(cache_path, rules))
+            self.assertEqual([issue.kind for issue in first], ["claim"])
+
+            real_lint = draft_compliance_lint.lint_content
+            with mock.patch.object(draft_compliance_lint, "lint_content", side_effect=real_lint) as lint:
+                cache = draft_compliance_lint.LintCache(cache_path, rules)
+                again = draft_compliance_lint.lint_files([draft], {}, cache)
+                self.assertEqual(lint.call_count, 0)
+                self.assertEqual(again, first)
+
+                # Same content with a new mtime is matched by hash, not re-linted.
+                stat = draft.stat()
+                os.utime(draft, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+                draft_compliance_lint.lint_files([draft], {}, cache)
+                self.assertEqual(lint.call_count, 0)
+
+                draft.write_text("TODO: rewrite\n", encoding="utf-8")
+                changed = draft_compliance_lint.lint_files([draft], {}, cache)
+                self.assertEqual(lint.call_count, 1)
+                self.assertEqual([issue.kind for issue in changed], ["todo"])
+
+    def test_rule_change_discards_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            draft = base / "draft.md"
+            draft.write_text("Plain copy.\n", encoding="utf-8")
+            cache_path = base / "cache.json"
+            draft_compliance_lint.lint_files(
+                [draft], {}, draft_compliance_lint.LintCache(cache_path, draft_compliance_lint.ruleset_hash({}))
+            )
+
+            nap = {"business_name": "GeoNova"}
+            cache = draft_compliance_lint.LintCache(cache_path, draft_compliance_lint.ruleset_hash(nap))
+            self.assertEqual(cache.entries, {})
+            issues = draft_compliance_lint.lint_files([draft], nap, cache)
+            self.assertEqual([issue.kind for issue in issues], ["nap_missing"])
+
+    def test_polled_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            (base / "one.md").write_text("# One", encoding="utf-8")
+            changes = draft_compliance_lint._polled_changes(
+                [base], 0.01, draft_compliance_lint.snapshot([base])
+            )
+            (base / "two.md").write_text("# Two", encoding="utf-8")
+            self.assertEqual(next(changes), {base / "two.md"})
+
+    def test_watchdog_events_are_filtered_to_requested_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            draft, pages = base / "draft.md", base / "pages"
+            pages.mkdir()
+            changes = queue.Queue()
+            handler = draft_compliance_lint._ChangeHandler(
+                changes, {pages.resolve(): pages}, {draft.resolve(): draft}
+            )
+            for name in ("draft.md", "other.md", "pages/new.md", "pages/notes.txt"):
+                handler.on_any_event(SimpleNamespace(src_path=str((base / name).resolve())))
+            queued = [changes.get_nowait() for _ in range(changes.qsize())]
+        self.assertEqual(queued, [draft, pages / "new.md"])
+
+    def test_watch_reloads_nap_when_inputs_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            draft, inputs = base / "draft.md", base / "inputs.md"
+            draft.write_text("Call GeoNova today.\n", encoding="utf-8")
+            inputs.write_text("- Business name: GeoNova\n", encoding="utf-8")
+            cache = draft_compliance_lint.LintCache(base / "cache.json", "stale")
+
+            def batches(_paths, _interval):
+                yield {draft}
+                inputs.write_text("- Business name: Acme Plumbing\n", encoding="utf-8")
+                yield {inputs}
+
+            with (
+                mock.patch.object(draft_compliance_lint, "iter_changes", batches),
+                mock.patch("builtins.print"),
+            ):
+                draft_compliance_lint.watch([draft], inputs, cache, base / "reports", 0.01)
+            report = (base / "reports" / "draft-compliance-lint.md").read_text(encoding="utf-8")
+        self.assertEqual(cache.rules, draft_compliance_lint.ruleset_hash({"business_name": "Acme Plumbing"}))
+        self.assertIn("Business name not found in draft.", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
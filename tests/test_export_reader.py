@@ -0,0 +1,203 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest import mock
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.ingest import export_reader, ga4_export_ingest, gsc_export_ingest
+from scripts.workflow.automation.phase1_monthly_performance import GA4Report
+
+
+try:
+    import openpyxl
+except ImportError:  # optional dependency
+    openpyxl = None
+
+try:
+    import pyarrow
+except ImportError:  # optional dependency
+    pyarrow = None
+
+
+def batch_rows(batch):
+    return list(batch.rows())
+
+
+class ExportReaderTests(unittest.TestCase):
+    def test_batches_resolve_aliases_and_types(self):
+        csv_content = "\n".join(
+            [
+                "﻿Address,URL,Status Code,Word Count",
+                "https://example.com/a,,200,120",
+                ",https://example.com/b,3.0,",
+                "",
+                "https://example.com/c,,bad",
+            ]
+        )
+        spec = export_reader.ExportSpec(
+            aliases={"url": ["url", "address"], "status_code": ["status_code"], "title": ["title"]},
+            types={"status_code": "int"},
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "crawl.csv"
+            path.write_text(csv_content, encoding="utf-8")
+            self.assertEqual(export_reader.read_headers(path), ["address", "url", "status_code", "word_count"])
+            batches = list(export_reader.iter_batches(path, spec, chunk_size=2))
+        self.assertEqual([batch.size for batch in batches], [2, 1])
+        rows = [row for batch in batches for row in batch.rows()]
+        self.assertEqual(
+            rows,
+            [
+                {"url": "https://example.com/a", "status_code": 200, "title": ""},
+                {"url": "https://example.com/b", "status_code": 3, "title": ""},
+                {"url": "https://example.com/c", "status_code": 0, "title": ""},
+            ],
+        )
+
+    def test_parallel_ranges_match_serial(self):
+        lines = ["Query,Page,Clicks"]
+        for idx in range(400):
+            query = f'"multi\nline ""{idx}"", query"' if idx % 7 == 0 else f"query {idx}"
+            lines.append(f"{query},/p{idx % 9},{idx}")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "gsc.csv"
+            path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            spec = export_reader.ExportSpec(types={"clicks": "float"})
+            serial = list(export_reader.map_batches(path, batch_rows, spec, chunk_size=50))
+            parallel = list(export_reader.map_batches(path, batch_rows, spec, chunk_size=50, jobs=2))
+            ranges = list(export_reader.split_ranges(path, chunk_size=50))
+        flat = [row for rows in parallel for row in rows]
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(flat, [row for rows in serial for row in rows])
+        self.assertEqual(len(flat), 400)
+        self.assertEqual(flat[7]["query"], 'multi\nline "7", query')
+
+    def test_json_rows_writer_streams_valid_payload(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "out.json"
+            with export_reader.JsonRowsWriter(path, {"exported_at": "now"}) as writer:
+                writer.write([{"a": 1}])
+                writer.write([])
+                writer.write_encoded(export_reader.encode_rows([{"a": 2}, {"a": 3}]), 2)
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"exported_at": "now", "rows": [{"a": 1}, {"a": 2}, {"a": 3}]})
+
+            with self.assertRaises(SystemExit):
+                with export_reader.JsonRowsWriter(path, {}) as writer:
+                    raise SystemExit("No rows found in export.")
+            self.assertEqual(sorted(item.name for item in Path(tmpdir).iterdir()), ["out.json"])
+
+    def test_merged_partial_summaries_match_full_summary(self):
+        rows = [
+            {"query": "plumber", "page": "/a", "clicks": 5.0, "impressions": 50.0},
+            {"query": "drain", "page": "/b", "clicks": 7.0, "impressions": 20.0},
+            {"query": "plumber", "page": "", "clicks": 4.0, "impressions": 10.0},
+            {"query": "heater", "page": "/a", "clicks": 9.0, "impressions": 90.0},
+        ]
+        merged = gsc_export_ingest.new_summary()
+        for chunk in (rows[:1], rows[1:3], rows[3:]):
+            merged.merge(gsc_export_ingest.new_summary().add(export_reader.ColumnBatch.from_rows(chunk)))
+        summary = gsc_export_ingest.render_summary(merged)
+        expected = gsc_export_ingest.build_summary(rows)
+        self.assertEqual(summary["top_queries"], expected["top_queries"])
+        self.assertEqual(summary["top_pages"], [{"name": "/a", "clicks": 14.0, "impressions": 140.0}, {"name": "/b", "clicks": 7.0, "impressions": 20.0}])
+        self.assertEqual(summary["top_queries"][0], {"name": "plumber", "clicks": 9.0, "impressions": 60.0})
+
+    def test_top_groups_match_full_sort_with_and_without_numpy(self):
+        rows = [
+            {"query": f"q{idx % 37}", "page": f"/p{idx % 5}" if idx % 4 else "", "clicks": float(idx % 11), "impressions": 1.0}
+            for idx in range(500)
+        ]
+        totals: dict[str, float] = {}
+        for row in rows:
+            totals[row["query"]] = totals.get(row["query"], 0.0) + row["clicks"]
+        expected = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:10]
+        for numpy_module in (export_reader.np, None):
+            with mock.patch.object(export_reader, "np", numpy_module):
+                summary = gsc_export_ingest.new_summary()
+                summary.add(export_reader.ColumnBatch.from_rows(rows[:200]))
+                summary.merge(gsc_export_ingest.new_summary().add(export_reader.ColumnBatch.from_rows(rows[200:])))
+                top = summary.top("top_queries", "clicks", fields=["clicks"])
+                pages = summary.top("top_pages", "clicks", limit=50)
+            self.assertEqual([(item["name"], item["clicks"]) for item in top], expected)
+            self.assertEqual(summary.totals["impressions"], 500.0)
+            self.assertEqual(len(pages), 5)
+            self.assertNotIn("", [item["name"] for item in pages])
+
+
+@unittest.skipIf(openpyxl is None, "openpyxl not installed")
+class XlsxExportTests(unittest.TestCase):
+    def write_workbook(self, path):
+        workbook = openpyxl.Workbook()
+        first = workbook.active
+        first.title = "Data"
+        first.append(["Date", "Page path", "Users", None])
+        first.append([datetime(2026, 1, 1), "/home", 100.0])
+        first.append([None, None, None])
+        filters = workbook.create_sheet("Filters")
+        filters.append(["Filter", "Value"])
+        filters.append(["Country", "US"])
+        second = workbook.create_sheet("Data (2)")
+        second.append(["date", "page path", "users"])
+        second.append(["2026-01-02", "/contact", 2.5])
+        workbook.save(path)
+
+    def test_reads_matching_sheets_as_one_export(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "ga4-export.xlsx"
+            self.write_workbook(path)
+            self.assertEqual(export_reader.read_headers(path), ["date", "page_path", "users"])
+            spec = export_reader.ExportSpec(types={"users": "float"})
+            rows = [row for batch in export_reader.map_batches(path, batch_rows, spec, jobs=2) for row in batch]
+            filters = export_reader.load_csv(path, sheet="Filters")
+            with self.assertRaises(SystemExit):
+                export_reader.read_headers(path, sheet="Missing")
+        self.assertEqual(
+            rows,
+            [
+                {"date": "2026-01-01", "page_path": "/home", "users": 100.0},
+                {"date": "2026-01-02", "page_path": "/contact", "users": 2.5},
+            ],
+        )
+        self.assertEqual(filters, [{"filter": "Country", "value": "US"}])
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow not installed")
+class ColumnarOutputTests(unittest.TestCase):
+    def test_phase1_reads_columnar_ga4_export(self):
+        csv_content = "\n".join(
+            [
+                "Date,Page path,Users,Sessions,Session source",
+                "2026-01-01,/home,100,120,google",
+                "2026-01-02,/contact,50,60,",
+                "2026-02-01,/home,7,8,bing",
+            ]
+        )
+        spec = ga4_export_ingest.EXPORT_SPEC
+        with tempfile.TemporaryDirectory() as tmpdir:
+            source = Path(tmpdir) / "ga4.csv"
+            source.write_text(csv_content, encoding="utf-8")
+            headers = export_reader.read_headers(source)
+            for fmt in ("parquet", "arrow"):
+                path = Path(tmpdir) / f"ga4-export.{fmt}"
+                with export_reader.open_writer(path, fmt, {"property": "p"}, headers, spec) as writer:
+                    for batch in export_reader.iter_batches(source, spec, chunk_size=2):
+                        writer.write(batch)
+                schema = pyarrow.ipc.open_file(str(path)).schema if fmt == "arrow" else pyarrow.parquet.read_schema(path)
+                self.assertEqual(str(schema.field("sessions").type), "double")
+                self.assertEqual(str(schema.field("page_path").type), "string")
+                self.assertEqual(json.loads(schema.metadata[export_reader.PAYLOAD_METADATA_KEY]), {"property": "p"})
+
+                report = GA4Report.import_csv(path)
+                self.assertEqual(set(report.rows[0]), {"date", "page_path", "users", "sessions"})
+                report.set_date_range("2026-01-01", "2026-01-31")
+                self.assertEqual(report.get_users(), 150)
+                self.assertEqual(report.get_top_pages(1), [{"page": "/home", "sessions": 120}])
+
+
+if __name__ == "__main__":
+    unittest.main()
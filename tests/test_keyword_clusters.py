@@ -0,0 +1,92 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.workflow.automation.base import ProgramConfig, ProgramInputs
+from scripts.workflow.automation.keyword_clusters import KeywordClusterer, load_serp_results
+from scripts.workflow.automation.phase4_keyword_strategy import KeywordStrategyProgram
+
+
+def serp_export(results):
+    tasks = []
+    for keyword, urls in results.items():
+        items = [{"type": "organic", "url": url, "domain": url.split("/")[2]} for url in urls]
+        tasks.append({"data": {"keyword": keyword}, "result": [{"keyword": keyword, "items": items}]})
+    return {"generated_at": "2026-01-01T00:00:00+00:00", "response": {"tasks": tasks}}
+
+
+class KeywordClustererTests(unittest.TestCase):
+    def test_similar_keywords_join_the_highest_volume_leader(self):
+        clusters = KeywordClusterer().cluster(
+            ["emergency plumber", "Emergency Plumbers", "drain cleaning", "drain cleaning cost", "roofing", "drain cleaning"],
+            [10, 50, 5, 7, 3, 1],
+        )
+        self.assertEqual(
+            clusters,
+            {
+                "Emergency Plumbers": ["emergency plumber", "Emergency Plumbers"],
+                "drain cleaning cost": ["drain cleaning", "drain cleaning cost", "drain cleaning"],
+                "roofing": ["roofing"],
+            },
+        )
+
+    def test_leaders_stop_chaining_through_near_duplicates(self):
+        keywords = ["drain cleaning", "drain cleaning cost", "drain cleaning cost estimate"]
+        clusters = KeywordClusterer().cluster(keywords, [30, 20, 10])
+        self.assertEqual(list(clusters), ["drain cleaning", "drain cleaning cost estimate"])
+
+    def test_serp_overlap_merges_unrelated_wording(self):
+        shared = [f"https://site{idx}.com/water-heater" for idx in range(3)]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "serp-export.json"
+            path.write_text(
+                json.dumps(
+                    serp_export(
+                        {
+                            "Water Heater Repair": shared + ["https://a.com/x"],
+                            "tankless install": shared + ["https://b.com/y"],
+                            "roofing": shared[:2] + ["https://c.com/z"],
+                        }
+                    )
+                ),
+                encoding="utf-8",
+            )
+            serp = load_serp_results(path)
+        self.assertEqual(len(serp["water heater repair"]), 4)
+        clusters = KeywordClusterer(serp=serp).cluster(["water heater repair", "tankless install", "roofing"], [5, 9, 1])
+        self.assertEqual(clusters, {"tankless install": ["water heater repair", "tankless install"], "roofing": ["roofing"]})
+
+    def test_program_clusters_filtered_keywords_with_serp_export(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            keywords = base / "keywords.csv"
+            keywords.write_text(
+                "Keyword,Volume\nwater heater repair,90\nwater heater repairs,40\ntankless install,30\nroofing,5\n",
+                encoding="utf-8",
+            )
+            reports = base / "out" / "client" / "reports"
+            reports.mkdir(parents=True)
+            urls = [f"https://site{idx}.com/" for idx in range(3)]
+            (reports / "serp-export.json").write_text(
+                json.dumps(serp_export({"water heater repair": urls, "tankless install": urls})), encoding="utf-8"
+            )
+            inputs = ProgramInputs({"keywords_csv": str(keywords)})
+            config = ProgramConfig("Client", "client", base / "out", use_cache=True)
+            output = KeywordStrategyProgram(config, inputs).run()
+            (reports / "serp-export.json").write_text(json.dumps(serp_export({})), encoding="utf-8")
+            rerun = KeywordStrategyProgram(config, inputs).run()
+        self.assertEqual(inputs.values, {"keywords_csv": str(keywords)})
+        self.assertEqual(output.payload["serp_export"], str(reports / "serp-export.json"))
+        self.assertEqual(output.payload["clusters"], [{"cluster": "water heater repair", "count": 3}])
+        self.assertIn("| water heater repair | 3 |", output.report_md)
+        self.assertFalse(rerun.cached)
+        self.assertEqual(rerun.payload["clusters"][0], {"cluster": "water heater repair", "count": 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
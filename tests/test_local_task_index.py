@@ -0,0 +1,145 @@
+import importlib.util
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_backend_module():
+    path = ROOT / ".codex-swarm" / "backends" / "local" / "backend.py"
+    spec = importlib.util.spec_from_file_location("local_backend_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+local = load_backend_module()
+
+DONE_COMMIT = {"hash": "abc123", "message": "done"}
+
+
+class LocalTaskIndexTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name) / "tasks"
+        self.settings = {"dir": str(self.root), "index_path": str(self.root / ".index.sqlite")}
+        self.backend = local.LocalBackend(self.settings)
+        tasks = [
+            {"id": "202601010000-AAAA", "title": "Base", "status": "DONE", "commit": DONE_COMMIT, "tags": ["code"]},
+            {
+                "id": "202601010000-BBBB",
+                "title": "Next",
+                "status": "TODO",
+                "owner": "coder",
+                "depends_on": ["202601010000-AAAA"],
+            },
+            {"id": "202601010000-CCCC", "title": "Blocked", "status": "TODO", "tags": ["docs", "code"],
+             "depends_on": ["202601010000-BBBB", "202601010000-ZZZZ"]},
+        ]
+        for task in tasks:
+            self.backend.write_task(task)
+
+    def tearDown(self):
+        self.backend.index.close()
+        self.tmpdir.cleanup()
+
+    def ids(self, tasks):
+        return [task["id"] for task in tasks]
+
+    def test_queries_match_filters_and_dependency_state(self):
+        index = self.backend.task_index()
+        self.assertEqual(self.backend.list_tasks(), local.LocalBackend({"dir": str(self.root)}).list_tasks())
+        self.assertEqual(self.ids(index.query_tasks(statuses=["todo"])), ["202601010000-BBBB", "202601010000-CCCC"])
+        self.assertEqual(self.ids(index.query_tasks(owners=["CODER"])), ["202601010000-BBBB"])
+        self.assertEqual(self.ids(index.query_tasks(tags=["docs", "missing"])), ["202601010000-CCCC"])
+        state = index.dependency_state(["202601010000-BBBB", "202601010000-CCCC"])
+        self.assertEqual(
+            state["202601010000-BBBB"], {"depends_on": ["202601010000-AAAA"], "missing": [], "incomplete": []}
+        )
+        self.assertEqual(state["202601010000-CCCC"]["missing"], ["202601010000-ZZZZ"])
+        self.assertEqual(state["202601010000-CCCC"]["incomplete"], ["202601010000-BBBB"])
+        edges, done = index.dependency_graph()
+        self.assertEqual(edges["202601010000-CCCC"], ["202601010000-BBBB", "202601010000-ZZZZ"])
+        self.assertEqual(done, {"202601010000-AAAA"})
+
+    def test_refresh_reparses_only_changed_readmes(self):
+        index = self.backend.task_index()
+        revision = index.revision()
+        self.assertEqual(index.refresh(self.root, self.backend._read_task), 0)
+        self.assertEqual(index.revision(), revision)
+
+        task = self.backend.get_task("202601010000-BBBB")
+        task.update(status="DONE", commit=DONE_COMMIT)
+        self.backend.write_task(task)
+        readme = self.backend.task_readme_path("202601010000-AAAA")
+        os.utime(readme, ns=(0, 0))
+        (self.root / "202601010000-CCCC" / "README.md").unlink()
+        self.assertEqual(index.refresh(self.root, self.backend._read_task), 3)
+        self.assertNotEqual(index.revision(), revision)
+        self.assertEqual(self.ids(index.query_tasks(statuses=["DONE"])), ["202601010000-AAAA", "202601010000-BBBB"])
+        self.assertEqual(index.dependency_state(["202601010000-CCCC"])["202601010000-CCCC"]["depends_on"], [])
+
+    def test_duplicate_ids_are_rejected_until_fixed(self):
+        duplicate = self.root / "copy" / "README.md"
+        duplicate.parent.mkdir()
+        original = self.backend.task_readme_path("202601010000-AAAA")
+        duplicate.write_text(original.read_text(encoding="utf-8"), encoding="utf-8")
+        with self.assertRaises(ValueError):
+            self.backend.list_tasks()
+        with self.assertRaises(ValueError):
+            self.backend.list_tasks()
+        duplicate.unlink()
+        self.assertEqual(len(self.backend.list_tasks()), 3)
+
+    def test_search_ranks_prefix_matches_and_follows_writes(self):
+        self.backend.write_task(
+            {
+                "id": "202601010000-DDDD",
+                "title": "Tidy docs",
+                "status": "TODO",
+                "comments": [{"author": "CODER", "body": "Blocked on the exporter refactor"}],
+            }
+        )
+        self.backend.write_task(
+            {"id": "202601010000-EEEE", "title": "Exporter refactor", "status": "DOING", "tags": ["code"]}
+        )
+        index = self.backend.task_index()
+        self.assertEqual(self.ids(index.search_tasks("export refac")), ["202601010000-EEEE", "202601010000-DDDD"])
+        self.assertEqual(self.ids(index.search_tasks("export", statuses=["TODO"])), ["202601010000-DDDD"])
+        self.assertEqual(self.ids(index.search_tasks("export", limit=1)), ["202601010000-EEEE"])
+        self.assertEqual(index.search_tasks("?!"), [])
+
+        task = self.backend.get_task("202601010000-AAAA")
+        task["doc"] = "## Summary\n\nShip the exporter cache."
+        self.backend.write_task(task)
+        index = self.backend.task_index()
+        self.assertIn("202601010000-AAAA", self.ids(index.search_tasks("exporter cache")))
+        self.assertNotIn("202601010000-AAAA", self.ids(index.search_tasks("ship", tags=["docs"])))
+
+    def test_normalize_rewrites_only_readmes_that_change(self):
+        messy = self.backend.task_readme_path("202601010000-BBBB")
+        messy.write_text(messy.read_text(encoding="utf-8").replace('title: "Next"', "title:   Next"), encoding="utf-8")
+        readmes = sorted(self.root.glob("*/README.md"))
+        for readme in readmes:
+            os.utime(readme, ns=(1, 1))
+        parses = []
+        read_task = self.backend._read_task
+        self.backend._read_task = lambda readme: parses.append(readme.parent.name) or read_task(readme)
+
+        self.assertEqual(self.backend.normalize_tasks(), 3)
+        touched = [readme.parent.name for readme in readmes if readme.stat().st_mtime_ns != 1]
+        self.assertEqual(touched, ["202601010000-BBBB"])
+        self.assertIn('title: "Next"', messy.read_text(encoding="utf-8"))
+
+        parses.clear()
+        self.assertEqual(self.backend.get_task("202601010000-AAAA")["title"], "Base")
+        self.assertEqual(self.backend.get_task_doc("202601010000-AAAA"), "")
+        self.assertEqual(parses, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.ingest import export_reader, ga4_export_ingest, metrics_history
+
+
+class MetricsHistoryTests(unittest.TestCase):
+    def test_ingest_summary_normalizes_days(self):
+        rows = [
+            {"date": "20260101", "page_path": "/a", "users": 10.0, "sessions": 12.0, "conversions": 1.0},
+            {"date": "2026-01-20", "page_path": "/b", "users": 5.0, "sessions": 6.0, "conversions": 0.0},
+            {"date": "02/03/2026", "page_path": "/a", "users": 7.0, "sessions": 9.0, "conversions": 2.0},
+            {"date": "2026-02-03", "page_path": "/b", "users": 1.0, "sessions": 1.0, "conversions": 0.0},
+            {"date": "", "page_path": "/c", "users": 1.0, "sessions": 1.0, "conversions": 0.0},
+        ]
+        summary = ga4_export_ingest.new_summary(top=False, dates=True).add(export_reader.ColumnBatch.from_rows(rows))
+        daily = summary.group_totals("dates")
+        days = metrics_history.daily_totals(daily)
+        self.assertEqual(list(days), ["2026-01-01", "2026-01-20", "2026-02-03"])
+        self.assertEqual(days["2026-02-03"]["sessions"], 10.0)
+
+    def test_upsert_and_period_queries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "reports" / metrics_history.HISTORY_FILENAME
+            metrics_history.record_summary(
+                path, "gsc", {"2025-03-02": {"clicks": 40.0}, "2026-01-02": {"clicks": 10.0}, "2026-02-02": {"clicks": 20.0}}
+            )
+            # A later export adds a February day and April; February keeps its earlier day.
+            written = metrics_history.record_summary(
+                path, "gsc", {"2026-02-10": {"clicks": 10.0}, "2026-04-01": {"clicks": 50.0}}, input_name="gsc.csv", rows=2
+            )
+            self.assertEqual(written, ["2026-02", "2026-04"])
+            with metrics_history.MetricsHistory(path) as history:
+                self.assertEqual(history.series("gsc", "clicks", start="2026-01"), [("2026-01", 10.0), ("2026-02", 30.0), ("2026-04", 50.0)])
+                mom = history.compare("gsc", "clicks", "2026-02")
+                self.assertEqual((mom["previous"], mom["change"], mom["change_pct"]), (10.0, 20.0, 2.0))
+                self.assertIsNone(history.compare("gsc", "clicks", "2026-04")["change"])
+                yoy = history.compare("gsc", "clicks", "2026-03", offset=12)
+                self.assertEqual((yoy["previous_period"], yoy["value"]), ("2025-03", None))
+                rolling = history.rolling("gsc", "clicks", window=3, start="2026-02")
+                self.assertEqual(
+                    [(item["period"], item["rolling_sum"], item["months"]) for item in rolling],
+                    [("2026-02", 40.0, 2), ("2026-04", 80.0, 2)],
+                )
+                runs = history.conn.execute("SELECT input, periods, rows FROM ingest_runs ORDER BY id").fetchall()
+            self.assertEqual(runs[-1], ("gsc.csv", "2026-02,2026-04", 2))
+
+    def test_overlapping_exports_keep_full_months(self):
+        january = {f"2026-01-{day:02d}": {"clicks": 1.0} for day in range(1, 32)}
+        overlap = {"2026-01-30": {"clicks": 1.0}, "2026-01-31": {"clicks": 1.0}, "2026-02-01": {"clicks": 1.0}}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / metrics_history.HISTORY_FILENAME
+            metrics_history.record_summary(path, "gsc", january)
+            metrics_history.record_summary(path, "gsc", overlap)
+            metrics_history.record_summary(path, "gsc", overlap)
+            self.assertEqual(metrics_history.record_summary(path, "gsc", {"": {"clicks": 9.0}}), [])
+            with metrics_history.MetricsHistory(path) as history:
+                self.assertEqual(history.series("gsc", "clicks"), [("2026-01", 31.0), ("2026-02", 1.0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
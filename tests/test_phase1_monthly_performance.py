@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.workflow.automation.base import ProgramInputs
+from scripts.workflow.automation import column_table, phase1_monthly_performance as phase1
+
+
+class DateIndexTests(unittest.TestCase):
+    def rows(self):
+        return [
+            {"date": "02/03/2026", "page_path": "/b", "sessions": "5"},
+            {"date": "2026-01-15", "page_path": "/a", "sessions": "7"},
+            {"date": "", "page_path": "/undated", "sessions": "1"},
+            {"date": "not a date", "page_path": "/bad", "sessions": "100"},
+            {"date": "2026-01-31", "page_path": "/c", "sessions": "7"},
+            {"date": "2026-01-15", "page_path": "/d", "sessions": "2"},
+        ]
+
+    def test_filtered_rows_keep_original_order(self):
+        report = phase1.GA4Report(self.rows())
+        report.set_date_range("2026-01-01", "2026-01-31")
+        self.assertEqual([row["page_path"] for row in report.filtered_rows()], ["/a", "/undated", "/c", "/d"])
+        self.assertEqual(report.get_sessions(), 17)
+        self.assertEqual([item["page"] for item in report.get_top_pages(2)], ["/a", "/c"])
+
+        report.set_date_range("2026-02-01", "2026-02-28")
+        self.assertEqual(report.get_sessions(), 6)
+        report.set_date_range(None, None)
+        self.assertEqual(report.get_sessions(), 122)
+
+    def test_dates_parsed_once_and_numbers_converted_once(self):
+        report = phase1.GBPReport([{"date": "2026-01-02", "calls": "3", "directions": "1", "website_clicks": "2"}] * 50)
+        report.set_date_range("2026-01-01", "2026-01-31")
+        with mock.patch.object(phase1, "parse_date", side_effect=phase1.parse_date) as parse, mock.patch.object(
+            column_table, "_convert", side_effect=column_table._convert
+        ) as converted:
+            self.assertEqual(report.get_total_actions(), 300)
+            self.assertEqual(report.get_calls(), 150)
+            report.set_date_range("2026-02-01", "2026-02-28")
+            self.assertEqual(report.get_calls(), 0)
+            self.assertEqual(parse.call_count, 3)
+            self.assertEqual(converted.call_count, 3)
+
+        report.rows = report.rows[:10]
+        report.set_date_range(None, None)
+        self.assertEqual(report.get_calls(), 30)
+
+    def test_program_inputs_share_loaded_tables(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "rank.csv"
+            path.write_text("Date,Keyword,Position,Change\n2026-01-05,plumber,3,-2\n2026-02-05,drain,bad,4\n", encoding="utf-8")
+            tables: dict = {}
+            first = ProgramInputs({"rank_csv": str(path)}, tables)
+            second = ProgramInputs({"rank_csv": str(path)}, tables)
+            table = first.load_table("rank_csv")
+            self.assertIs(second.load_table("rank_csv"), table)
+            report = phase1.RankTrackerReport.from_table(table)
+            self.assertIs(report.table, table)
+            report.set_date_range("2026-01-01", "2026-01-31")
+            self.assertEqual([row["keyword"] for row in report.get_winners()], ["plumber"])
+            self.assertEqual(report.get_avg_position(), 3.0)
+        report.set_date_range(None, None)
+        with self.assertRaises(SystemExit):
+            report.get_avg_position()
+
+
+if __name__ == "__main__":
+    unittest.main()
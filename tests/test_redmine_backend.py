@@ -0,0 +1,296 @@
+import importlib.util
+import http.client
+import json
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_backend_module():
+    path = ROOT / ".codex-swarm" / "backends" / "redmine" / "backend.py"
+    spec = importlib.util.spec_from_file_location("redmine_backend_under_test", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+redmine = load_backend_module()
+
+
+def make_issue(issue_id, task_id, subject, updated_on):
+    return {
+        "id": issue_id,
+        "subject": subject,
+        "status": {"id": 1},
+        "updated_on": updated_on,
+        "custom_fields": [{"id": 1, "value": task_id}],
+    }
+
+
+class RecordingBackend(redmine.RedmineBackend):
+    """Serves issues.json from memory, honouring offset/limit and updated_on>=."""
+
+    def __init__(self, settings, issues):
+        super().__init__(settings)
+        self.issues = issues
+        self.calls = []
+
+    def _request_json(self, method, path, payload=None, params=None, **_kwargs):
+        self.calls.append((method, path, dict(params or {})))
+        params = params or {}
+        matches = list(self.issues.values())
+        since = str(params.get("updated_on") or "")
+        if since:
+            matches = [issue for issue in matches if issue["updated_on"] >= since.removeprefix(">=")]
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 100))
+        return {"issues": matches[offset : offset + limit], "total_count": len(matches)}
+
+
+class RedmineDeltaSyncTests(unittest.TestCase):
+    def settings(self, cache_dir):
+        return {
+            "url": "http://redmine.test",
+            "api_key": "key",
+            "project_id": "proj",
+            "status_map": {"TODO": 1},
+            "custom_fields": {"task_id": 1},
+            "cache_dir": str(cache_dir),
+        }
+
+    def test_list_fetches_only_changes_after_first_sync(self):
+        issues = {
+            idx: make_issue(idx, f"202601010000-A{idx:03d}", f"Task {idx}", f"2026-01-01T00:{idx % 60:02d}:00Z")
+            for idx in range(1, 251)
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = RecordingBackend(self.settings(tmpdir), issues)
+            first = backend.list_tasks()
+            self.assertEqual(len(first), 250)
+            self.assertEqual(len(backend.calls), 3)
+
+            backend.calls.clear()
+            issues[7] = make_issue(7, "202601010000-A007", "Renamed", "2026-02-01T00:00:00Z")
+            issues[251] = make_issue(251, "202601010000-A251", "New", "2026-02-01T00:00:00Z")
+            reopened = RecordingBackend(self.settings(tmpdir), issues)
+            second = reopened.list_tasks()
+            self.assertEqual(len(reopened.calls), 1)
+            self.assertEqual(reopened.calls[0][2]["updated_on"], ">=2026-01-01T00:59:00Z")
+            titles = {task["id"]: task["title"] for task in second}
+            self.assertEqual(len(second), 251)
+            self.assertEqual(titles["202601010000-A007"], "Renamed")
+            self.assertEqual(reopened.cache.get_task("202601010000-A251")["title"], "New")
+
+            del issues[3]
+            reopened.calls.clear()
+            self.assertEqual(len(reopened.list_tasks()), 251)
+            reopened.sync("pull", quiet=True, full=True)
+            self.assertNotIn("updated_on", reopened.calls[-1][2])
+            self.assertEqual(len(reopened._list_tasks_remote()), 250)
+
+    def test_conflicting_pull_keeps_changes_for_the_next_run(self):
+        issues = {idx: make_issue(idx, f"202601010000-C{idx:03d}", f"Task {idx}", "2026-01-01T00:00:00Z") for idx in (1, 2)}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = RecordingBackend(self.settings(tmpdir), issues)
+            backend.list_tasks()
+            local = backend.cache.get_task("202601010000-C001")
+            local.update(title="local edit", dirty=True)
+            backend.cache.write_task(local)
+            issues[1] = make_issue(1, "202601010000-C001", "remote edit", "2026-02-01T00:00:00Z")
+            issues[2] = make_issue(2, "202601010000-C002", "later edit", "2026-03-01T00:00:00Z")
+
+            with self.assertRaises(RuntimeError):
+                backend.sync("pull", conflict="fail", quiet=True)
+            self.assertEqual(backend.cache.get_task("202601010000-C001")["title"], "local edit")
+
+            backend.sync("pull", conflict="prefer-remote", quiet=True)
+            task = backend.cache.get_task("202601010000-C001")
+            self.assertEqual(task["title"], "remote edit")
+            self.assertFalse(task.get("dirty"))
+
+
+class StandInRedmine(ThreadingHTTPServer):
+    """Minimal issues API that answers 429 once a client exceeds rate_limit requests per second."""
+
+    daemon_threads = True
+
+    def __init__(self, rate_limit=250):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.lock = threading.Lock()
+        self.issues = {}
+        self.requests = 0
+        self.connections = 0
+        self.throttled = 0
+        self.window = 0.1
+        self.window_limit = int(rate_limit * self.window)
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.clock = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+    def over_limit(self):
+        now = time.monotonic()
+        if now - self.window_start >= self.window:
+            self.window_start, self.window_count = now, 0
+        self.window_count += 1
+        return self.window_count > self.window_limit
+
+    def stamp(self):
+        self.clock += timedelta(seconds=1)
+        return self.clock.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this each response waits on a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, *_args):
+        pass
+
+    def send(self, status, payload=None, headers=()):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length)) if length else {}
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            if server.over_limit():
+                server.throttled += 1
+                self.send(429, {"errors": ["slow down"]}, [("Retry-After", "0.1")])
+                return
+            parts = urlsplit(self.path)
+            query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+            if method == "GET" and parts.path == "/issues.json":
+                issues = [
+                    issue
+                    for issue in server.issues.values()
+                    if "cf_1" not in query or issue["custom_fields"][0]["value"] == query["cf_1"]
+                ]
+                offset, limit = int(query.get("offset", 0)), int(query.get("limit", 25))
+                self.send(200, {"issues": issues[offset : offset + limit], "total_count": len(issues)})
+            elif method == "POST" and parts.path == "/issues.json":
+                issue_id = len(server.issues) + 1
+                fields = body["issue"]
+                issue = {"id": issue_id, "status": {"id": 1}, "updated_on": server.stamp(), "custom_fields": []}
+                issue["subject"] = fields["subject"]
+                issue["custom_fields"] = fields.get("custom_fields", [])
+                server.issues[issue_id] = issue
+                self.send(201, {"issue": issue})
+            else:
+                issue = server.issues.get(int(parts.path.split("/")[-1].split(".")[0]))
+                if issue is None:
+                    self.send(404, {"errors": ["not found"]})
+                elif method == "GET":
+                    self.send(200, {"issue": issue})
+                else:
+                    issue["subject"] = body["issue"].get("subject", issue["subject"])
+                    issue["updated_on"] = server.stamp()
+                    self.send(204)
+
+    def do_GET(self):
+        self.handle_request("GET")
+
+    def do_POST(self):
+        self.handle_request("POST")
+
+    def do_PUT(self):
+        self.handle_request("PUT")
+
+
+class RedmineHttpClientTests(unittest.TestCase):
+    def setUp(self):
+        self.server = StandInRedmine()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_push_reuses_connections_and_backs_off_on_429(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            settings = {
+                "url": f"http://127.0.0.1:{self.server.server_address[1]}",
+                "api_key": "key",
+                "project_id": "proj",
+                "status_map": {"TODO": 1},
+                "custom_fields": {"task_id": 1},
+                "cache_dir": tmpdir,
+                "concurrency": 4,
+            }
+            backend = redmine.RedmineBackend(settings)
+            task_ids = [f"202603010000-B{idx:03d}" for idx in range(200)]
+            for task_id in task_ids:
+                backend.cache.write_task({"id": task_id, "title": f"Task {task_id}", "status": "TODO", "dirty": True})
+            started = time.perf_counter()
+            backend.sync("push", confirm=True, quiet=True)
+            elapsed = time.perf_counter() - started
+            pushed = {issue["custom_fields"][0]["value"] for issue in self.server.issues.values()}
+            self.assertEqual(pushed, set(task_ids))
+            self.assertFalse(any(task.get("dirty") for task in backend.cache.list_tasks()))
+        self.assertGreater(self.server.throttled, 0)
+        self.assertLessEqual(self.server.connections, 8)
+        self.assertLess(self.server.requests - self.server.throttled, 3 * 200 + 5)
+        self.assertLess(elapsed, 15)
+
+    def test_stale_connection_resends_only_idempotent_requests(self):
+        class DroppedConnection:
+            def __init__(self, fail_on):
+                self.fail_on = fail_on
+                self.sent = []
+
+            def request(self, method, *_args, **_kwargs):
+                if self.fail_on == "request":
+                    raise BrokenPipeError()
+                self.sent.append(method)
+
+            def getresponse(self):
+                raise http.client.RemoteDisconnected("closed")
+
+            def close(self):
+                pass
+
+        client = redmine.RedmineHttpClient(f"http://127.0.0.1:{self.server.server_address[1]}")
+        client._idle.put(DroppedConnection("response"))
+        with self.assertRaises(http.client.RemoteDisconnected):
+            client.request("POST", "issues.json", b'{"issue": {"subject": "x"}}', {"Content-Type": "application/json"})
+        self.assertEqual(self.server.requests, 0)
+
+        client._idle.put(DroppedConnection("request"))
+        status, _, _ = client.request(
+            "POST", "issues.json", b'{"issue": {"subject": "x"}}', {"Content-Type": "application/json"}
+        )
+        client._idle.put(DroppedConnection("response"))
+        status_get, _, _ = client.request("GET", "issues/1.json", None, {})
+        client.close()
+        self.assertEqual((status, status_get), (201, 200))
+        self.assertEqual(len(self.server.issues), 1)
+
+    def test_retry_after_accepts_seconds_and_dates(self):
+        self.assertEqual(redmine._parse_retry_after("2"), 2.0)
+        self.assertEqual(redmine._parse_retry_after("999"), 60.0)
+        self.assertEqual(redmine._parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+        self.assertIsNone(redmine._parse_retry_after("soon"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.ingest import site_link_graph
+from scripts.validation import internal_link_validator
+
+
+PAGES = {
+    "https://example.com/": """
+        <a href="/services/">Services</a>
+        <a href="https://www.example.com/contact#form">Contact</a>
+        <a href="mailto:hi@example.com">Email</a>
+        <a href="https://other.com/">External</a>
+    """,
+    "https://example.com/services": """
+        <a href="/">Home</a>
+        <a href="/services/drain">Drain</a>
+        <a href="/old-page">Old</a>
+        <a href="/services/drain/">Drain again</a>
+    """,
+    "https://example.com/contact": '<a href="/">Home</a>',
+    "https://example.com/landing": "<p>No inbound links</p>",
+}
+
+
+def write_cache(base: Path) -> dict[str, Path]:
+    cache: dict[str, Path] = {}
+    for idx, (url, html) in enumerate(PAGES.items()):
+        path = base / f"page{idx}.html"
+        path.write_text(html, encoding="utf-8")
+        cache[url] = path
+    return cache
+
+
+class SiteLinkGraphTests(unittest.TestCase):
+    def test_build_link_graph_resolves_against_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            graph = site_link_graph.build_link_graph(write_cache(Path(tmpdir)))
+
+        home = graph.index["https://example.com/"]
+        targets = {graph.nodes[idx] for idx in graph.edges[home]}
+        self.assertEqual(targets, {"https://example.com/services", "https://example.com/contact"})
+
+        services = graph.index["https://example.com/services"]
+        self.assertEqual(len(graph.edges[services]), 3)
+        uncached = {url for idx, url in enumerate(graph.nodes) if not graph.cached[idx]}
+        self.assertEqual(uncached, {"https://example.com/services/drain", "https://example.com/old-page"})
+        self.assertEqual(site_link_graph.find_orphans(graph), ["https://example.com/landing"])
+
+    def test_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            graph = site_link_graph.build_link_graph(write_cache(Path(tmpdir)))
+        restored = site_link_graph.LinkGraph.from_dict(graph.to_dict())
+        self.assertEqual(restored.nodes, graph.nodes)
+        self.assertEqual(restored.edges, graph.edges)
+        self.assertEqual(restored.cached, graph.cached)
+
+    def test_pagerank_and_click_depth(self):
+        graph = site_link_graph.LinkGraph()
+        for url in ["https://example.com/", "https://example.com/a", "https://example.com/b", "https://example.com/c"]:
+            graph.node_id(url, cached=True)
+        graph.edges = [[1, 2], [0], [0, 3], []]
+
+        ranks = site_link_graph.pagerank(graph)
+        self.assertAlmostEqual(sum(ranks), 1.0, places=6)
+        self.assertEqual(max(range(4), key=lambda idx: ranks[idx]), 0)
+        self.assertEqual(site_link_graph.click_depths(graph, 0), [0, 1, 1, 2])
+
+        pages = site_link_graph.link_equity(graph)
+        self.assertEqual(pages[0]["url"], "https://example.com/")
+        self.assertEqual(pages[0]["rank"], 1)
+        by_url = {page["url"]: page for page in pages}
+        self.assertTrue(by_url["https://example.com/c"]["needs_links"])
+        self.assertFalse(by_url["https://example.com/"]["needs_links"])
+
+    def test_only_bottom_quartile_equity_needs_links(self):
+        graph = site_link_graph.LinkGraph()
+        urls = ["https://example.com/", *(f"https://example.com/s{idx}" for idx in range(1, 7)), "https://example.com/p"]
+        for url in urls:
+            graph.node_id(url, cached=True)
+        # A hub linking to six service pages; only s1 links on to p.
+        graph.edges = [[1, 2, 3, 4, 5, 6], [0, 7], [0], [0], [0], [0], [0], [0]]
+
+        pages = site_link_graph.link_equity(graph)
+        self.assertTrue(all(page["score"] < 1.0 for page in pages[1:]))
+        self.assertEqual([page["url"] for page in pages if page["needs_links"]], ["https://example.com/p"])
+        self.assertEqual(pages[-1]["percentile"], 0.125)
+
+    def test_validate_site_cache_reports_broken_and_redirects(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            graph = site_link_graph.build_link_graph(write_cache(Path(tmpdir)))
+
+        checked: list[str] = []
+
+        def checker(url):
+            checked.append(url)
+            if url.endswith("/old-page"):
+                return {"url": url, "status": 404, "redirects": [], "final_url": url, "error": ""}
+            return {
+                "url": url,
+                "status": 200,
+                "redirects": [url],
+                "final_url": url + "/",
+                "error": "",
+            }
+
+        report = internal_link_validator.validate_site_cache(graph, checker, workers=2)
+        self.assertEqual(sorted(checked), ["https://example.com/old-page", "https://example.com/services/drain"])
+        self.assertEqual(report["summary"]["broken"], 1)
+        self.assertEqual(report["broken"][0]["linked_from"], ["https://example.com/services"])
+        self.assertEqual(report["redirects"][0]["chain"], ["https://example.com/services/drain/"])
+        self.assertEqual(report["orphans"], ["https://example.com/landing"])
+        self.assertIn("https://example.com/landing", [page["url"] for page in report["needs_links"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
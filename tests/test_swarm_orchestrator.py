@@ -0,0 +1,130 @@
+import json
+import tempfile
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from unittest import mock
+
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from scripts.workflow import swarm_orchestrator
+from scripts.workflow.automation.config_loader import OrchestratorConfig
+from scripts.workflow.automation.phase3_compliance_risk import ComplianceRiskProgram
+
+
+class SwarmOrchestratorTests(unittest.TestCase):
+    def write_inputs(self, base):
+        (base / "ga4.csv").write_text("Date,Page path,Sessions,Users\n2026-01-02,/home,10,8\n", encoding="utf-8")
+        (base / "gbp.csv").write_text("Date,Calls\n2026-01-02,3\n", encoding="utf-8")
+        (base / "rank.csv").write_text("Keyword,Position,Change\nplumber,3,-1\n", encoding="utf-8")
+        (base / "policy.md").write_text("- guaranteed\n", encoding="utf-8")
+        (base / "content.md").write_text("Guaranteed results every time.\n", encoding="utf-8")
+
+    def config(self, base):
+        return OrchestratorConfig.from_dict(
+            {
+                "client_name": "Client",
+                "client_slug": "client",
+                "output_dir": str(base / "out"),
+                "phases": {
+                    "1": {"ga4_csv": base / "ga4.csv", "gbp_csv": base / "gbp.csv", "rank_csv": base / "rank.csv"},
+                    "3": {"policy_md": base / "policy.md", "content_md": base / "content.md"},
+                    "6": {"gbp_csv": base / "gbp.csv", "brand_voice": "friendly"},
+                    "9": {"gbp_csv": base / "gbp.csv"},
+                },
+            }
+        )
+
+    def test_phases_sharing_inputs_are_grouped(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            self.write_inputs(base)
+            groups = swarm_orchestrator.group_phases(["1", "3", "6"], self.config(base))
+        self.assertEqual(sorted(groups), [["1", "6"], ["3"]])
+
+    def test_parallel_run_matches_serial_and_records_failures(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            self.write_inputs(base)
+            cfg = self.config(base)
+            serial = swarm_orchestrator.run_phases(["1", "3", "9"], cfg, jobs=1)
+            report = (base / "out" / "client" / "reports" / "monthly-performance-report.json").read_text(encoding="utf-8")
+            parallel = swarm_orchestrator.run_phases(["1", "3", "9"], cfg, jobs=2)
+            self.assertEqual(
+                (base / "out" / "client" / "reports" / "monthly-performance-report.json").read_text(encoding="utf-8"),
+                report,
+            )
+            summary = swarm_orchestrator.write_summary(cfg, parallel, 2, 0.5)
+            payload = json.loads(summary.read_text(encoding="utf-8"))
+        for results in (serial, parallel):
+            self.assertEqual([(result.phase, result.status) for result in results], [("1", "ok"), ("3", "ok"), ("9", "failed")])
+            self.assertEqual(results[2].detail, "SystemExit: Unknown phase: 9")
+        self.assertEqual(payload["phases"][0]["outputs"][1], str(base / "out" / "client" / "reports" / "monthly-performance-report.json"))
+
+    def test_cache_recomputes_only_changed_phases(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            self.write_inputs(base)
+            cfg = self.config(base)
+            report = base / "out" / "client" / "reports" / "compliance-risk-report.md"
+            first = swarm_orchestrator.run_phases(["1", "3"], cfg, jobs=1, use_cache=True)
+            mtime = report.stat().st_mtime_ns
+            second = swarm_orchestrator.run_phases(["1", "3"], cfg, jobs=1, use_cache=True)
+            self.assertEqual(report.stat().st_mtime_ns, mtime)
+            (base / "policy.md").write_text("- every time\n", encoding="utf-8")
+            third = swarm_orchestrator.run_phases(["1", "3"], cfg, jobs=1, use_cache=True)
+            with mock.patch.object(ComplianceRiskProgram, "version", "2"):
+                fourth = swarm_orchestrator.run_phases(["1", "3"], cfg, jobs=1, use_cache=True)
+        details = [[result.detail for result in run] for run in (first, second, third, fourth)]
+        self.assertEqual(details, [["", ""], ["cached", "cached"], ["cached", ""], ["cached", ""]])
+
+    def test_cache_recomputes_after_client_rename(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            self.write_inputs(base)
+            cfg = self.config(base)
+            report = base / "out" / "client" / "reports" / "compliance-risk-report.md"
+            swarm_orchestrator.run_phases(["3"], cfg, jobs=1, use_cache=True)
+            cfg.client_name = "Renamed Client"
+            renamed = swarm_orchestrator.run_phases(["3"], cfg, jobs=1, use_cache=True)
+            text = report.read_text(encoding="utf-8")
+        self.assertEqual(renamed[0].detail, "")
+        self.assertIn("# Compliance Risk Report - Renamed Client", text)
+
+    def test_broken_worker_marks_its_group_failed(self):
+        class BrokenPool:
+            def __init__(self, max_workers):
+                pass
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def submit(self, fn, keys, *args):
+                future = Future()
+                if keys == ["3"]:
+                    future.set_result(fn(keys, *args))
+                else:
+                    future.set_exception(BrokenProcessPool("worker died"))
+                return future
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            self.write_inputs(base)
+            cfg = self.config(base)
+            with mock.patch.object(swarm_orchestrator, "ProcessPoolExecutor", BrokenPool):
+                results = swarm_orchestrator.run_phases(["1", "3", "6"], cfg, jobs=2)
+            summary = swarm_orchestrator.write_summary(cfg, results, 2, 0.5)
+            payload = json.loads(summary.read_text(encoding="utf-8"))
+        self.assertEqual([(result.phase, result.status) for result in results], [("1", "failed"), ("3", "ok"), ("6", "failed")])
+        self.assertEqual(results[0].detail, "BrokenProcessPool: worker died")
+        self.assertEqual([phase["status"] for phase in payload["phases"]], ["failed", "ok", "failed"])
+
+
+if __name__ == "__main__":
+    unittest.main()